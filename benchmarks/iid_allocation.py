@@ -0,0 +1,206 @@
+"""Measure the time and memory of iid allocation for many characteristics.
+
+Run from the root of the repository with Home Assistant installed:
+
+    python -m benchmarks.iid_allocation --accessories 1500
+
+Every accessory gets the accessory information service and one of a few
+common services, which adds up to more than 10,000 characteristics with
+the default size. The iids are allocated once on an empty storage, then
+looked up again as on a reload. Both passes run on AccessoryIIDStorage
+and on a replica of the storage it replaced, which keyed the allocations
+by the aid as a string and kept a sorted list of every allocated iid.
+
+Memory is measured in a separate pass on a new storage with tracemalloc
+running, so it does not distort the timings. It is the memory the
+allocation pass still holds at its end and the peak of the traced memory
+during it.
+"""
+
+import argparse
+import asyncio
+import tempfile
+import time
+import tracemalloc
+from uuid import UUID
+
+from homeassistant.core import HomeAssistant
+from pyhap.loader import get_loader
+from pyhap.util import uuid_to_hap_type
+
+from custom_components.homekit import iidmanager
+from custom_components.homekit.iidmanager import (
+    ACCESSORY_INFORMATION_SERVICE,
+    AccessoryIIDStorage,
+)
+from custom_components.homekit.persist import HomePersistScheduler
+
+SERVICES = (
+    "Lightbulb",
+    "Switch",
+    "TemperatureSensor",
+    "Thermostat",
+    "WindowCovering",
+    "LockMechanism",
+    "Fan",
+    "MotionSensor",
+)
+
+HEADER = (
+    "storage",
+    "characteristics",
+    "allocate us/iid",
+    "lookup us/iid",
+    "retained KiB",
+    "peak KiB",
+)
+
+type Allocation = tuple[int, UUID, UUID | None]
+
+
+class StringKeyedIIDStorage(AccessoryIIDStorage):
+    """Allocate iids the way AccessoryIIDStorage did before its rework."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry_id: str,
+        persist_scheduler: HomePersistScheduler,
+    ) -> None:
+        """Create a new string keyed iid store."""
+        super().__init__(hass, entry_id, persist_scheduler)
+        self.string_allocations: dict[str, dict[str, int]] = {}
+        self.allocated_iids: dict[str, list[int]] = {}
+
+    def get_or_allocate_iid(
+        self,
+        aid: int,
+        service_uuid: UUID,
+        service_unique_id: str | None,
+        char_uuid: UUID | None,
+        char_unique_id: str | None,
+    ) -> int:
+        """Generate a stable iid."""
+        service_hap_type: str = uuid_to_hap_type(service_uuid)
+        char_hap_type: str | None = uuid_to_hap_type(char_uuid) if char_uuid else None
+        allocation_key = (
+            f"{service_hap_type}_{service_unique_id or ''}_"
+            f"{char_hap_type or ''}_{char_unique_id or ''}"
+        )
+        aid_str = str(aid)
+        accessory_allocation = self.string_allocations.setdefault(aid_str, {})
+        accessory_allocated_iids = self.allocated_iids.setdefault(aid_str, [1])
+        if service_hap_type == ACCESSORY_INFORMATION_SERVICE and char_uuid is None:
+            return 1
+        if allocation_key in accessory_allocation:
+            return accessory_allocation[allocation_key]
+        if accessory_allocated_iids:
+            allocated_iid = accessory_allocated_iids[-1] + 1
+        else:
+            allocated_iid = 2
+        accessory_allocation[allocation_key] = allocated_iid
+        accessory_allocated_iids.append(allocated_iid)
+        self._async_schedule_save()
+        return allocated_iid
+
+    def _data_to_save(self) -> dict[str, dict[str, dict[str, int]]]:
+        """Return data of entity map to store in a file."""
+        return {iidmanager.ALLOCATIONS_KEY: self.string_allocations}
+
+
+def _allocations(accessories: int) -> list[Allocation]:
+    """Return the aid, service and characteristic uuids to allocate."""
+    loader = get_loader()
+    services = [
+        loader.get_service(name) for name in ("AccessoryInformation", *SERVICES)
+    ]
+    allocations: list[Allocation] = []
+    for index in range(accessories):
+        aid = index + 2
+        for service in (services[0], services[1 + index % len(SERVICES)]):
+            allocations.append((aid, service.type_id, None))
+            allocations.extend(
+                (aid, service.type_id, char.type_id) for char in service.characteristics
+            )
+    return allocations
+
+
+def _allocate(storage: AccessoryIIDStorage, allocations: list[Allocation]) -> float:
+    """Allocate or look up every iid and return the elapsed time."""
+    get_or_allocate_iid = storage.get_or_allocate_iid
+    start = time.perf_counter()
+    for aid, service_uuid, char_uuid in allocations:
+        get_or_allocate_iid(aid, service_uuid, None, char_uuid, None)
+    return time.perf_counter() - start
+
+
+async def _async_new_storage(
+    hass: HomeAssistant,
+    storage_class: type[AccessoryIIDStorage],
+    entry_id: str,
+    persist_scheduler: HomePersistScheduler,
+) -> AccessoryIIDStorage:
+    """Return an initialized empty storage with cold key caches."""
+    iidmanager._hap_type.cache_clear()
+    iidmanager._allocation_key.cache_clear()
+    storage = storage_class(hass, entry_id, persist_scheduler)
+    await storage.async_initialize()
+    return storage
+
+
+async def async_main(accessories: int) -> None:
+    """Run both storages and print the report."""
+    allocations = _allocations(accessories)
+    characteristics = sum(1 for *_, char_uuid in allocations if char_uuid)
+    rows = [HEADER]
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        persist_scheduler = HomePersistScheduler(hass)
+        for name, storage_class in (
+            ("string keyed", StringKeyedIIDStorage),
+            ("AccessoryIIDStorage", AccessoryIIDStorage),
+        ):
+            storage = await _async_new_storage(
+                hass, storage_class, f"{name}_timing", persist_scheduler
+            )
+            allocate_seconds = _allocate(storage, allocations)
+            lookup_seconds = _allocate(storage, allocations)
+
+            storage = await _async_new_storage(
+                hass, storage_class, f"{name}_memory", persist_scheduler
+            )
+            tracemalloc.start()
+            before = tracemalloc.get_traced_memory()[0]
+            _allocate(storage, allocations)
+            retained, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            rows.append(
+                (
+                    name,
+                    str(characteristics),
+                    f"{allocate_seconds / len(allocations) * 1e6:.2f}",
+                    f"{lookup_seconds / len(allocations) * 1e6:.2f}",
+                    f"{(retained - before) / 1024:,.0f}",
+                    f"{(peak - before) / 1024:,.0f}",
+                )
+            )
+        await persist_scheduler.async_shutdown()
+        await hass.async_stop(force=True)
+    widths = [max(len(row[column]) for row in rows) for column in range(len(HEADER))]
+    for row in rows:
+        print("  ".join(value.rjust(width) for value, width in zip(row, widths)))
+
+
+def main() -> None:
+    """Parse the arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--accessories", type=int, default=1500, help="accessories to allocate"
+    )
+    args = parser.parse_args()
+    asyncio.run(async_main(args.accessories))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""Measure the accessories hash and a single entity reload on a full bridge.
+
+Run from the root of the repository with Home Assistant installed:
+
+    python -m benchmarks.reload --accessories 149 --rounds 20
+
+A bridge is started the way benchmarks.startup does, then the report
+covers the accessories hash as pyhap computes it, by serializing the
+whole bridge, and as HomeDriver computes it with a cold and a warm
+cache of the digest of each accessory. The last row is the reload of a
+single entity, which recreates its accessory and hashes the bridge with
+only that digest missing.
+"""
+
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+from collections.abc import Callable, Coroutine
+from functools import partial
+from typing import Any
+
+from pyhap.accessory_driver import AccessoryDriver
+
+from custom_components.homekit import MAX_DEVICES
+from custom_components.homekit.accessories import HomeAccessory, HomeDriver
+
+from .startup import (
+    _async_add_states,
+    _async_setup_hass,
+    _async_start_bridge,
+    _async_stop_bridge,
+)
+
+HEADER = ("measure", "rounds", "mean ms", "p50 ms", "max ms")
+
+
+def _row(name: str, durations: list[float]) -> tuple[str, ...]:
+    """Return the figures of a measure formatted for the report."""
+    return (
+        name,
+        str(len(durations)),
+        f"{statistics.fmean(durations) * 1e3:.3f}",
+        f"{statistics.median(durations) * 1e3:.3f}",
+        f"{max(durations) * 1e3:.3f}",
+    )
+
+
+def _time_hash(
+    rounds: int, accessories_hash: Callable[[], str], prepare: Callable[[], Any]
+) -> list[float]:
+    """Time an accessories hash, preparing before each round."""
+    durations: list[float] = []
+    for _ in range(rounds):
+        prepare()
+        start = time.perf_counter()
+        accessories_hash()
+        durations.append(time.perf_counter() - start)
+    return durations
+
+
+async def _async_time(
+    rounds: int, action: Callable[[], Coroutine[Any, Any, None]]
+) -> list[float]:
+    """Time an async action."""
+    durations: list[float] = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        await action()
+        durations.append(time.perf_counter() - start)
+    return durations
+
+
+async def async_main(accessories: int, rounds: int) -> None:
+    """Start the bridge, run the measures and print the report."""
+    rows = [HEADER]
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = await _async_setup_hass(config_dir)
+        homekit = _async_add_states(hass, accessories)
+        await _async_start_bridge(homekit, accessories, lambda stage: None)
+        driver = homekit.driver
+        assert driver is not None
+
+        pyhap_hash = partial(AccessoryDriver.accessories_hash.fget, driver)
+        home_hash = partial(HomeDriver.accessories_hash.fget, driver)
+        rows.append(_row("pyhap hash", _time_hash(rounds, pyhap_hash, lambda: None)))
+        rows.append(
+            _row(
+                "cold digest cache",
+                _time_hash(rounds, home_hash, driver._accessory_digests.clear),
+            )
+        )
+        rows.append(
+            _row("warm digest cache", _time_hash(rounds, home_hash, lambda: None))
+        )
+
+        assert homekit.bridge is not None
+        bridged = list(homekit.bridge.accessories.values())
+        accessory = bridged[len(bridged) // 2]
+        assert isinstance(accessory, HomeAccessory)
+        entity_id = accessory.entity_id
+        rows.append(
+            _row(
+                "single entity reload",
+                await _async_time(
+                    rounds, lambda: homekit.async_reload_accessories([entity_id])
+                ),
+            )
+        )
+        assert len(homekit.bridge.accessories) == len(bridged)
+        await _async_stop_bridge(hass, homekit)
+
+    widths = [max(len(row[column]) for row in rows) for column in range(len(HEADER))]
+    for row in rows:
+        print("  ".join(value.rjust(width) for value, width in zip(row, widths)))
+
+
+def main() -> None:
+    """Parse the arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--accessories",
+        type=int,
+        default=MAX_DEVICES - 1,
+        help="accessories on the bridge, defaults to the largest bridge",
+    )
+    parser.add_argument(
+        "--rounds", type=int, default=20, help="times each measure runs"
+    )
+    args = parser.parse_args()
+    asyncio.run(async_main(args.accessories, args.rounds))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+"""Measure how fast accessory types are resolved from entity states.
+
+Run from the root of the repository with Home Assistant installed:
+
+    python -m benchmarks.resolution --states 5000 --rounds 20
+
+The states cycle through a mix of domains, device classes, units and
+supported features, like the entities of a large installation. They are
+resolved with get_accessory_type in three passes: without the cache of
+the type tables, which walks the tables for every state, then with the
+cache just cleared and then with the cache warm. The cache passes report
+the hits and misses of the cache.
+"""
+
+import argparse
+import time
+from typing import Any
+
+from homeassistant.core import State
+
+from custom_components.homekit import accessories
+from custom_components.homekit.accessories import get_accessory_type
+
+# The state and attributes of the entities, by object id prefix
+STATE_TEMPLATES: tuple[tuple[str, str, dict[str, Any]], ...] = (
+    ("light.lamp", "on", {"supported_color_modes": ["brightness"]}),
+    ("switch.plug", "on", {"device_class": "outlet"}),
+    ("switch.relay", "off", {}),
+    (
+        "sensor.temperature",
+        "21.3",
+        {"device_class": "temperature", "unit_of_measurement": "°C"},
+    ),
+    (
+        "sensor.humidity",
+        "45",
+        {"device_class": "humidity", "unit_of_measurement": "%"},
+    ),
+    ("sensor.outdoor_lux", "1200", {"unit_of_measurement": "lx"}),
+    ("sensor.office_co2", "600", {"unit_of_measurement": "ppm"}),
+    ("sensor.energy", "1.2", {"device_class": "energy", "unit_of_measurement": "kWh"}),
+    ("binary_sensor.motion", "off", {"device_class": "motion"}),
+    ("binary_sensor.door", "off", {"device_class": "door"}),
+    ("cover.blind", "open", {"supported_features": 15}),
+    ("cover.garage", "closed", {"device_class": "garage", "supported_features": 3}),
+    ("cover.window", "open", {"device_class": "window", "supported_features": 7}),
+    ("lock.front_door", "locked", {}),
+    ("fan.ceiling", "on", {"supported_features": 1}),
+    ("media_player.tv", "on", {"device_class": "tv", "supported_features": 21437}),
+    ("media_player.speaker", "playing", {"supported_features": 21437}),
+    ("remote.hub", "on", {"supported_features": 4, "activity_list": ["TV"]}),
+    ("alarm_control_panel.house", "disarmed", {"supported_features": 63}),
+    ("vacuum.robot", "docked", {"supported_features": 12}),
+)
+
+HEADER = ("pass", "resolved", "seconds", "us/state", "hits", "misses", "hit rate")
+
+
+def _states(count: int) -> list[State]:
+    """Return count states cycling through the templates."""
+    states = []
+    for index in range(count):
+        prefix, state, attributes = STATE_TEMPLATES[index % len(STATE_TEMPLATES)]
+        states.append(State(f"{prefix}_{index}", state, attributes))
+    return states
+
+
+def _resolve(states: list[State], rounds: int) -> float:
+    """Resolve every state for the rounds and return the elapsed time."""
+    config: dict[str, Any] = {}
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for state in states:
+            get_accessory_type(state, config)
+    return time.perf_counter() - start
+
+
+def _row(
+    name: str, resolved: int, seconds: float, cache: tuple[int, int] | None
+) -> tuple[str, ...]:
+    """Return the figures of a pass formatted for the report."""
+    if cache is None:
+        hits = misses = rate = ""
+    else:
+        hits, misses = (str(count) for count in cache)
+        rate = f"{cache[0] / max(sum(cache), 1):.1%}"
+    return (
+        name,
+        str(resolved),
+        f"{seconds:.4f}",
+        f"{seconds / resolved * 1e6:.2f}",
+        hits,
+        misses,
+        rate,
+    )
+
+
+def _cache_counts() -> tuple[int, int]:
+    """Return the hits and misses of the cache of the type tables."""
+    info = accessories._get_attributes_accessory_type.cache_info()
+    return info.hits, info.misses
+
+
+def main() -> None:
+    """Parse the arguments, run the passes and print the report."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--states", type=int, default=5000, help="entity states to resolve"
+    )
+    parser.add_argument(
+        "--rounds", type=int, default=20, help="times the states are resolved"
+    )
+    args = parser.parse_args()
+    states = _states(args.states)
+    resolved = len(states) * args.rounds
+    cached = accessories._get_attributes_accessory_type
+    rows = [HEADER]
+
+    accessories._get_attributes_accessory_type = cached.__wrapped__
+    try:
+        rows.append(_row("uncached", resolved, _resolve(states, args.rounds), None))
+    finally:
+        accessories._get_attributes_accessory_type = cached
+
+    cached.cache_clear()
+    seconds = _resolve(states, 1)
+    rows.append(_row("cold cache", len(states), seconds, _cache_counts()))
+    before = _cache_counts()
+    seconds = _resolve(states, args.rounds)
+    after = _cache_counts()
+    rows.append(
+        _row(
+            "warm cache",
+            resolved,
+            seconds,
+            (after[0] - before[0], after[1] - before[1]),
+        )
+    )
+
+    widths = [max(len(row[column]) for row in rows) for column in range(len(HEADER))]
+    for row in rows:
+        print("  ".join(value.rjust(width) for value, width in zip(row, widths)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,232 @@
+"""Measure the startup stages of a HomeKit bridge offline.
+
+Run from the root of the repository with Home Assistant installed:
+
+    python -m benchmarks.startup --accessories 10 --accessories 149
+
+For each bridge size, a fresh Home Assistant instance gets the states of
+the accessory types of benchmarks.state_updates, then the bridge runs
+the stages of HomeKit.async_start on a first ever start: loading the
+storage, setting up the driver, building the accessories, starting the
+driver and persisting its state. The driver advertises to an in-memory
+zeroconf, so no multicast traffic is sent. Registering the bridge device
+and showing the pairing message are left out since they need a config
+entry.
+
+Each stage reports its wall time, the peak of the memory traced by
+tracemalloc above the start of the stage and the memory it still holds
+at its end.
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+from homeassistant.const import CONF_EXCLUDE_ENTITIES
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.entityfilter import FILTER_SCHEMA
+from homeassistant.helpers.storage import STORAGE_DIR
+from zeroconf import ServiceInfo
+
+from custom_components.homekit import MAX_DEVICES, HomeKit, async_setup
+from custom_components.homekit.aidmanager import AccessoryAidStorage
+from custom_components.homekit.const import HOMEKIT_MODE_BRIDGE
+from custom_components.homekit.iidmanager import AccessoryIIDStorage
+
+from .state_updates import SCENARIOS, accessory_config, entity_states
+
+ENTRY_ID = "benchmark"
+BRIDGE_NAME = "Benchmark Bridge"
+# The largest bridge, MAX_DEVICES includes the bridge itself
+DEFAULT_SIZES = (10, 100, MAX_DEVICES - 1)
+
+
+class MemoryZeroconf:
+    """Keep the advertised services in memory instead of on the network."""
+
+    def __init__(self) -> None:
+        """Create a new in-memory zeroconf."""
+        self.services: dict[str, ServiceInfo] = {}
+
+    async def async_register_service(self, info: ServiceInfo, **kwargs: Any) -> None:
+        """Record a registered service."""
+        self.services[info.name] = info
+
+    async def async_update_service(self, info: ServiceInfo) -> None:
+        """Record an updated service."""
+        self.services[info.name] = info
+
+    async def async_unregister_service(self, info: ServiceInfo) -> None:
+        """Forget an unregistered service."""
+        self.services.pop(info.name, None)
+
+    async def async_close(self) -> None:
+        """Close the zeroconf, nothing to release."""
+
+
+class StageRecorder:
+    """Record the wall time and traced memory of consecutive stages."""
+
+    def __init__(self) -> None:
+        """Start tracing and timing the first stage."""
+        self.stages: dict[str, dict[str, float]] = {}
+        tracemalloc.start()
+        self._start = time.perf_counter()
+        self._traced = tracemalloc.get_traced_memory()[0]
+
+    def mark(self, stage: str) -> None:
+        """End a stage and start the next one."""
+        now = time.perf_counter()
+        traced, peak = tracemalloc.get_traced_memory()
+        self.stages[stage] = {
+            "seconds": now - self._start,
+            "peak_kib": (peak - self._traced) / 1024,
+            "retained_kib": (traced - self._traced) / 1024,
+        }
+        tracemalloc.reset_peak()
+        self._traced = tracemalloc.get_traced_memory()[0]
+        self._start = time.perf_counter()
+
+    def stop(self) -> None:
+        """Stop tracing."""
+        tracemalloc.stop()
+
+
+def _async_add_states(hass: HomeAssistant, accessories: int) -> HomeKit:
+    """Add the states of the accessories and return a bridge including them."""
+    entity_config: dict[str, dict[str, Any]] = {}
+    linked: list[str] = []
+    for index in range(accessories):
+        scenario = SCENARIOS[index % len(SCENARIOS)]
+        entities = entity_states(scenario, index)
+        for entity_id, states in entities:
+            hass.states.async_set(entity_id, states[0].state, states[0].attributes)
+        entity_config[entities[0][0]] = accessory_config(scenario, entities)
+        # Linked entities are part of their accessory, not bridged
+        linked.extend(entity_id for entity_id, _ in entities[1:])
+    return HomeKit(
+        hass,
+        BRIDGE_NAME,
+        0,
+        "127.0.0.1",
+        FILTER_SCHEMA({CONF_EXCLUDE_ENTITIES: linked}),
+        False,
+        entity_config,
+        HOMEKIT_MODE_BRIDGE,
+        [],
+        ENTRY_ID,
+        BRIDGE_NAME,
+    )
+
+
+async def _async_setup_hass(config_dir: str) -> HomeAssistant:
+    """Return a Home Assistant instance with the HomeKit integration set up."""
+    hass = HomeAssistant(config_dir)
+    os.makedirs(hass.config.path(STORAGE_DIR))
+    await dr.async_load(hass)
+    await er.async_load(hass)
+    await async_setup(hass, {})
+    return hass
+
+
+async def _async_start_bridge(
+    homekit: HomeKit, accessories: int, mark: Callable[[str], None]
+) -> None:
+    """Start a bridge of the size, calling mark at the end of each stage."""
+    hass = homekit.hass
+    homekit.aid_storage = AccessoryAidStorage(hass, ENTRY_ID, homekit.persist_scheduler)
+    homekit.iid_storage = AccessoryIIDStorage(hass, ENTRY_ID, homekit.persist_scheduler)
+    await homekit.aid_storage.async_initialize()
+    await homekit.iid_storage.async_initialize()
+    homekit.aid_storage.async_setup()
+    mark("storage")
+    loaded_from_disk = await hass.async_add_executor_job(
+        homekit.setup, MemoryZeroconf(), ENTRY_ID
+    )
+    assert not loaded_from_disk
+    assert homekit.driver is not None
+    mark("setup")
+    created = await homekit._async_create_accessories()
+    assert created
+    mark("accessories")
+    await homekit.driver.async_start()
+    mark("driver_start")
+    await hass.async_add_executor_job(homekit.driver.persist)
+    mark("persist")
+
+    bridged = len(homekit.driver.accessory.accessories)
+    expected = min(accessories, MAX_DEVICES - 1)
+    assert bridged == expected, f"bridged {bridged} of {expected}"
+
+
+async def _async_stop_bridge(hass: HomeAssistant, homekit: HomeKit) -> None:
+    """Stop a bridge and its Home Assistant instance."""
+    assert homekit.driver is not None
+    await homekit.driver.async_stop()
+    await homekit.async_stop()
+    await hass.async_stop(force=True)
+
+
+async def _async_run(accessories: int) -> dict[str, dict[str, float]]:
+    """Start a bridge of the size and return its stages."""
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = await _async_setup_hass(config_dir)
+        homekit = _async_add_states(hass, accessories)
+        recorder = StageRecorder()
+        await _async_start_bridge(homekit, accessories, recorder.mark)
+        recorder.stop()
+        await _async_stop_bridge(hass, homekit)
+    return recorder.stages
+
+
+async def async_main(sizes: list[int]) -> None:
+    """Start the bridges and print the report."""
+    rows = [("accessories", "stage", "seconds", "peak KiB", "retained KiB")]
+    for accessories in sizes:
+        stages = await _async_run(accessories)
+        for stage, figures in stages.items():
+            rows.append(
+                (
+                    str(accessories),
+                    stage,
+                    f"{figures['seconds']:.4f}",
+                    f"{figures['peak_kib']:,.0f}",
+                    f"{figures['retained_kib']:,.0f}",
+                )
+            )
+        rows.append(
+            (
+                str(accessories),
+                "total",
+                f"{sum(figures['seconds'] for figures in stages.values()):.4f}",
+                "",
+                f"{sum(figures['retained_kib'] for figures in stages.values()):,.0f}",
+            )
+        )
+    widths = [max(len(row[column]) for row in rows) for column in range(len(rows[0]))]
+    for row in rows:
+        print("  ".join(value.rjust(width) for value, width in zip(row, widths)))
+
+
+def main() -> None:
+    """Parse the arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--accessories",
+        type=int,
+        action="append",
+        help="bridge sizes to start, defaults to 10, 100 and 149",
+    )
+    args = parser.parse_args()
+    asyncio.run(async_main(args.accessories or list(DEFAULT_SIZES)))
+
+
+if __name__ == "__main__":
+    main()
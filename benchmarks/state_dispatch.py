@@ -0,0 +1,199 @@
+"""Compare the state dispatcher with one state tracker per accessory callback.
+
+Run from the root of the repository with Home Assistant installed:
+
+    python -m benchmarks.state_dispatch --bridges 1 --bridges 4 --accessories 100
+
+For each number of bridges, a fresh Home Assistant instance gets bridges
+of accessories cycling through the accessory types of
+benchmarks.state_updates, each bridge with its own stub driver. The
+accessories subscribe either through HomeStateDispatcher or through a
+tracker that registers every callback with
+async_track_state_change_event, as the accessories did before the
+dispatcher. The report covers the time to run and stop all accessories,
+which includes their first state update, and the throughput of state
+changed events cycling through every tracked entity.
+"""
+
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+from typing import Any
+
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    HassJobType,
+    HomeAssistant,
+    State,
+    callback,
+)
+from homeassistant.helpers.event import async_track_state_change_event
+
+from custom_components.homekit.accessories import HomeAccessory, get_accessory
+from custom_components.homekit.const import PROFILER_DATA
+from custom_components.homekit.iidmanager import AccessoryIIDStorage
+from custom_components.homekit.persist import HomePersistScheduler
+from custom_components.homekit.profiler import HomeKitProfiler
+from custom_components.homekit.state_dispatcher import (
+    HomeStateDispatcher,
+    StateChangeAction,
+)
+
+from .state_updates import (
+    SCENARIOS,
+    StubDriver,
+    _event_stream,
+    accessory_config,
+    entity_states,
+)
+
+DEFAULT_BRIDGES = (1, 4)
+PATHS = ("per accessory", "dispatcher")
+
+HEADER = (
+    "path",
+    "bridges",
+    "accessories",
+    "run ms",
+    "stop ms",
+    "events/s",
+    "p50 us",
+    "p99 us",
+)
+
+
+class PerAccessoryTracker:
+    """Register every accessory callback with its own state tracker."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Create a new per accessory tracker."""
+        self.hass = hass
+
+    @callback
+    def async_track_entity(
+        self, entity_id: str, action: StateChangeAction
+    ) -> CALLBACK_TYPE:
+        """Track entity_id for the action, as the accessories used to."""
+        return async_track_state_change_event(
+            self.hass, [entity_id], action, job_type=HassJobType.Callback
+        )
+
+
+async def _async_run_path(
+    path: str, bridges: int, accessories: int, events: int
+) -> tuple[str, ...]:
+    """Run the bridges with the path and return the row of its figures."""
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        hass.data[PROFILER_DATA] = HomeKitProfiler()
+        persist_scheduler = HomePersistScheduler(hass)
+        entities: list[tuple[str, list[State]]] = []
+        built: list[HomeAccessory] = []
+        for bridge in range(bridges):
+            iid_storage = AccessoryIIDStorage(
+                hass, f"bridge_{bridge}", persist_scheduler
+            )
+            await iid_storage.async_initialize()
+            dispatcher: Any = (
+                HomeStateDispatcher(hass)
+                if path == "dispatcher"
+                else PerAccessoryTracker(hass)
+            )
+            driver = StubDriver(hass, iid_storage, dispatcher)
+            for aid in range(2, accessories + 2):
+                index = bridge * accessories + aid
+                scenario = SCENARIOS[index % len(SCENARIOS)]
+                accessory_entities = entity_states(scenario, index)
+                for entity_id, states in accessory_entities:
+                    hass.states.async_set(
+                        entity_id, states[0].state, states[0].attributes
+                    )
+                state = hass.states.get(accessory_entities[0][0])
+                assert state is not None
+                accessory = get_accessory(
+                    hass,
+                    driver,
+                    state,
+                    aid,
+                    accessory_config(scenario, accessory_entities),
+                )
+                assert accessory is not None, scenario.name
+                built.append(accessory)
+                entities.extend(accessory_entities)
+
+        perf_counter = time.perf_counter
+        start = perf_counter()
+        for accessory in built:
+            accessory.run()
+        run_seconds = perf_counter() - start
+
+        stream = _event_stream(entities)
+        fire = hass.bus.async_fire_internal
+        # Warm up the caches before measuring
+        for _ in range(len(entities) * 4):
+            fire(EVENT_STATE_CHANGED, next(stream))
+        durations: list[float] = []
+        for _ in range(events):
+            event_data = next(stream)
+            start = perf_counter()
+            fire(EVENT_STATE_CHANGED, event_data)
+            durations.append(perf_counter() - start)
+
+        start = perf_counter()
+        for accessory in built:
+            accessory.async_stop()
+        stop_seconds = perf_counter() - start
+
+        await persist_scheduler.async_shutdown()
+        await hass.async_stop(force=True)
+
+    quantiles = statistics.quantiles(durations, n=100)
+    return (
+        path,
+        str(bridges),
+        str(len(built)),
+        f"{run_seconds * 1e3:.1f}",
+        f"{stop_seconds * 1e3:.1f}",
+        f"{events / sum(durations):,.0f}",
+        f"{quantiles[49] * 1e6:.1f}",
+        f"{quantiles[98] * 1e6:.1f}",
+    )
+
+
+async def async_main(bridge_counts: list[int], accessories: int, events: int) -> None:
+    """Run both paths for every number of bridges and print the report."""
+    rows = [HEADER]
+    for bridges in bridge_counts:
+        for path in PATHS:
+            rows.append(await _async_run_path(path, bridges, accessories, events))
+    widths = [max(len(row[column]) for row in rows) for column in range(len(HEADER))]
+    for row in rows:
+        print("  ".join(value.rjust(width) for value, width in zip(row, widths)))
+
+
+def main() -> None:
+    """Parse the arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--bridges",
+        type=int,
+        action="append",
+        help="numbers of bridges to run, defaults to 1 and 4",
+    )
+    parser.add_argument(
+        "--accessories", type=int, default=100, help="accessories per bridge"
+    )
+    parser.add_argument(
+        "--events", type=int, default=20000, help="events replayed per run"
+    )
+    args = parser.parse_args()
+    asyncio.run(
+        async_main(args.bridges or list(DEFAULT_BRIDGES), args.accessories, args.events)
+    )
+
+
+if __name__ == "__main__":
+    main()
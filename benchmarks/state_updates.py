@@ -0,0 +1,423 @@
+"""Replay state changed events against HomeKit accessories offline.
+
+Run from the root of the repository with Home Assistant installed:
+
+    python -m benchmarks.state_updates --accessories 10 --events 20000
+
+For each accessory type, accessories are built against a stub driver
+that only counts the published values, then a stream of state changed
+events cycling through the states of the type is fired on the event
+bus. The figures cover the state dispatcher, the accessory update
+callbacks and the characteristic updates, without any network I/O.
+
+The AttributeChurn type only changes attributes its accessories do not
+use, like the link quality a Zigbee sensor reports. It runs a second
+time with the skip of such updates disabled, reported as "(no skip)".
+
+Allocations are measured in a separate pass with tracemalloc running,
+so they do not distort the timings. They are the peak of the traced
+memory above the start of each event, which counts the temporary
+objects of the event, and the memory still held after it.
+"""
+
+import argparse
+import asyncio
+import itertools
+import statistics
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from typing import Any
+
+from homeassistant.const import CONF_DEVICE, EVENT_STATE_CHANGED
+from homeassistant.core import HomeAssistant, State
+from pyhap.loader import get_loader
+
+from custom_components.homekit.accessories import HomeAccessory, get_accessory
+from custom_components.homekit.const import (
+    CONF_LINKED_BATTERY_SENSOR,
+    CONF_TYPE,
+    PROFILER_DATA,
+    TYPE_HEATER_COOLER,
+)
+from custom_components.homekit.custom_devices.const import (
+    CONF_LINKED_TAMPER_SENSOR,
+    DEVICE_AEOTEC_LEAK_SENSOR,
+)
+from custom_components.homekit.iidmanager import AccessoryIIDStorage
+from custom_components.homekit.persist import HomePersistScheduler
+from custom_components.homekit.profiler import HomeKitProfiler
+from custom_components.homekit.state_dispatcher import HomeStateDispatcher
+
+type StateVariant = tuple[str, dict[str, Any]]
+
+
+@dataclass
+class Scenario:
+    """The accessories of one type and the states they cycle through."""
+
+    name: str
+    domain: str
+    states: list[StateVariant]
+    config: dict[str, Any] = field(default_factory=dict)
+    # Linked entities by config key, with their domain and states
+    linked: dict[str, tuple[str, list[StateVariant]]] = field(default_factory=dict)
+    # Also run with the skip of unused attribute changes disabled
+    compare_skip: bool = False
+
+
+SCENARIOS = (
+    Scenario(
+        "Light",
+        "light",
+        [
+            (
+                "on",
+                {
+                    "supported_color_modes": ["color_temp", "hs"],
+                    "color_mode": "color_temp",
+                    "brightness": brightness,
+                    "color_temp_kelvin": kelvin,
+                    "min_color_temp_kelvin": 2000,
+                    "max_color_temp_kelvin": 6500,
+                },
+            )
+            for brightness, kelvin in ((64, 2700), (128, 3000), (255, 4000))
+        ]
+        + [("off", {"supported_color_modes": ["color_temp", "hs"]})],
+    ),
+    Scenario("Switch", "switch", [("on", {}), ("off", {})]),
+    Scenario(
+        "Thermostat",
+        "climate",
+        [
+            (
+                hvac_mode,
+                {
+                    "hvac_modes": ["off", "heat", "cool", "heat_cool"],
+                    "hvac_action": hvac_action,
+                    "supported_features": 1,
+                    "current_temperature": current,
+                    "temperature": 21.0,
+                    "min_temp": 7,
+                    "max_temp": 35,
+                },
+            )
+            for hvac_mode, hvac_action, current in (
+                ("heat", "heating", 19.5),
+                ("heat", "heating", 20.0),
+                ("heat", "idle", 21.0),
+                ("off", "off", 20.5),
+            )
+        ],
+    ),
+    Scenario(
+        "HeaterCooler",
+        "climate",
+        [
+            (
+                "cool",
+                {
+                    "hvac_modes": ["off", "heat", "cool"],
+                    "hvac_action": "cooling",
+                    "supported_features": 9,
+                    "fan_modes": ["low", "medium", "high"],
+                    "fan_mode": fan_mode,
+                    "current_temperature": current,
+                    "temperature": 22.0,
+                    "min_temp": 16,
+                    "max_temp": 30,
+                },
+            )
+            for fan_mode, current in (("low", 24.0), ("medium", 23.5), ("high", 23.0))
+        ],
+        config={CONF_TYPE: TYPE_HEATER_COOLER},
+    ),
+    Scenario(
+        "WindowCovering",
+        "cover",
+        [
+            (state, {"supported_features": 15, "current_position": position})
+            for state, position in (("opening", 20), ("opening", 60), ("open", 100))
+        ],
+    ),
+    Scenario(
+        "Fan",
+        "fan",
+        [
+            ("on", {"supported_features": 1, "percentage": percentage})
+            for percentage in (33, 66, 100)
+        ]
+        + [("off", {"supported_features": 1, "percentage": 0})],
+    ),
+    Scenario(
+        "TemperatureSensor",
+        "sensor",
+        [
+            (value, {"device_class": "temperature", "unit_of_measurement": "°C"})
+            for value in ("20.1", "20.2", "20.4", "20.3")
+        ],
+        linked={
+            CONF_LINKED_BATTERY_SENSOR: (
+                "sensor",
+                [
+                    (level, {"device_class": "battery", "unit_of_measurement": "%"})
+                    for level in ("80", "79")
+                ],
+            )
+        },
+    ),
+    Scenario(
+        "MotionSensor",
+        "binary_sensor",
+        [(state, {"device_class": "motion"}) for state in ("on", "off")],
+    ),
+    Scenario("Lock", "lock", [("locked", {}), ("unlocking", {}), ("unlocked", {})]),
+    Scenario(
+        "AeotecLeakSensor",
+        "binary_sensor",
+        [(state, {"device_class": "moisture"}) for state in ("on", "off")],
+        config={CONF_DEVICE: DEVICE_AEOTEC_LEAK_SENSOR},
+        linked={
+            CONF_LINKED_TAMPER_SENSOR: (
+                "binary_sensor",
+                [(state, {"device_class": "tamper"}) for state in ("on", "off")],
+            )
+        },
+    ),
+    Scenario(
+        "AttributeChurn",
+        "sensor",
+        [
+            (
+                "21.5",
+                {
+                    "device_class": "temperature",
+                    "unit_of_measurement": "°C",
+                    "linkquality": linkquality,
+                    "last_seen": f"2026-10-17T08:00:{second:02d}+00:00",
+                },
+            )
+            for second, linkquality in enumerate((120, 116, 124, 118))
+        ],
+        compare_skip=True,
+    ),
+)
+
+
+class StubDriver:
+    """Provide what the accessories use of the driver, without a server."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        iid_storage: AccessoryIIDStorage,
+        state_dispatcher: HomeStateDispatcher,
+    ) -> None:
+        """Create a new stub driver."""
+        self.hass = hass
+        self.entry_id = "benchmark"
+        self.loader = get_loader()
+        self.iid_storage = iid_storage
+        self.state_dispatcher = state_dispatcher
+        self.published = 0
+
+    def publish(
+        self,
+        data: dict[str, Any],
+        sender_client_addr: tuple[str, int] | None = None,
+        immediate: bool = False,
+    ) -> None:
+        """Count a value an accessory would send to the controllers."""
+        self.published += 1
+
+
+@dataclass
+class Result:
+    """The figures of one accessory type."""
+
+    name: str
+    events: int
+    published: int
+    durations: list[float]
+    alloc_bytes: int
+    retained_bytes: int
+
+    def row(self) -> tuple[str, ...]:
+        """Return the figures formatted for the report."""
+        quantiles = statistics.quantiles(self.durations, n=100)
+        busy = sum(self.durations)
+        return (
+            self.name,
+            str(self.events),
+            str(self.published),
+            f"{self.events / busy:,.0f}",
+            f"{quantiles[49] * 1e6:.1f}",
+            f"{quantiles[98] * 1e6:.1f}",
+            f"{self.alloc_bytes / self.events:,.0f}",
+            f"{self.retained_bytes / self.events:,.1f}",
+        )
+
+
+HEADER = (
+    "type",
+    "events",
+    "published",
+    "events/s",
+    "p50 us",
+    "p99 us",
+    "alloc B/event",
+    "retained B/event",
+)
+
+
+def entity_states(scenario: Scenario, index: int) -> list[tuple[str, list[State]]]:
+    """Return the entities of an accessory and the states they cycle through."""
+    entities = [
+        (
+            f"{scenario.domain}.{scenario.name.lower()}_{index}",
+            scenario.states,
+        )
+    ]
+    for domain, states in scenario.linked.values():
+        entities.append((f"{domain}.{scenario.name.lower()}_{index}_link", states))
+    return [
+        (entity_id, [State(entity_id, state, attrs) for state, attrs in states])
+        for entity_id, states in entities
+    ]
+
+
+def accessory_config(
+    scenario: Scenario, entities: list[tuple[str, list[State]]]
+) -> dict[str, Any]:
+    """Return the entity config of an accessory, linking its entities."""
+    config = dict(scenario.config)
+    for key, (entity_id, _) in zip(scenario.linked, entities[1:], strict=True):
+        config[key] = entity_id
+    return config
+
+
+def _event_stream(
+    entities: list[tuple[str, list[State]]],
+) -> Iterator[dict[str, Any]]:
+    """Cycle through the entities, changing each to its next state."""
+    cycles = {
+        entity_id: itertools.pairwise(itertools.cycle(states))
+        for entity_id, states in entities
+    }
+    for entity_id in itertools.cycle(cycles):
+        old_state, new_state = next(cycles[entity_id])
+        yield {"entity_id": entity_id, "old_state": old_state, "new_state": new_state}
+
+
+async def _async_run_scenario(
+    hass: HomeAssistant,
+    scenario: Scenario,
+    accessories: int,
+    events: int,
+    skip_unused: bool = True,
+) -> Result:
+    """Build the accessories of a scenario and replay its events."""
+    persist_scheduler = HomePersistScheduler(hass)
+    iid_storage = AccessoryIIDStorage(hass, scenario.name, persist_scheduler)
+    await iid_storage.async_initialize()
+    driver = StubDriver(hass, iid_storage, HomeStateDispatcher(hass))
+    entities: list[tuple[str, list[State]]] = []
+    built: list[HomeAccessory] = []
+    for index in range(accessories):
+        accessory_entities = entity_states(scenario, index)
+        for entity_id, states in accessory_entities:
+            hass.states.async_set(entity_id, states[0].state, states[0].attributes)
+        config = accessory_config(scenario, accessory_entities)
+        state = hass.states.get(accessory_entities[0][0])
+        assert state is not None
+        accessory = get_accessory(hass, driver, state, index + 2, config)
+        assert accessory is not None, scenario.name
+        if not skip_unused:
+            accessory._update_attrs = None
+        accessory.run()
+        built.append(accessory)
+        entities.extend(accessory_entities)
+
+    stream = _event_stream(entities)
+    fire = hass.bus.async_fire_internal
+    # Warm up the caches before measuring
+    for _ in range(len(entities) * 4):
+        fire(EVENT_STATE_CHANGED, next(stream))
+    driver.published = 0
+
+    durations: list[float] = []
+    perf_counter = time.perf_counter
+    for _ in range(events):
+        event_data = next(stream)
+        start = perf_counter()
+        fire(EVENT_STATE_CHANGED, event_data)
+        durations.append(perf_counter() - start)
+    published = driver.published
+
+    alloc_bytes = retained_bytes = 0
+    tracemalloc.start()
+    for _ in range(events):
+        event_data = next(stream)
+        tracemalloc.reset_peak()
+        before = tracemalloc.get_traced_memory()[0]
+        fire(EVENT_STATE_CHANGED, event_data)
+        current, peak = tracemalloc.get_traced_memory()
+        alloc_bytes += peak - before
+        retained_bytes += current - before
+    tracemalloc.stop()
+
+    for accessory in built:
+        accessory.async_stop()
+    await persist_scheduler.async_shutdown()
+    name = scenario.name if skip_unused else f"{scenario.name} (no skip)"
+    return Result(name, events, published, durations, alloc_bytes, retained_bytes)
+
+
+async def async_main(accessories: int, events: int, types: list[str]) -> None:
+    """Run the scenarios and print the report."""
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        hass.data[PROFILER_DATA] = HomeKitProfiler()
+        rows = [HEADER]
+        for scenario in SCENARIOS:
+            if types and scenario.name not in types:
+                continue
+            result = await _async_run_scenario(hass, scenario, accessories, events)
+            rows.append(result.row())
+            if scenario.compare_skip:
+                result = await _async_run_scenario(
+                    hass, scenario, accessories, events, skip_unused=False
+                )
+                rows.append(result.row())
+        await hass.async_stop(force=True)
+    widths = [max(len(row[column]) for row in rows) for column in range(len(HEADER))]
+    for row in rows:
+        print("  ".join(value.rjust(width) for value, width in zip(row, widths)))
+
+
+def main() -> None:
+    """Parse the arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--accessories", type=int, default=10, help="accessories per type"
+    )
+    parser.add_argument(
+        "--events", type=int, default=20000, help="events replayed per type"
+    )
+    parser.add_argument(
+        "--type",
+        dest="types",
+        action="append",
+        default=[],
+        choices=[scenario.name for scenario in SCENARIOS],
+        help="only run the given accessory type, can be repeated",
+    )
+    args = parser.parse_args()
+    asyncio.run(async_main(args.accessories, args.events, args.types))
+
+
+if __name__ == "__main__":
+    main()
@@ -5,10 +5,12 @@ import asyncio
 from collections import defaultdict
 from collections.abc import Iterable
 from copy import deepcopy
+from dataclasses import dataclass
 import ipaddress
 import logging
 import os
 import socket
+import time
 from typing import Any, cast
 
 from aiohttp import web
@@ -67,6 +69,7 @@ from homeassistant.helpers import (
     entity_registry as er,
     instance_id,
 )
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entityfilter import (
     BASE_FILTER_SCHEMA,
@@ -81,7 +84,7 @@ from homeassistant.helpers.target import (
     async_extract_referenced_entity_ids,
 )
 from homeassistant.helpers.typing import ConfigType
-from homeassistant.loader import IntegrationNotFound, async_get_integration
+from homeassistant.loader import IntegrationNotFound, async_get_integrations
 from homeassistant.util.async_ import create_eager_task
 
 from . import (  # noqa: F401
@@ -109,6 +112,7 @@ from .accessories import (
 )
 from .aidmanager import AccessoryAidStorage
 from .const import (
+    ATTR_SECONDS,
     ATTR_INTEGRATION,
     BRIDGE_NAME,
     BRIDGE_SERIAL_NUMBER,
@@ -126,14 +130,21 @@ from .const import (
     CONF_LINKED_PM25_SENSOR,
     CONF_LINKED_TEMPERATURE_SENSOR,
     CONFIG_OPTIONS,
+    DEBOUNCE_TIMEOUT,
     DEFAULT_EXCLUDE_ACCESSORY_MODE,
     DEFAULT_HOMEKIT_MODE,
     DEFAULT_PORT,
+    DEFAULT_PROFILE_SECONDS,
     DOMAIN,
     HOMEKIT_MODE_ACCESSORY,
     HOMEKIT_MODES,
+    INTEGRATION_NAMES_DATA,
+    LINKED_SENSOR_INDEX_DATA,
     MANUFACTURER,
+    MAX_PROFILE_SECONDS,
     PERSIST_LOCK_DATA,
+    PROFILER_DATA,
+    SERVICE_HOMEKIT_PROFILE,
     SERVICE_HOMEKIT_RESET_ACCESSORY,
     SERVICE_HOMEKIT_UNPAIR,
     SHUTDOWN_TIMEOUT,
@@ -152,7 +163,12 @@ from .custom_devices import (  # noqa: F401
     type_tuya_star_projector,
 )
 from .iidmanager import AccessoryIIDStorage
+from .linked_sensors import LinkedSensorIndex
 from .models import HomeKitConfigEntry, HomeKitEntryData
+from .persist import HomePersistScheduler
+from .profiler import HomeKitProfiler
+from .state_dispatcher import HomeStateDispatcher
+from .stats import StageTimer
 from .type_triggers import DeviceTriggerAccessory
 from .util import (
     accessory_friendly_name,
@@ -168,6 +184,7 @@ from .util import (
 _LOGGER = logging.getLogger(__name__)
 
 MAX_DEVICES = 150  # includes the bridge
+BRIDGE_BUILD_CHUNK_SIZE = 10
 
 # #### Driver Status ####
 STATUS_READY = 0
@@ -178,7 +195,7 @@ STATUS_WAIT = 3
 PORT_CLEANUP_CHECK_INTERVAL_SECS = 1
 
 _HOMEKIT_CONFIG_UPDATE_TIME = (
-    10  # number of seconds to wait for homekit to see the c# change
+    10  # max number of seconds to wait for homekit to see the c# change
 )
 _HAS_IPV6 = hasattr(socket, "AF_INET6")
 _DEFAULT_BIND = ["0.0.0.0", "::"] if _HAS_IPV6 else ["0.0.0.0"]
@@ -246,6 +263,15 @@ UNPAIR_SERVICE_SCHEMA = vol.Schema(
 )
 
 
+PROFILE_SERVICE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_SECONDS, default=DEFAULT_PROFILE_SECONDS): vol.All(
+            vol.Coerce(float), vol.Range(min=1, max=MAX_PROFILE_SECONDS)
+        )
+    }
+)
+
+
 @callback
 def _async_update_entries_from_yaml(
     hass: HomeAssistant, config: ConfigType, start_import_flow: bool
@@ -304,6 +330,14 @@ def _async_get_imported_entries_indices(
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up the HomeKit from yaml."""
     hass.data[PERSIST_LOCK_DATA] = asyncio.Lock()
+    hass.data[INTEGRATION_NAMES_DATA] = {}
+    linked_sensor_index = LinkedSensorIndex(hass)
+    linked_sensor_index.async_setup()
+    hass.bus.async_listen_once(
+        EVENT_HOMEASSISTANT_STOP, linked_sensor_index.async_shutdown
+    )
+    hass.data[LINKED_SENSOR_INDEX_DATA] = linked_sensor_index
+    hass.data[PROFILER_DATA] = HomeKitProfiler()
 
     # Initialize the loader before loading entries to ensure
     # there is no race where multiple entries try to load it
@@ -431,8 +465,7 @@ async def async_unload_entry(hass: HomeAssistant, entry: HomeKitConfigEntry) ->
     entry_data = entry.runtime_data
     homekit = entry_data.homekit
 
-    if homekit.status == STATUS_RUNNING:
-        await homekit.async_stop()
+    await homekit.async_stop()
 
     logged_shutdown_wait = False
     for _ in range(SHUTDOWN_TIMEOUT):
@@ -550,6 +583,40 @@ def _async_register_events_and_services(hass: HomeAssistant) -> None:
         _handle_homekit_reload,
     )
 
+    async def async_handle_homekit_profile(service: ServiceCall) -> None:
+        """Handle profile HomeKit service call."""
+        profiler: HomeKitProfiler = hass.data[PROFILER_DATA]
+        profiler.async_start()
+        try:
+            await asyncio.sleep(service.data[ATTR_SECONDS])
+        finally:
+            profile = profiler.async_stop()
+        path = hass.config.path(f"{DOMAIN}_profile.{int(time.time())}.prof")
+        await hass.async_add_executor_job(profile.dump_stats, path)
+        _LOGGER.info("Wrote the HomeKit profile to %s", path)
+
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_HOMEKIT_PROFILE,
+        async_handle_homekit_profile,
+        schema=PROFILE_SERVICE_SCHEMA,
+    )
+
+
+@dataclass(slots=True)
+class _PendingBridgeAccessory:
+    """A state with its type resolved, not yet built.
+
+    The aid is allocated once every state of a batch is prepared.
+    """
+
+    state: State
+    conf: dict[str, Any]
+    accessory_type: str | None
+    newly_allocated: bool
+    aid: int = 0
+
 
 class HomeKit:
     """Class to handle all actions between HomeKit and Home Assistant."""
@@ -586,11 +653,26 @@ class HomeKit:
         self._devices = devices or []
         self.aid_storage: AccessoryAidStorage | None = None
         self.iid_storage: AccessoryIIDStorage | None = None
+        self.state_dispatcher = HomeStateDispatcher(hass)
+        self._profiler: HomeKitProfiler = hass.data[PROFILER_DATA]
+        self.persist_scheduler = HomePersistScheduler(hass)
+        self.startup_timings: dict[str, dict[str, float]] = {}
+        self.reload_count = 0
+        self.reloaded_entity_count = 0
+        self.reset_count = 0
         self.status = STATUS_READY
         self.driver: HomeDriver | None = None
         self.bridge: HomeBridge | None = None
         self._reset_lock = asyncio.Lock()
         self._cancel_reload_dispatcher: CALLBACK_TYPE | None = None
+        self._pending_reload_entity_ids: set[str] = set()
+        self._reload_debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=DEBOUNCE_TIMEOUT,
+            immediate=False,
+            function=self._async_reload_pending_accessories,
+        )
         # True while running the first ever start of this entry (no
         # persisted pairing state yet); accessory mode uses it to tell a
         # brand new entry from one that predates the HeaterCooler.
@@ -619,6 +701,8 @@ class HomeKit:
             zeroconf_server=f"{uuid}-hap.local.",
             loader=get_loader(),
             iid_storage=self.iid_storage,
+            state_dispatcher=self.state_dispatcher,
+            persist_scheduler=self.persist_scheduler,
         )
         # If we do not load the mac address will be wrong
         # as pyhap uses a random one until state is restored
@@ -633,16 +717,38 @@ class HomeKit:
     async def async_reset_accessories(self, entity_ids: Iterable[str]) -> None:
         """Reset the accessory to load the latest configuration."""
         _LOGGER.debug("Resetting accessories: %s", entity_ids)
-        async with self._reset_lock:
-            if not self.bridge:
+        self.reset_count += 1
+        if not self.bridge:
+            async with self._reset_lock:
                 # For accessory mode reset and reload are the same
                 await self._async_reload_accessories_in_accessory_mode(entity_ids)
-                return
-            await self._async_reset_accessories_in_bridge_mode(entity_ids)
+            return
+        await self._async_reset_accessories_in_bridge_mode(entity_ids)
+
+    @callback
+    def async_queue_reload_accessories(self, entity_ids: Iterable[str]) -> None:
+        """Queue accessories to be reloaded together.
+
+        Integrations often signal reloads one entity at a time, so the
+        entity ids are gathered over a short window and reloaded as one
+        batch with a single config version bump.
+        """
+        self._pending_reload_entity_ids.update(entity_ids)
+        self._reload_debouncer.async_schedule_call()
+
+    async def _async_reload_pending_accessories(self) -> None:
+        """Reload the queued accessories."""
+        entity_ids = self._pending_reload_entity_ids
+        self._pending_reload_entity_ids = set()
+        if entity_ids:
+            await self.async_reload_accessories(entity_ids)
 
     async def async_reload_accessories(self, entity_ids: Iterable[str]) -> None:
         """Reload the accessory to load the latest configuration."""
         _LOGGER.debug("Reloading accessories: %s", entity_ids)
+        entity_ids = list(entity_ids)
+        self.reload_count += 1
+        self.reloaded_entity_count += len(entity_ids)
         async with self._reset_lock:
             if not self.bridge:
                 await self._async_reload_accessories_in_accessory_mode(entity_ids)
@@ -677,11 +783,12 @@ class HomeKit:
                 "The underlying entity %s disappeared during reload", acc.entity_id
             )
             return
-        self._async_shutdown_accessory(acc)
-        if new_acc := self._async_create_single_accessory([state]):
-            self.driver.accessory = new_acc
-            new_acc.run()
-            self._async_update_accessories_hash()
+        with self._profiler.scope():
+            self._async_shutdown_accessory(acc)
+            if new_acc := self._async_create_single_accessory([state]):
+                self.driver.accessory = new_acc
+                new_acc.run()
+                self._async_update_accessories_hash()
 
     def _async_remove_accessories_by_entity_id(
         self, entity_ids: Iterable[str]
@@ -691,31 +798,50 @@ class HomeKit:
         assert self.bridge is not None
         removed: list[str] = []
         acc: HomeAccessory | None
-        for entity_id in entity_ids:
-            # A lookup must not allocate; an allocation marks the entity as
-            # previously bridged, which would suppress the automatic routing.
-            aid = self.aid_storage.get_allocated_aid_for_entity_id(entity_id)
-            if aid is None or aid not in self.bridge.accessories:
-                continue
-            if acc := self.async_remove_bridge_accessory(aid):
-                self._async_shutdown_accessory(acc)
-                removed.append(entity_id)
+        with self._profiler.scope():
+            for entity_id in entity_ids:
+                # A lookup must not allocate; an allocation marks the entity
+                # as previously bridged, which would suppress the automatic
+                # routing.
+                aid = self.aid_storage.get_allocated_aid_for_entity_id(entity_id)
+                if aid is None or aid not in self.bridge.accessories:
+                    continue
+                if acc := self.async_remove_bridge_accessory(aid):
+                    self._async_shutdown_accessory(acc)
+                    removed.append(entity_id)
         return removed
 
     async def _async_reset_accessories_in_bridge_mode(
         self, entity_ids: Iterable[str]
     ) -> None:
-        """Reset accessories in bridge mode."""
-        if not (removed := self._async_remove_accessories_by_entity_id(entity_ids)):
-            _LOGGER.debug("No accessories to reset in bridge mode for: %s", entity_ids)
-            return
-        # With a reset, we need to remove the accessories,
-        # and force config change so iCloud deletes them from
-        # the database.
+        """Reset accessories in bridge mode.
+
+        The reset lock is released while waiting for the controllers to
+        see the removal, so other resets and reloads can run meanwhile.
+        """
         assert self.driver is not None
-        self._async_update_accessories_hash()
-        await asyncio.sleep(_HOMEKIT_CONFIG_UPDATE_TIME)
-        await self._async_recreate_removed_accessories_in_bridge_mode(removed)
+        async with self._reset_lock:
+            if not (removed := self._async_remove_accessories_by_entity_id(entity_ids)):
+                _LOGGER.debug(
+                    "No accessories to reset in bridge mode for: %s", entity_ids
+                )
+                return
+            # With a reset, we need to remove the accessories,
+            # and force config change so iCloud deletes them from
+            # the database.
+            config_changed = self._async_update_accessories_hash()
+        if config_changed and not await self.driver.async_wait_for_config_fetch(
+            _HOMEKIT_CONFIG_UPDATE_TIME
+        ):
+            _LOGGER.debug(
+                "%s: Not every controller fetched the updated configuration within %ss",
+                self._name,
+                _HOMEKIT_CONFIG_UPDATE_TIME,
+            )
+        async with self._reset_lock:
+            if self.status != STATUS_RUNNING:
+                return
+            await self._async_recreate_removed_accessories_in_bridge_mode(removed)
 
     async def _async_reload_accessories_in_bridge_mode(
         self, entity_ids: Iterable[str]
@@ -728,15 +854,17 @@ class HomeKit:
         self, removed: list[str]
     ) -> None:
         """Recreate removed accessories in bridge mode."""
-        for entity_id in removed:
-            if not (state := self.hass.states.get(entity_id)):
-                _LOGGER.warning(
-                    "The underlying entity %s disappeared during reload", entity_id
-                )
-                continue
-            if acc := self.add_bridge_accessory(state):
-                acc.run()
-        self._async_update_accessories_hash()
+        with self._profiler.scope():
+            for entity_id in removed:
+                if not (state := self.hass.states.get(entity_id)):
+                    _LOGGER.warning(
+                        "The underlying entity %s disappeared during reload",
+                        entity_id,
+                    )
+                    continue
+                if acc := self.add_bridge_accessory(state):
+                    acc.run()
+            self._async_update_accessories_hash()
 
     @callback
     def _async_update_accessories_hash(self) -> bool:
@@ -757,9 +885,26 @@ class HomeKit:
 
     def add_bridge_accessory(self, state: State) -> HomeAccessory | None:
         """Try adding accessory to bridge if configured beforehand."""
+        if not (pending := self._async_prepare_bridge_accessory(state)):
+            return None
+        assert self.aid_storage is not None
+        pending.aid = self.aid_storage.get_or_allocate_aid_for_entity_id(
+            state.entity_id
+        )
+        return self._async_build_bridge_accessory(pending)
+
+    @callback
+    def _async_prepare_bridge_accessory(
+        self, state: State, pending_count: int = 0
+    ) -> _PendingBridgeAccessory | None:
+        """Resolve the accessory type of a state to be bridged.
+
+        pending_count is the number of accessories prepared but not yet
+        added to the bridge, so a bulk pass honors the device limit.
+        """
         assert self.driver is not None
 
-        if self._would_exceed_max_devices(state.entity_id):
+        if self._would_exceed_max_devices(state.entity_id, pending_count):
             return None
 
         if state_needs_accessory_mode(state):
@@ -777,42 +922,54 @@ class HomeKit:
             )
 
         assert self.aid_storage is not None
-        assert self.bridge is not None
         conf = self._config.get(state.entity_id, {}).copy()
-        # Must run before the aid is allocated below so a never bridged
-        # entity is still recognizable as new.
+        # Must run before the aid is allocated so a never bridged entity
+        # is still recognizable as new.
         pending_type = async_resolve_accessory_type(
             self.aid_storage, state, conf, allow_auto=True
         )
         newly_allocated = not self.aid_storage.entity_is_allocated(state.entity_id)
-        aid = self.aid_storage.get_or_allocate_aid_for_entity_id(state.entity_id)
+        return _PendingBridgeAccessory(state, conf, pending_type, newly_allocated)
+
+    @callback
+    def _async_build_bridge_accessory(
+        self, pending: _PendingBridgeAccessory
+    ) -> HomeAccessory | None:
+        """Create a prepared accessory and add it to the bridge."""
+        assert self.aid_storage is not None
+        assert self.bridge is not None
+        state = pending.state
         # If an accessory cannot be created or added due to an exception
         # of any kind (usually in pyhap) it should not prevent
         # the rest of the accessories from being created
         try:
-            acc = get_accessory(self.hass, self.driver, state, aid, conf)
+            acc = get_accessory(
+                self.hass, self.driver, state, pending.aid, pending.conf
+            )
             if acc is not None:
                 self.bridge.add_accessory(acc)
-                if pending_type:
+                if pending.accessory_type:
                     self.aid_storage.async_set_accessory_type(
-                        state.entity_id, pending_type
+                        state.entity_id, pending.accessory_type
                     )
                 return acc
         except Exception:
             _LOGGER.exception(
                 "Failed to create a HomeKit accessory for %s", state.entity_id
             )
-        if newly_allocated:
+        if pending.newly_allocated:
             # A failed first attempt must not classify the entity as
             # existing on the next try.
-            self.aid_storage.async_delete_aid_for_entity_id(state.entity_id)
+            self.aid_storage.async_delete_aid_allocation(pending.aid)
         return None
 
-    def _would_exceed_max_devices(self, name: str | None) -> bool:
+    def _would_exceed_max_devices(
+        self, name: str | None, pending_count: int = 0
+    ) -> bool:
         """Check if adding another devices would reach the limit and log."""
         # The bridge itself counts as an accessory
         assert self.bridge is not None
-        if len(self.bridge.accessories) + 1 >= MAX_DEVICES:
+        if len(self.bridge.accessories) + pending_count + 1 >= MAX_DEVICES:
             _LOGGER.warning(
                 (
                     "Cannot add %s as this would exceed the %d device limit. Consider"
@@ -856,6 +1013,7 @@ class HomeKit:
     def async_remove_bridge_accessory(self, aid: int) -> HomeAccessory | None:
         """Try adding accessory to bridge if configured beforehand."""
         assert self.bridge is not None
+        self.bridge.snapshot_scheduler.async_remove_accessory(aid)
         if acc := self.bridge.accessories.pop(aid, None):
             return cast(HomeAccessory, acc)
         return None
@@ -864,10 +1022,12 @@ class HomeKit:
         """Configure accessories for the included states."""
         dev_reg = dr.async_get(self.hass)
         ent_reg = er.async_get(self.hass)
-        device_lookup: dict[str, dict[tuple[str, str | None], str]] = {}
+        linked_sensor_index: LinkedSensorIndex = self.hass.data[
+            LINKED_SENSOR_INDEX_DATA
+        ]
         entity_states: list[State] = []
+        needs_integration_name: list[er.RegistryEntry] = []
         entity_filter = self._filter.get_filter()
-        entries = ent_reg.entities
         for state in self.hass.states.async_all():
             entity_id = state.entity_id
             if not entity_filter(entity_id):
@@ -880,60 +1040,102 @@ class HomeKit:
                 ) and not self._filter.explicitly_included(entity_id):
                     continue
 
-                await self._async_set_device_info_attributes(
+                if not self._async_set_device_info_attributes(
                     ent_reg_ent, dev_reg, entity_id
-                )
+                ):
+                    needs_integration_name.append(ent_reg_ent)
                 if device_id := ent_reg_ent.device_id:
-                    if device_id not in device_lookup:
-                        device_lookup[device_id] = {
-                            (
-                                entry.domain,
-                                entry.device_class or entry.original_device_class,
-                            ): entry.entity_id
-                            for entry in entries.get_entries_for_device_id(device_id)
-                        }
                     self._async_configure_linked_sensors(
-                        ent_reg_ent, device_lookup[device_id], state
+                        ent_reg_ent, linked_sensor_index.async_get(device_id), state
                     )
 
             entity_states.append(state)
 
+        if needs_integration_name:
+            integration_names = await self._async_get_integration_names(
+                {ent_reg_ent.platform for ent_reg_ent in needs_integration_name}
+            )
+            for ent_reg_ent in needs_integration_name:
+                self._config[ent_reg_ent.entity_id][ATTR_INTEGRATION] = (
+                    integration_names[ent_reg_ent.platform]
+                )
+
         return entity_states
 
+    async def _async_get_integration_names(self, platforms: set[str]) -> dict[str, str]:
+        """Return the integration name of each platform.
+
+        The names are cached for every HomeKit instance, and the platforms
+        missing from the cache are loaded concurrently.
+        """
+        integration_names: dict[str, str] = self.hass.data[INTEGRATION_NAMES_DATA]
+        if missing := platforms.difference(integration_names):
+            integrations = await async_get_integrations(self.hass, missing)
+            for platform, integration in integrations.items():
+                if isinstance(integration, IntegrationNotFound):
+                    integration_names[platform] = platform
+                elif isinstance(integration, Exception):
+                    raise integration
+                else:
+                    integration_names[platform] = integration.name
+        return integration_names
+
     async def async_start(self, *args: Any) -> None:
         """Load storage and start."""
         if self.status != STATUS_READY:
             return
         self.status = STATUS_WAIT
+        timer = StageTimer()
+        # Shared with the timer so a failed start keeps the stages it ran
+        self.startup_timings = timer.stages
         self._cancel_reload_dispatcher = async_dispatcher_connect(
             self.hass,
             SIGNAL_RELOAD_ENTITIES.format(self._entry_id),
-            self.async_reload_accessories,
+            self.async_queue_reload_accessories,
         )
         async_zc_instance = await zeroconf.async_get_async_instance(self.hass)
         uuid = await instance_id.async_get(self.hass)
-        self.aid_storage = AccessoryAidStorage(self.hass, self._entry_id)
-        self.iid_storage = AccessoryIIDStorage(self.hass, self._entry_id)
+        self.aid_storage = AccessoryAidStorage(
+            self.hass, self._entry_id, self.persist_scheduler
+        )
+        self.iid_storage = AccessoryIIDStorage(
+            self.hass, self._entry_id, self.persist_scheduler
+        )
         # Avoid gather here since it will be I/O bound anyways
         await self.aid_storage.async_initialize()
         await self.iid_storage.async_initialize()
+        if self.status != STATUS_WAIT:
+            # Stopped while loading the storage
+            return
+        self.aid_storage.async_setup()
+        timer.mark("storage")
         loaded_from_disk = await self.hass.async_add_executor_job(
             self.setup, async_zc_instance, uuid
         )
         assert self.driver is not None
         self._first_ever_start = not loaded_from_disk
+        timer.mark("setup")
 
-        if not await self._async_create_accessories():
+        if not await self._async_create_accessories() or self.status != STATUS_WAIT:
             return
+        timer.mark("accessories")
         self._async_register_bridge()
+        timer.mark("register_bridge")
         _LOGGER.debug("Driver start for %s", self._name)
         await self.driver.async_start()
+        if self.status != STATUS_WAIT:
+            # Stopped while the driver started
+            await self.driver.async_stop()
+            return
+        timer.mark("driver_start")
         if not loaded_from_disk:
             # If the state was not loaded from disk, it means this is the
             # first time the bridge is ever starting up. In this case, we
             # need to make sure its persisted to disk.
             async with self.hass.data[PERSIST_LOCK_DATA]:
                 await self.hass.async_add_executor_job(self.driver.persist)
+            timer.mark("persist")
+        _LOGGER.debug("%s: Startup stages: %s", self._name, timer.stages)
         # The pairing state is persisted now, so later reloads treat the
         # entry as existing.
         self._first_ever_start = False
@@ -1067,12 +1269,47 @@ class HomeKit:
     ) -> HomeAccessory:
         """Create a HomeKit bridge with accessories. (bridge mode)."""
         assert self.driver is not None
+        assert self.aid_storage is not None
 
         self.bridge = HomeBridge(self.hass, self.driver, self._name)
+        start = time.monotonic()
+        # Resolve types and allocate aids for every state up front so the
+        # storage work is done in one pass before the expensive pyhap
+        # construction starts.
+        pending_accessories: list[_PendingBridgeAccessory] = []
         for state in entity_states:
-            self.add_bridge_accessory(state)
+            if pending := self._async_prepare_bridge_accessory(
+                state, len(pending_accessories)
+            ):
+                pending_accessories.append(pending)
+        aids = self.aid_storage.async_get_or_allocate_aids(
+            pending.state.entity_id for pending in pending_accessories
+        )
+        for pending in pending_accessories:
+            pending.aid = aids[pending.state.entity_id]
+        prepared = time.monotonic()
+        # Building an accessory walks every service and characteristic, so
+        # yield to the event loop between chunks to keep a large bridge
+        # from blocking it for the whole startup.
+        for index in range(0, len(pending_accessories), BRIDGE_BUILD_CHUNK_SIZE):
+            for pending in pending_accessories[index : index + BRIDGE_BUILD_CHUNK_SIZE]:
+                self._async_build_bridge_accessory(pending)
+            await asyncio.sleep(0)
+        built = time.monotonic()
         if self._devices:
             await self._async_add_trigger_accessories()
+        _LOGGER.debug(
+            (
+                "%s: prepared %d accessories in %.3fs, built %d in %.3fs,"
+                " added triggers in %.3fs"
+            ),
+            self._name,
+            len(pending_accessories),
+            prepared - start,
+            len(self.bridge.accessories),
+            built - prepared,
+            time.monotonic() - built,
+        )
         return self.bridge
 
     async def _async_add_trigger_accessories(self) -> None:
@@ -1135,16 +1372,27 @@ class HomeKit:
         return True
 
     async def async_stop(self, *args: Any) -> None:
-        """Stop the accessory driver."""
-        if self.status != STATUS_RUNNING:
+        """Stop the accessory driver.
+
+        The storage listeners and pending writes are released as well
+        when the start failed or is still running.
+        """
+        if self.status == STATUS_STOPPED:
             return
+        was_running = self.status == STATUS_RUNNING
         async with self._reset_lock:
             self.status = STATUS_STOPPED
-            assert self._cancel_reload_dispatcher is not None
-            self._cancel_reload_dispatcher()
-            _LOGGER.debug("Driver stop for %s", self._name)
-            if self.driver:
+            if self._cancel_reload_dispatcher is not None:
+                self._cancel_reload_dispatcher()
+                self._cancel_reload_dispatcher = None
+            self._reload_debouncer.async_cancel()
+            self._pending_reload_entity_ids.clear()
+            if was_running and self.driver:
+                _LOGGER.debug("Driver stop for %s", self._name)
                 await self.driver.async_stop()
+            if self.aid_storage:
+                self.aid_storage.async_shutdown()
+            await self.persist_scheduler.async_shutdown()
 
     @callback
     def _async_configure_linked_sensors(
@@ -1219,25 +1467,23 @@ class HomeKit:
                 CONF_LINKED_HUMIDITY_SENSOR, current_humidity_sensor_entity_id
             )
 
-    async def _async_set_device_info_attributes(
+    @callback
+    def _async_set_device_info_attributes(
         self,
         ent_reg_ent: er.RegistryEntry,
         dev_reg: dr.DeviceRegistry,
         entity_id: str,
-    ) -> None:
-        """Set attributes that will be used for homekit device info."""
+    ) -> bool:
+        """Set attributes that will be used for homekit device info.
+
+        Returns False when the integration name is still needed because
+        the device registry has no manufacturer for the entity.
+        """
         ent_cfg = self._config[entity_id]
         if ent_reg_ent.device_id:
             if dev_reg_ent := dev_reg.async_get(ent_reg_ent.device_id):
                 self._fill_config_from_device_registry_entry(dev_reg_ent, ent_cfg)
-        if ATTR_MANUFACTURER not in ent_cfg:
-            try:
-                integration = await async_get_integration(
-                    self.hass, ent_reg_ent.platform
-                )
-                ent_cfg[ATTR_INTEGRATION] = integration.name
-            except IntegrationNotFound:
-                ent_cfg[ATTR_INTEGRATION] = ent_reg_ent.platform
+        return ATTR_MANUFACTURER in ent_cfg
 
     def _fill_config_from_device_registry_entry(
         self, device_entry: dr.DeviceEntry, config: dict[str, Any]
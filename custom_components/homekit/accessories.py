@@ -1,8 +1,13 @@
 # Custom Component
 """Extend the basic Accessory and Bridge functions."""
 
+import asyncio
+from functools import lru_cache
+import hashlib
+import io
 import logging
-from typing import Any, cast
+import time
+from typing import Any, NamedTuple, cast
 from uuid import UUID
 
 from pyhap.accessory import Accessory, Bridge
@@ -11,7 +16,7 @@ from pyhap.characteristic import Characteristic
 from pyhap.const import CATEGORY_OTHER
 from pyhap.iid_manager import IIDManager
 from pyhap.service import Service
-from pyhap.util import callback as pyhap_callback
+from pyhap.util import callback as pyhap_callback, to_sorted_hap_json
 
 from homeassistant.components.climate import (
     DOMAIN as CLIMATE_DOMAIN,
@@ -51,7 +56,6 @@ from homeassistant.core import (
     Context,
     Event,
     EventStateChangedData,
-    HassJobType,
     HomeAssistant,
     State,
     callback as ha_callback,
@@ -59,7 +63,7 @@ from homeassistant.core import (
 )
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.dispatcher import async_dispatcher_send
-from homeassistant.helpers.event import async_track_state_change_event
+from homeassistant.helpers.event import async_call_later
 from homeassistant.util.decorator import Registry
 
 from .aidmanager import AccessoryAidStorage
@@ -79,6 +83,7 @@ from .const import (
     CHAR_HARDWARE_REVISION,
     CHAR_NAME,
     CHAR_STATUS_LOW_BATTERY,
+    CONF_COALESCE_WINDOW,
     CONF_FEATURE_LIST,
     CONF_LINKED_BATTERY_CHARGING_SENSOR,
     CONF_LINKED_BATTERY_SENSOR,
@@ -94,6 +99,7 @@ from .const import (
     MAX_MODEL_LENGTH,
     MAX_SERIAL_LENGTH,
     MAX_VERSION_LENGTH,
+    PROFILER_DATA,
     SERV_ACCESSORY_INFO,
     SERV_BATTERY_SERVICE,
     SIGNAL_RELOAD_ENTITIES,
@@ -126,6 +132,11 @@ from .custom_devices.const import (
     DEVICE_TUYA_STAR_PROJECTOR,
 )
 from .iidmanager import AccessoryIIDStorage
+from .persist import HomePersistScheduler
+from .profiler import HomeKitProfiler
+from .snapshot_scheduler import BridgeSnapshotScheduler
+from .state_dispatcher import HomeStateDispatcher
+from .stats import LatencyHistogram
 from .util import (
     accessory_friendly_name,
     async_dismiss_setup_message,
@@ -166,6 +177,115 @@ CLIMATE_TYPES = {
     TYPE_HEATER_COOLER: "HeaterCooler",
     TYPE_THERMOSTAT: "Thermostat",
 }
+# Domains whose accessory type can be chosen with CONF_TYPE
+CONFIG_TYPES = {
+    "climate": CLIMATE_TYPES,
+    "fan": FAN_TYPES,
+    "switch": SWITCH_TYPES,
+}
+# Accessory types that only depend on the domain
+DOMAIN_TYPES = {
+    "alarm_control_panel": "SecuritySystem",
+    "automation": "Switch",
+    "binary_sensor": "BinarySensor",
+    "button": "Switch",
+    "camera": "Camera",
+    "climate": CLIMATE_TYPES[TYPE_THERMOSTAT],
+    "device_tracker": "BinarySensor",
+    "fan": FAN_TYPES[TYPE_FAN],
+    "humidifier": "HumidifierDehumidifier",
+    "input_boolean": "Switch",
+    "input_button": "Switch",
+    "input_select": "SelectSwitch",
+    "light": "Light",
+    "lock": "Lock",
+    "person": "BinarySensor",
+    "remote": "Switch",
+    "scene": "Switch",
+    "script": "Switch",
+    "select": "SelectSwitch",
+    "switch": SWITCH_TYPES[TYPE_SWITCH],
+    "vacuum": "Vacuum",
+    "valve": "Valve",
+    "water_heater": "WaterHeater",
+}
+# Accessory types that take precedence over DOMAIN_TYPES for a device class
+DEVICE_CLASS_TYPES = {
+    ("media_player", MediaPlayerDeviceClass.RECEIVER): "ReceiverMediaPlayer",
+    ("media_player", MediaPlayerDeviceClass.TV): "TelevisionMediaPlayer",
+    ("media_player", MediaPlayerDeviceClass.PROJECTOR): "TelevisionMediaPlayer",
+    ("switch", SwitchDeviceClass.OUTLET): SWITCH_TYPES[TYPE_OUTLET],
+}
+
+
+class _FeatureRule(NamedTuple):
+    """Accessory type for entities supporting any (or all) features of mask."""
+
+    a_type: str
+    mask: int
+    device_classes: tuple[str, ...] | None = None
+    match_all: bool = False
+
+
+# Checked in order, the first matching rule wins
+FEATURE_TYPE_RULES: dict[str, tuple[_FeatureRule, ...]] = {
+    "cover": (
+        _FeatureRule(
+            "GarageDoorOpener",
+            CoverEntityFeature.OPEN | CoverEntityFeature.CLOSE,
+            (CoverDeviceClass.GARAGE, CoverDeviceClass.GATE),
+        ),
+        _FeatureRule(
+            "Window", CoverEntityFeature.SET_POSITION, (CoverDeviceClass.WINDOW,)
+        ),
+        _FeatureRule("Door", CoverEntityFeature.SET_POSITION, (CoverDeviceClass.DOOR,)),
+        _FeatureRule("WindowCovering", CoverEntityFeature.SET_POSITION),
+        _FeatureRule(
+            "WindowCoveringBasic", CoverEntityFeature.OPEN | CoverEntityFeature.CLOSE
+        ),
+        # WindowCovering and WindowCoveringBasic both support tilt
+        # only WindowCovering can handle the covers that are missing
+        # CoverEntityFeature.SET_POSITION, CoverEntityFeature.OPEN,
+        # and CoverEntityFeature.CLOSE
+        _FeatureRule("WindowCovering", CoverEntityFeature.SET_TILT_POSITION),
+    ),
+    "lawn_mower": (
+        _FeatureRule(
+            "LawnMower",
+            LawnMowerEntityFeature.DOCK | LawnMowerEntityFeature.START_MOWING,
+            match_all=True,
+        ),
+    ),
+    "remote": (_FeatureRule("ActivityRemote", RemoteEntityFeature.ACTIVITY),),
+}
+# (device_class, unit) rules for sensors, None matches any value.
+# Checked in order, the first matching rule wins.
+SENSOR_TYPE_RULES: tuple[tuple[str | None, str | None, str], ...] = (
+    (None, UnitOfTemperature.CELSIUS, "TemperatureSensor"),
+    (None, UnitOfTemperature.FAHRENHEIT, "TemperatureSensor"),
+    (SensorDeviceClass.TEMPERATURE, None, "TemperatureSensor"),
+    (SensorDeviceClass.HUMIDITY, PERCENTAGE, "HumiditySensor"),
+    (SensorDeviceClass.PM10, None, "PM10Sensor"),
+    (SensorDeviceClass.PM25, None, "PM25Sensor"),
+    (SensorDeviceClass.NITROGEN_DIOXIDE, None, "NitrogenDioxideSensor"),
+    (
+        SensorDeviceClass.VOLATILE_ORGANIC_COMPOUNDS,
+        None,
+        "VolatileOrganicCompoundsSensor",
+    ),
+    (SensorDeviceClass.GAS, None, "AirQualitySensor"),
+    (SensorDeviceClass.CO, None, "CarbonMonoxideSensor"),
+    (SensorDeviceClass.CO2, None, "CarbonDioxideSensor"),
+    (SensorDeviceClass.ILLUMINANCE, None, "LightSensor"),
+    (None, LIGHT_LUX, "LightSensor"),
+)
+SENSOR_ENTITY_ID_FALLBACKS = (
+    (SensorDeviceClass.PM10, "PM10Sensor"),
+    (SensorDeviceClass.PM25, "PM25Sensor"),
+    (SensorDeviceClass.GAS, "AirQualitySensor"),
+    ("co2", "CarbonDioxideSensor"),
+)
+
 TYPES: Registry[str, type[HomeAccessory]] = Registry()
 
 RELOAD_ON_CHANGE_ATTRS = (
@@ -271,7 +391,7 @@ def _async_resolve_climate_type(
     return None
 
 
-def get_accessory(  # noqa: C901
+def get_accessory(
     hass: HomeAssistant, driver: HomeDriver, state: State, aid: int | None, config: dict
 ) -> HomeAccessory | None:
     """Take state and return an accessory object if supported."""
@@ -285,10 +405,17 @@ def get_accessory(  # noqa: C901
         )
         return None
 
-    a_type = None
     name = config.get(CONF_NAME, state.name)
+    if (a_type := get_accessory_type(state, config)) is None:
+        return None
+
+    _LOGGER.debug('Add "%s" as "%s"', state.entity_id, a_type)
+    return TYPES[a_type](hass, driver, name, state.entity_id, aid, config)
+
+
+def get_accessory_type(state: State, config: dict) -> str | None:
+    """Return the name of the accessory type for a state, if supported."""
     domain = config.get(CONF_DEVICE, state.domain)
-    features = state.attributes.get(ATTR_SUPPORTED_FEATURES, 0)
 
     if domain in CUSTOM_DEVICES:
         _LOGGER.debug(
@@ -296,177 +423,76 @@ def get_accessory(  # noqa: C901
             domain,
             state.entity_id,
         )
-        a_type = CUSTOM_DEVICES[domain]
-
-    elif domain == "alarm_control_panel":
-        a_type = "SecuritySystem"
-
-    elif domain in ("binary_sensor", "device_tracker", "person"):
-        a_type = "BinarySensor"
-
-    elif domain == "climate":
-        # The type is resolved by the bridge before the accessory is created.
-        a_type = CLIMATE_TYPES[config.get(CONF_TYPE, TYPE_THERMOSTAT)]
-
-    elif domain == "cover":
-        device_class = state.attributes.get(ATTR_DEVICE_CLASS)
-
-        if device_class in (
-            CoverDeviceClass.GARAGE,
-            CoverDeviceClass.GATE,
-        ) and features & (CoverEntityFeature.OPEN | CoverEntityFeature.CLOSE):
-            a_type = "GarageDoorOpener"
-        elif (
-            device_class == CoverDeviceClass.WINDOW
-            and features & CoverEntityFeature.SET_POSITION
-        ):
-            a_type = "Window"
-        elif (
-            device_class == CoverDeviceClass.DOOR
-            and features & CoverEntityFeature.SET_POSITION
-        ):
-            a_type = "Door"
-        elif features & CoverEntityFeature.SET_POSITION:
-            a_type = "WindowCovering"
-        elif features & (CoverEntityFeature.OPEN | CoverEntityFeature.CLOSE):
-            a_type = "WindowCoveringBasic"
-        elif features & CoverEntityFeature.SET_TILT_POSITION:
-            # WindowCovering and WindowCoveringBasic both support tilt
-            # only WindowCovering can handle the covers that are missing
-            # CoverEntityFeature.SET_POSITION, CoverEntityFeature.OPEN,
-            # and CoverEntityFeature.CLOSE
-            a_type = "WindowCovering"
-
-    elif domain == "fan":
-        if fan_type := config.get(CONF_TYPE):
-            a_type = FAN_TYPES[fan_type]
-        else:
-            a_type = "Fan"
-
-    elif domain == "humidifier":
-        a_type = "HumidifierDehumidifier"
+        return CUSTOM_DEVICES[domain]
 
-    elif domain == "light":
-        a_type = "Light"
-
-    elif domain == "lock":
-        a_type = "Lock"
+    # The climate type is resolved by the bridge before the accessory is created.
+    if (config_types := CONFIG_TYPES.get(domain)) and (
+        config_type := config.get(CONF_TYPE)
+    ):
+        return config_types[config_type]
 
-    elif domain == "media_player":
-        device_class = state.attributes.get(ATTR_DEVICE_CLASS)
-        feature_list = config.get(CONF_FEATURE_LIST, [])
+    attributes = state.attributes
+    device_class = attributes.get(ATTR_DEVICE_CLASS)
+    unit = attributes.get(ATTR_UNIT_OF_MEASUREMENT)
+    a_type = _get_attributes_accessory_type(
+        domain, device_class, unit, attributes.get(ATTR_SUPPORTED_FEATURES, 0)
+    )
+    if a_type is not None:
+        return a_type
 
-        if device_class == MediaPlayerDeviceClass.RECEIVER:
-            a_type = "ReceiverMediaPlayer"
-        elif device_class in (
-            MediaPlayerDeviceClass.TV,
-            MediaPlayerDeviceClass.PROJECTOR,
-        ):
-            a_type = "TelevisionMediaPlayer"
-        elif validate_media_player_features(state, feature_list):
-            a_type = "MediaPlayer"
+    if domain == "media_player":
+        if validate_media_player_features(state, config.get(CONF_FEATURE_LIST, [])):
+            return "MediaPlayer"
 
     elif domain == "sensor":
-        device_class = state.attributes.get(ATTR_DEVICE_CLASS)
-        unit = state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
-
-        if device_class == SensorDeviceClass.TEMPERATURE or unit in (
-            UnitOfTemperature.CELSIUS,
-            UnitOfTemperature.FAHRENHEIT,
-        ):
-            a_type = "TemperatureSensor"
-        elif device_class == SensorDeviceClass.HUMIDITY and unit == PERCENTAGE:
-            a_type = "HumiditySensor"
-        elif device_class == SensorDeviceClass.PM10:
-            a_type = "PM10Sensor"
-        elif device_class == SensorDeviceClass.PM25:
-            a_type = "PM25Sensor"
-        elif device_class == SensorDeviceClass.NITROGEN_DIOXIDE:
-            a_type = "NitrogenDioxideSensor"
-        elif device_class == SensorDeviceClass.VOLATILE_ORGANIC_COMPOUNDS:
-            a_type = "VolatileOrganicCompoundsSensor"
-        elif device_class == SensorDeviceClass.GAS:
-            a_type = "AirQualitySensor"
-        elif device_class == SensorDeviceClass.CO:
-            a_type = "CarbonMonoxideSensor"
-        elif device_class == SensorDeviceClass.CO2:
-            a_type = "CarbonDioxideSensor"
-        elif device_class == SensorDeviceClass.ILLUMINANCE or unit == LIGHT_LUX:
-            a_type = "LightSensor"
-
         # Fallbacks based on entity_id
-        elif SensorDeviceClass.PM10 in state.entity_id:
-            a_type = "PM10Sensor"
-        elif SensorDeviceClass.PM25 in state.entity_id:
-            a_type = "PM25Sensor"
-        elif SensorDeviceClass.GAS in state.entity_id:
-            a_type = "AirQualitySensor"
-        elif "co2" in state.entity_id:
-            a_type = "CarbonDioxideSensor"
-
-        else:
-            _LOGGER.debug(
-                "%s: Unsupported sensor type (device_class=%s) (unit=%s)",
-                state.entity_id,
-                device_class,
-                unit,
-            )
-
-    elif domain == "switch":
-        if switch_type := config.get(CONF_TYPE):
-            a_type = SWITCH_TYPES[switch_type]
-        elif state.attributes.get(ATTR_DEVICE_CLASS) == SwitchDeviceClass.OUTLET:
-            a_type = "Outlet"
-        else:
-            a_type = "Switch"
-
-    elif domain == "valve":
-        a_type = "Valve"
-
-    elif domain == "vacuum":
-        a_type = "Vacuum"
+        for fragment, fallback_type in SENSOR_ENTITY_ID_FALLBACKS:
+            if fragment in state.entity_id:
+                return fallback_type
+        _LOGGER.debug(
+            "%s: Unsupported sensor type (device_class=%s) (unit=%s)",
+            state.entity_id,
+            device_class,
+            unit,
+        )
 
-    elif (
-        domain == "lawn_mower"
-        and features & LawnMowerEntityFeature.DOCK
-        and features & LawnMowerEntityFeature.START_MOWING
-    ):
-        a_type = "LawnMower"
-
-    elif domain == "remote" and features & RemoteEntityFeature.ACTIVITY:
-        a_type = "ActivityRemote"
-
-    elif domain in (
-        "automation",
-        "button",
-        "input_boolean",
-        "input_button",
-        "remote",
-        "scene",
-        "script",
-    ):
-        a_type = "Switch"
+    return None
 
-    elif domain in ("input_select", "select"):
-        a_type = "SelectSwitch"
 
-    elif domain == "water_heater":
-        a_type = "WaterHeater"
+@lru_cache(maxsize=512)
+def _get_attributes_accessory_type(
+    domain: str, device_class: str | None, unit: str | None, features: int
+) -> str | None:
+    """Resolve the accessory type from the type tables.
 
-    elif domain == "camera":
-        a_type = "Camera"
+    Only depends on the arguments, so the result is cached and the
+    tables are walked once per distinct combination.
+    """
+    for rule in FEATURE_TYPE_RULES.get(domain, ()):
+        if (rule.device_classes is None or device_class in rule.device_classes) and (
+            features & rule.mask == rule.mask
+            if rule.match_all
+            else features & rule.mask
+        ):
+            return rule.a_type
 
-    if a_type is None:
+    if domain == "sensor":
+        for rule_device_class, rule_unit, a_type in SENSOR_TYPE_RULES:
+            if rule_device_class in (None, device_class) and rule_unit in (None, unit):
+                return a_type
         return None
 
-    _LOGGER.debug('Add "%s" as "%s"', state.entity_id, a_type)
-    return TYPES[a_type](hass, driver, name, state.entity_id, aid, config)
+    if a_type := DEVICE_CLASS_TYPES.get((domain, device_class)):
+        return a_type
+    return DOMAIN_TYPES.get(domain)
 
 
 class HomeAccessory(Accessory):  # type: ignore[misc]
     """Adapter class for Accessory."""
 
     driver: HomeDriver
+    # The attributes async_update_state reads, None when it may read any
+    relevant_attributes: frozenset[str] | None = None
 
     def __init__(
         self,
@@ -491,7 +517,26 @@ class HomeAccessory(Accessory):  # type: ignore[misc]
             **kwargs,
         )
         self._reload_on_change_attrs = list(RELOAD_ON_CHANGE_ATTRS)
+        # Battery attributes are read by async_update_state_callback
+        self._update_attrs: tuple[str, ...] | None = (
+            None
+            if self.relevant_attributes is None
+            else tuple(
+                self.relevant_attributes | {ATTR_BATTERY_CHARGING, ATTR_BATTERY_LEVEL}
+            )
+        )
+        self.state_events = 0
+        self.skipped_state_updates = 0
+        self.char_notifications = 0
+        self.reload_requests = 0
+        self.service_call_failures = 0
+        self.service_call_latency = LatencyHistogram()
         self.config = config or {}
+        # Opt-in window to send only the latest value of each characteristic
+        self._coalesce_window: float = self.config.get(CONF_COALESCE_WINDOW, 0)
+        self._coalesced: dict[Characteristic, Any] = {}
+        self._cancel_coalesce_flush: CALLBACK_TYPE | None = None
+        self.coalesced_notifications = 0
         if device_id:
             self.device_id: str | None = device_id
             serial_number = device_id
@@ -647,11 +692,9 @@ class HomeAccessory(Accessory):  # type: ignore[misc]
             self.async_update_state_callback(state)
         self._update_available_from_state(state)
         self._subscriptions.append(
-            async_track_state_change_event(
-                self.hass,
-                [self.entity_id],
+            self.driver.state_dispatcher.async_track_entity(
+                self.entity_id,
                 self.async_update_event_state_callback,
-                job_type=HassJobType.Callback,
             )
         )
 
@@ -667,11 +710,9 @@ class HomeAccessory(Accessory):  # type: ignore[misc]
                 ATTR_BATTERY_CHARGING
             )
             self._subscriptions.append(
-                async_track_state_change_event(
-                    self.hass,
-                    [self.linked_battery_sensor],
+                self.driver.state_dispatcher.async_track_entity(
+                    self.linked_battery_sensor,
                     self.async_update_linked_battery_callback,
-                    job_type=HassJobType.Callback,
                 )
             )
         elif state is not None:
@@ -680,11 +721,9 @@ class HomeAccessory(Accessory):  # type: ignore[misc]
             state = self.hass.states.get(self.linked_battery_charging_sensor)
             battery_charging_state = state and state.state == STATE_ON
             self._subscriptions.append(
-                async_track_state_change_event(
-                    self.hass,
-                    [self.linked_battery_charging_sensor],
+                self.driver.state_dispatcher.async_track_entity(
+                    self.linked_battery_charging_sensor,
                     self.async_update_linked_battery_charging_callback,
-                    job_type=HassJobType.Callback,
                 )
             )
         elif battery_charging_state is None and state is not None:
@@ -698,6 +737,7 @@ class HomeAccessory(Accessory):  # type: ignore[misc]
         self, event: Event[EventStateChangedData]
     ) -> None:
         """Handle state change event listener callback."""
+        self.state_events += 1
         new_state = event.data["new_state"]
         old_state = event.data["old_state"]
         self._update_available_from_state(new_state)
@@ -720,6 +760,17 @@ class HomeAccessory(Accessory):  # type: ignore[misc]
                     )
                     self.async_reload()
                     return
+            if (
+                (update_attrs := self._update_attrs) is not None
+                and old_state.state == new_state.state
+                and all(
+                    old_attributes.get(attr) == new_attributes.get(attr)
+                    for attr in update_attrs
+                )
+            ):
+                # Only attributes the accessory does not use changed
+                self.skipped_state_updates += 1
+                return
         self.async_update_state_callback(new_state)
 
     @ha_callback
@@ -808,6 +859,41 @@ class HomeAccessory(Accessory):  # type: ignore[misc]
         """
         raise NotImplementedError
 
+    def publish(
+        self,
+        value: Any,
+        sender: Characteristic,
+        sender_client_addr: tuple[str, int] | None = None,
+        immediate: bool = False,
+    ) -> None:
+        """Publish a characteristic value, coalescing it when configured.
+
+        Event characteristics like doorbells and programmable switches
+        are published immediately, as are values set by a controller.
+        """
+        self.char_notifications += 1
+        if not self._coalesce_window or immediate or sender_client_addr:
+            # A pending value is older and must not overwrite this one
+            self._coalesced.pop(sender, None)
+            super().publish(value, sender, sender_client_addr, immediate)
+            return
+        if sender in self._coalesced:
+            self.coalesced_notifications += 1
+        self._coalesced[sender] = value
+        if self._cancel_coalesce_flush is None:
+            self._cancel_coalesce_flush = async_call_later(
+                self.hass, self._coalesce_window, self._async_flush_coalesced
+            )
+
+    @ha_callback
+    def _async_flush_coalesced(self, _now: Any) -> None:
+        """Publish the latest value of each coalesced characteristic."""
+        self._cancel_coalesce_flush = None
+        coalesced = self._coalesced
+        self._coalesced = {}
+        for char, value in coalesced.items():
+            super().publish(value, char)
+
     @ha_callback
     def async_call_service(
         self,
@@ -846,6 +932,7 @@ class HomeAccessory(Accessory):  # type: ignore[misc]
 
         self.hass.bus.async_fire(EVENT_HOMEKIT_CHANGED, event_data, context=context)
 
+        start = time.perf_counter()
         try:
             await self.hass.services.async_call(
                 domain, service, service_data, blocking=True, context=context
@@ -866,7 +953,10 @@ class HomeAccessory(Accessory):  # type: ignore[misc]
                 service,
             )
         else:
+            self.service_call_latency.add(time.perf_counter() - start)
             return True
+        self.service_call_latency.add(time.perf_counter() - start)
+        self.service_call_failures += 1
         # This coroutine often runs fire-and-forget, so failures must be
         # logged here instead of by the loop's default task handler.
         try:
@@ -887,17 +977,38 @@ class HomeAccessory(Accessory):  # type: ignore[misc]
 
         Update the c# value in the mDNS record.
         """
+        self.reload_requests += 1
         async_dispatcher_send(
             self.hass,
             SIGNAL_RELOAD_ENTITIES.format(self.driver.entry_id),
             (self.entity_id,),
         )
 
+    @ha_callback
+    def async_get_stats(self) -> dict[str, Any]:
+        """Return the counters of the accessory."""
+        stats: dict[str, Any] = {
+            "state_events": self.state_events,
+            "char_notifications": self.char_notifications,
+            "reload_requests": self.reload_requests,
+            "service_calls": self.service_call_latency.as_dict(),
+            "service_call_failures": self.service_call_failures,
+        }
+        if self.relevant_attributes is not None:
+            stats["skipped_state_updates"] = self.skipped_state_updates
+        if self._coalesce_window:
+            stats["coalesced_notifications"] = self.coalesced_notifications
+        return stats
+
     @ha_callback
     def async_stop(self) -> None:
         """Cancel any subscriptions when the bridge is stopped."""
         while self._subscriptions:
             self._subscriptions.pop(0)()
+        if self._cancel_coalesce_flush is not None:
+            self._cancel_coalesce_flush()
+            self._cancel_coalesce_flush = None
+        self._coalesced.clear()
 
     async def stop(self) -> None:
         """Stop the accessory.
@@ -923,6 +1034,7 @@ class HomeBridge(Bridge):  # type: ignore[misc]
             serial_number=BRIDGE_SERIAL_NUMBER,
         )
         self.hass = hass
+        self.snapshot_scheduler = BridgeSnapshotScheduler(hass)
 
     def setup_message(self) -> None:
         """Prevent print of pyhap setup message to terminal."""
@@ -936,7 +1048,9 @@ class HomeBridge(Bridge):  # type: ignore[misc]
                 "Got a request for snapshot, but the Accessory "
                 'does not define a "async_get_snapshot" method'
             )
-        return cast(bytes, await acc.async_get_snapshot(info))
+        return await self.snapshot_scheduler.async_get_snapshot(
+            acc.async_get_snapshot, info, getattr(acc, "snapshots_cached", False)
+        )
 
 
 class HomeDriver(AccessoryDriver):  # type: ignore[misc]
@@ -949,6 +1063,8 @@ class HomeDriver(AccessoryDriver):  # type: ignore[misc]
         bridge_name: str,
         entry_title: str,
         iid_storage: AccessoryIIDStorage,
+        state_dispatcher: HomeStateDispatcher,
+        persist_scheduler: HomePersistScheduler,
         **kwargs: Any,
     ) -> None:
         """Initialize a AccessoryDriver object."""
@@ -960,6 +1076,128 @@ class HomeDriver(AccessoryDriver):  # type: ignore[misc]
         self._bridge_name = bridge_name
         self._entry_title = entry_title
         self.iid_storage = iid_storage
+        self.state_dispatcher = state_dispatcher
+        self.persist_scheduler = persist_scheduler
+        self.profiler: HomeKitProfiler = hass.data[PROFILER_DATA]
+        self._accessory_digests: dict[int, tuple[Accessory, bytes]] = {}
+        self._config_fetch_waiters: list[tuple[set[UUID], asyncio.Future[None]]] = []
+
+    @pyhap_callback  # type: ignore[untyped-decorator]
+    def async_persist(self) -> None:
+        """Persist the state with the next flush of the storage files."""
+        self.persist_scheduler.async_schedule_state(
+            self._serialize_state, self.persist_file
+        )
+
+    def _serialize_state(self) -> str:
+        """Serialize the pyhap state the way pyhap persists it."""
+        buffer = io.StringIO()
+        self.encoder.persist(buffer, self.state)
+        return buffer.getvalue()
+
+    def set_characteristics(
+        self, chars_query: dict[str, Any], client_addr: tuple[str, int]
+    ) -> dict[str, Any]:
+        """Set characteristics from a controller, profiled when enabled."""
+        with self.profiler.scope():
+            return cast(
+                dict[str, Any], super().set_characteristics(chars_query, client_addr)
+            )
+
+    def get_accessories(self, include_value: bool = True) -> dict[str, Any]:
+        """Return the accessories and release config fetch waiters.
+
+        Only a fetch by a controller releases the waiters, so other
+        callers such as diagnostics do not end the wait.
+        """
+        hap_rep = cast(dict[str, Any], super().get_accessories(include_value))
+        if self._config_fetch_waiters and (
+            controller := self._async_get_fetching_controller()
+        ):
+            self._async_config_fetched(controller)
+        return hap_rep
+
+    @ha_callback
+    def _async_get_fetching_controller(self) -> UUID | None:
+        """Return the controller whose accessories request is being handled.
+
+        pyhap handles each request synchronously in the event loop and
+        only sets the response of the handler while handling it.
+        """
+        for hap_proto in self.http_server.connections.values():
+            if (
+                (handler := hap_proto.handler) is not None
+                and handler.response is not None
+                and handler.parsed_url.path == "/accessories"
+            ):
+                return cast(UUID | None, handler.client_uuid)
+        return None
+
+    @ha_callback
+    def _async_get_connected_controllers(self) -> set[UUID]:
+        """Return the paired controllers with an encrypted connection."""
+        return {
+            handler.client_uuid
+            for hap_proto in self.http_server.connections.values()
+            if (handler := hap_proto.handler) is not None
+            and handler.is_encrypted
+            and handler.client_uuid is not None
+        }
+
+    @ha_callback
+    def _async_config_fetched(self, controller: UUID) -> None:
+        """Release the waiters once every awaited controller fetched."""
+        for pending, waiter in self._config_fetch_waiters:
+            pending.discard(controller)
+            if not pending and not waiter.done():
+                waiter.set_result(None)
+
+    async def async_wait_for_config_fetch(self, timeout: float) -> bool:
+        """Wait for the connected controllers to fetch the current config.
+
+        Controllers are tracked by their pairing id instead of their
+        connection, since a controller can reconnect to fetch. Returns
+        False if not every controller fetched it within timeout.
+        """
+        if not (pending := self._async_get_connected_controllers()):
+            return True
+        waiter: asyncio.Future[None] = self.hass.loop.create_future()
+        entry = (pending, waiter)
+        self._config_fetch_waiters.append(entry)
+        try:
+            async with asyncio.timeout(timeout):
+                await waiter
+        except TimeoutError:
+            return False
+        finally:
+            self._config_fetch_waiters.remove(entry)
+        return True
+
+    @property
+    def accessories_hash(self) -> str:
+        """Hash the accessories layout to track configuration changes.
+
+        pyhap serializes every accessory on each call. The layout of an
+        accessory only changes when it is recreated, so the digest of each
+        accessory is cached until the accessory object is replaced.
+        """
+        accessory = self.accessory
+        accessories: list[Accessory] = [accessory]
+        if isinstance(accessory, Bridge):
+            accessories.extend(accessory.accessories.values())
+        digests: dict[int, tuple[Accessory, bytes]] = {}
+        combined = hashlib.sha512()
+        for acc in sorted(accessories, key=lambda acc: acc.aid):
+            cached = self._accessory_digests.get(acc.aid)
+            if cached is None or cached[0] is not acc:
+                # Call the base class since the bridge includes its
+                # accessories in its own representation.
+                hap_rep = Accessory.to_HAP(acc, include_value=False)
+                cached = (acc, hashlib.sha512(to_sorted_hap_json(hap_rep)).digest())
+            digests[acc.aid] = cached
+            combined.update(cached[1])
+        self._accessory_digests = digests
+        return combined.hexdigest()
 
     @pyhap_callback  # type: ignore[untyped-decorator]
     def pair(
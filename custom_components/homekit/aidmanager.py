@@ -9,19 +9,19 @@ can't change the hash without causing breakages for HA users.
 This module generates and stores them in a HA storage.
 """
 
-from collections.abc import Generator
+from collections.abc import Generator, Iterable
 import random
 
 from fnv_hash_fast import fnv1a_32
 
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
 from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.storage import Store
 
+from .persist import HomePersistScheduler
 from .util import get_aid_storage_filename_for_entry_id
 
 AID_MANAGER_STORAGE_VERSION = 1
-AID_MANAGER_SAVE_DELAY = 2
 
 ALLOCATIONS_KEY = "allocations"
 UNIQUE_IDS_KEY = "unique_ids"
@@ -32,6 +32,9 @@ INVALID_AIDS = (0, 1)
 AID_MIN = 2
 AID_MAX = 18446744073709551615
 
+# Changes that can move an entity to other storage keys
+_RELEVANT_CHANGES = {"entity_id", "platform", "previous_unique_id", "unique_id"}
+
 
 def get_system_unique_id(entity: er.RegistryEntry, entity_unique_id: str) -> str:
     """Determine the system wide unique_id for an entity."""
@@ -65,15 +68,24 @@ class AccessoryAidStorage:
     persist over reboots.
     """
 
-    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry_id: str,
+        persist_scheduler: HomePersistScheduler,
+    ) -> None:
         """Create a new entity map store."""
         self.hass = hass
+        self._persist_scheduler = persist_scheduler
         self.allocations: dict[str, int] = {}
-        self.allocated_aids: set[int] = set()
+        # Reverse map of allocations
+        self.aid_storage_keys: dict[int, str] = {}
         self.accessory_types: dict[str, str] = {}
         self._entry_id = entry_id
         self.store: Store | None = None
         self._entity_registry = er.async_get(hass)
+        self._entity_storage_keys: dict[str, tuple[str, ...]] = {}
+        self._cancel_registry_listener: CALLBACK_TYPE | None = None
 
     async def async_initialize(self) -> None:
         """Load the latest AID data."""
@@ -85,22 +97,61 @@ class AccessoryAidStorage:
             return
         assert isinstance(raw_storage, dict)
         self.allocations = raw_storage.get(ALLOCATIONS_KEY, {})
-        self.allocated_aids = set(self.allocations.values())
+        self.aid_storage_keys = {
+            aid: storage_key for storage_key, aid in self.allocations.items()
+        }
         self.accessory_types = raw_storage.get(ACCESSORY_TYPES_KEY, {})
 
+    @callback
+    def async_setup(self) -> None:
+        """Listen for entity registry updates."""
+        self._cancel_registry_listener = self.hass.bus.async_listen(
+            er.EVENT_ENTITY_REGISTRY_UPDATED, self._async_entity_registry_updated
+        )
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Stop listening for entity registry updates."""
+        if self._cancel_registry_listener is not None:
+            self._cancel_registry_listener()
+            self._cancel_registry_listener = None
+        self._entity_storage_keys.clear()
+
+    @callback
+    def _async_entity_registry_updated(
+        self, event: Event[er.EventEntityRegistryUpdatedData]
+    ) -> None:
+        """Drop the cached storage keys of an updated entity."""
+        data = event.data
+        if data["action"] == "update":
+            if not _RELEVANT_CHANGES.intersection(data["changes"]):
+                return
+            if old_entity_id := data.get("old_entity_id"):
+                self._entity_storage_keys.pop(old_entity_id, None)
+        self._entity_storage_keys.pop(data["entity_id"], None)
+
     def _stable_storage_keys(self, entity_id: str) -> tuple[str, ...]:
         """Return the keys the entity's stable identity can resolve to.
 
         The preferred key comes first, matching the aid allocation
-        preference for the system unique id over the entity id.
+        preference for the system unique id over the entity id. The
+        system unique id and previous unique id, when present, precede
+        the entity id.
         """
+        if (keys := self._entity_storage_keys.get(entity_id)) is not None:
+            return keys
         if not (entry := self._entity_registry.async_get(entity_id)):
-            return (entity_id,)
-        keys = [get_system_unique_id(entry, entry.unique_id)]
-        if previous_unique_id := entry.previous_unique_id:
-            keys.append(get_system_unique_id(entry, previous_unique_id))
-        keys.append(entity_id)
-        return tuple(keys)
+            keys = (entity_id,)
+        elif previous_unique_id := entry.previous_unique_id:
+            keys = (
+                get_system_unique_id(entry, entry.unique_id),
+                get_system_unique_id(entry, previous_unique_id),
+                entity_id,
+            )
+        else:
+            keys = (get_system_unique_id(entry, entry.unique_id), entity_id)
+        self._entity_storage_keys[entity_id] = keys
+        return keys
 
     @callback
     def async_set_accessory_type(
@@ -142,12 +193,35 @@ class AccessoryAidStorage:
 
     def get_or_allocate_aid_for_entity_id(self, entity_id: str) -> int:
         """Generate a stable aid for an entity id."""
-        if not (entry := self._entity_registry.async_get(entity_id)):
+        if len(keys := self._stable_storage_keys(entity_id)) == 1:
             return self.get_or_allocate_aid(None, entity_id)
 
-        sys_unique_id = get_system_unique_id(entry, entry.unique_id)
-        self._migrate_unique_id_aid_assignment_if_needed(sys_unique_id, entry)
-        return self.get_or_allocate_aid(sys_unique_id, entity_id)
+        if self._migrate_unique_id_aid_assignment_if_needed(keys):
+            self.async_schedule_save()
+        return self.get_or_allocate_aid(keys[0], entity_id)
+
+    @callback
+    def async_get_or_allocate_aids(self, entity_ids: Iterable[str]) -> dict[str, int]:
+        """Generate stable aids for many entity ids in one pass.
+
+        Migrates previous unique ids and allocates the missing aids like
+        get_or_allocate_aid_for_entity_id, but schedules a single save for
+        the whole batch.
+        """
+        aids: dict[str, int] = {}
+        changed = False
+        for entity_id in entity_ids:
+            keys = self._stable_storage_keys(entity_id)
+            unique_id = keys[0] if len(keys) > 1 else None
+            if self._migrate_unique_id_aid_assignment_if_needed(keys):
+                changed = True
+            if (aid := self._get_aid(unique_id, entity_id)) is None:
+                aid = self._allocate_aid(unique_id, entity_id)
+                changed = True
+            aids[entity_id] = aid
+        if changed:
+            self.async_schedule_save()
+        return aids
 
     def entity_is_allocated(self, entity_id: str) -> bool:
         """Return True when the entity already has an allocated aid.
@@ -159,34 +233,46 @@ class AccessoryAidStorage:
         return self.get_allocated_aid_for_entity_id(entity_id) is not None
 
     def _migrate_unique_id_aid_assignment_if_needed(
-        self, sys_unique_id: str, entry: er.RegistryEntry
-    ) -> None:
-        """Migrate the unique id aid assignment if its changed."""
-        if sys_unique_id in self.allocations or not (
-            previous_unique_id := entry.previous_unique_id
-        ):
-            return
-        old_sys_unique_id = get_system_unique_id(entry, previous_unique_id)
-        if aid := self.allocations.pop(old_sys_unique_id, None):
-            self.allocations[sys_unique_id] = aid
-            self.async_schedule_save()
+        self, keys: tuple[str, ...]
+    ) -> bool:
+        """Migrate the unique id aid assignment if its changed.
+
+        Returns True if the allocations changed and need to be saved.
+        """
+        # Only an entity with a previous unique id has three keys
+        if len(keys) != 3 or keys[0] in self.allocations:
+            return False
+        sys_unique_id, old_sys_unique_id, _ = keys
+        if not (aid := self.allocations.pop(old_sys_unique_id, None)):
+            return False
+        self.allocations[sys_unique_id] = aid
+        self.aid_storage_keys[aid] = sys_unique_id
+        return True
 
     def get_or_allocate_aid(self, unique_id: str | None, entity_id: str) -> int:
         """Allocate (and return) a new aid for an accessory."""
+        if (aid := self._get_aid(unique_id, entity_id)) is not None:
+            return aid
+        aid = self._allocate_aid(unique_id, entity_id)
+        self.async_schedule_save()
+        return aid
+
+    def _get_aid(self, unique_id: str | None, entity_id: str) -> int | None:
+        """Return the aid allocated to the unique id or entity id."""
         if unique_id and unique_id in self.allocations:
             return self.allocations[unique_id]
-        if entity_id in self.allocations:
-            return self.allocations[entity_id]
+        return self.allocations.get(entity_id)
 
+    def _allocate_aid(self, unique_id: str | None, entity_id: str) -> int:
+        """Allocate a new aid without scheduling a save."""
         for aid in _generate_aids(unique_id, entity_id):
             if aid in INVALID_AIDS:
                 continue
-            if aid not in self.allocated_aids:
+            if aid not in self.aid_storage_keys:
                 # Prefer the unique_id over the entitiy_id
                 storage_key = unique_id or entity_id
                 self.allocations[storage_key] = aid
-                self.allocated_aids.add(aid)
-                self.async_schedule_save()
+                self.aid_storage_keys[aid] = storage_key
                 return aid
 
         raise ValueError(
@@ -217,14 +303,22 @@ class AccessoryAidStorage:
             return
 
         aid = self.allocations.pop(storage_key)
-        self.allocated_aids.discard(aid)
+        self.aid_storage_keys.pop(aid, None)
+        self.async_schedule_save()
+
+    @callback
+    def async_delete_aid_allocation(self, aid: int) -> None:
+        """Delete the allocation of an aid, found through the reverse map."""
+        if (storage_key := self.aid_storage_keys.pop(aid, None)) is None:
+            return
+        del self.allocations[storage_key]
         self.async_schedule_save()
 
     @callback
     def async_schedule_save(self) -> None:
         """Schedule saving the entity map cache."""
         assert self.store is not None
-        self.store.async_delay_save(self._data_to_save, AID_MANAGER_SAVE_DELAY)
+        self._persist_scheduler.async_schedule_store(self.store, self._data_to_save)
 
     async def async_save(self) -> None:
         """Save the entity map cache."""
@@ -8,6 +8,9 @@ DEBOUNCE_TIMEOUT = 0.5
 DEVICE_PRECISION_LEEWAY = 6
 DOMAIN = "homekit"
 PERSIST_LOCK_DATA = f"{DOMAIN}_persist_lock"
+INTEGRATION_NAMES_DATA = f"{DOMAIN}_integration_names"
+LINKED_SENSOR_INDEX_DATA = f"{DOMAIN}_linked_sensor_index"
+PROFILER_DATA = f"{DOMAIN}_profiler"
 HOMEKIT_FILE = ".homekit.state"
 SHUTDOWN_TIMEOUT = 30
 CONF_ENTRY_INDEX = "index"
@@ -31,6 +34,7 @@ ATTR_DISPLAY_NAME = "display_name"
 ATTR_VALUE = "value"
 ATTR_INTEGRATION = "platform"
 ATTR_KEY_NAME = "key_name"
+ATTR_SECONDS = "seconds"
 # Current attribute used by homekit_controller
 ATTR_OBSTRUCTION_DETECTED = "obstruction-detected"
 
@@ -40,6 +44,8 @@ CONF_ADVERTISE_IP = "advertise_ip"
 CONF_AUDIO_CODEC = "audio_codec"
 CONF_AUDIO_MAP = "audio_map"
 CONF_AUDIO_PACKET_SIZE = "audio_packet_size"
+CONF_COALESCE_WINDOW = "coalesce_window"
+CONF_DEADBAND = "deadband"
 CONF_ENTITY_CONFIG = "entity_config"
 CONF_FEATURE = "feature"
 CONF_FEATURE_LIST = "feature_list"
@@ -61,7 +67,10 @@ CONF_LOW_BATTERY_THRESHOLD = "low_battery_threshold"
 CONF_MAX_FPS = "max_fps"
 CONF_MAX_HEIGHT = "max_height"
 CONF_MAX_WIDTH = "max_width"
+CONF_MIN_INTERVAL = "min_interval"
+CONF_SNAPSHOT_TTL = "snapshot_ttl"
 CONF_STREAM_ADDRESS = "stream_address"
+CONF_STREAM_PREWARM = "stream_prewarm"
 CONF_STREAM_SOURCE = "stream_source"
 CONF_SUPPORT_AUDIO = "support_audio"
 CONF_THRESHOLD_CO = "co_threshold"
@@ -77,6 +86,12 @@ DEFAULT_SUPPORT_AUDIO = False
 DEFAULT_AUDIO_CODEC = AUDIO_CODEC_OPUS
 DEFAULT_AUDIO_MAP = "0:a:0"
 DEFAULT_AUDIO_PACKET_SIZE = 188
+MAX_COALESCE_WINDOW = 60
+DEFAULT_PROFILE_SECONDS = 60
+MAX_PROFILE_SECONDS = 3600
+MAX_STREAM_PREWARM = 300
+DEFAULT_SNAPSHOT_TTL = 5
+MAX_SNAPSHOT_TTL = 300
 DEFAULT_EXCLUDE_ACCESSORY_MODE = False
 DEFAULT_LOW_BATTERY_THRESHOLD = 20
 DEFAULT_MAX_FPS = 30
@@ -107,6 +122,7 @@ DEFAULT_HOMEKIT_MODE = HOMEKIT_MODE_BRIDGE
 HOMEKIT_MODES = [HOMEKIT_MODE_BRIDGE, HOMEKIT_MODE_ACCESSORY]
 
 # #### HomeKit Component Services ####
+SERVICE_HOMEKIT_PROFILE = "profile"
 SERVICE_HOMEKIT_RESET_ACCESSORY = "reset_accessory"
 SERVICE_HOMEKIT_UNPAIR = "unpair"
 
@@ -13,8 +13,7 @@ from custom_components.homekit.pyhap.const import CATEGORY_SENSOR
 from pyhap.util import callback as pyhap_callback
 
 from homeassistant.const import STATE_ON
-from homeassistant.core import HassJobType, callback
-from homeassistant.helpers.event import async_track_state_change_event
+from homeassistant.core import callback
 
 from .const import (
     CHAR_STATUS_TAMPERED,
@@ -83,11 +82,9 @@ class AeotecLeakSensor(HomeAccessory):
         super().run()
         if self.linked_tamper_sensor:
             self._subscriptions.append(
-                async_track_state_change_event(
-                    self.hass,
-                    [self.linked_tamper_sensor],
+                self.driver.state_dispatcher.async_track_entity(
+                    self.linked_tamper_sensor,
                     self._async_update_tamper_sensor_event,
-                    job_type=HassJobType.Callback,
                 )
             )
 
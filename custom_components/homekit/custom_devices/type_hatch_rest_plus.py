@@ -68,8 +68,8 @@ from homeassistant.const import (
     SERVICE_VOLUME_UP,
     STATE_ON,
 )
-from homeassistant.core import CALLBACK_TYPE, HassJobType, State, callback
-from homeassistant.helpers.event import async_call_later, async_track_state_change_event
+from homeassistant.core import CALLBACK_TYPE, State, callback
+from homeassistant.helpers.event import async_call_later
 from homeassistant.util.color import (
     color_temperature_kelvin_to_mired,
     color_temperature_to_hs,
@@ -320,21 +320,17 @@ class HatchRestPlus(HomeAccessory):
         super().run()
         if self.linked_light:
             self._subscriptions.append(
-                async_track_state_change_event(
-                    self.hass,
-                    [self.linked_light],
+                self.driver.state_dispatcher.async_track_entity(
+                    self.linked_light,
                     self._async_update_light_event,
-                    job_type=HassJobType.Callback,
                 )
             )
 
         if self.linked_media_player:
             self._subscriptions.append(
-                async_track_state_change_event(
-                    self.hass,
-                    [self.linked_media_player],
+                self.driver.state_dispatcher.async_track_entity(
+                    self.linked_media_player,
                     self._async_update_media_player_event,
-                    job_type=HassJobType.Callback,
                 )
             )
 
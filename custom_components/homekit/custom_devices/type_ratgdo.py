@@ -21,8 +21,7 @@ from homeassistant.const import (
     SERVICE_TURN_ON,
     STATE_ON,
 )
-from homeassistant.core import HassJobType, callback
-from homeassistant.helpers.event import async_track_state_change_event
+from homeassistant.core import callback
 
 from .const import CONF_LINKED_OCCUPANCY_SENSOR, CONF_SERVICE_NAME_PREFIX
 
@@ -102,11 +101,9 @@ class RATGDO(HomeAccessory):
         super().run()
         if self.linked_occupancy_sensor:
             self._subscriptions.append(
-                async_track_state_change_event(
-                    self.hass,
-                    [self.linked_occupancy_sensor],
+                self.driver.state_dispatcher.async_track_entity(
+                    self.linked_occupancy_sensor,
                     self._async_update_occupancy_sensor_event,
-                    job_type=HassJobType.Callback,
                 )
             )
 
@@ -22,8 +22,7 @@ from homeassistant.const import (
     STATE_UNKNOWN,
     UnitOfTemperature,
 )
-from homeassistant.core import HassJobType, callback
-from homeassistant.helpers.event import async_track_state_change_event
+from homeassistant.core import callback
 
 from .const import CONF_SERVICE_NAME_PREFIX
 
@@ -104,11 +103,9 @@ class SmartThingsButton(HomeAccessory):
         super().run()
         if self.linked_temperature_sensor:
             self._subscriptions.append(
-                async_track_state_change_event(
-                    self.hass,
-                    [self.linked_temperature_sensor],
+                self.driver.state_dispatcher.async_track_entity(
+                    self.linked_temperature_sensor,
                     self._async_update_temperature_sensor_event,
-                    job_type=HassJobType.Callback,
                 )
             )
 
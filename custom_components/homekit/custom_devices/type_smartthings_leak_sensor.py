@@ -17,8 +17,7 @@ from custom_components.homekit.util import convert_to_float, temperature_to_home
 from pyhap.util import callback as pyhap_callback
 
 from homeassistant.const import ATTR_UNIT_OF_MEASUREMENT, STATE_ON, UnitOfTemperature
-from homeassistant.core import HassJobType, callback
-from homeassistant.helpers.event import async_track_state_change_event
+from homeassistant.core import callback
 
 from .const import CONF_SERVICE_NAME_PREFIX
 
@@ -93,11 +92,9 @@ class SmartThingsLeakSensor(HomeAccessory):
         super().run()
         if self.linked_temperature_sensor:
             self._subscriptions.append(
-                async_track_state_change_event(
-                    self.hass,
-                    [self.linked_temperature_sensor],
+                self.driver.state_dispatcher.async_track_entity(
+                    self.linked_temperature_sensor,
                     self._async_update_temperature_sensor_event,
-                    job_type=HassJobType.Callback,
                 )
             )
 
@@ -33,8 +33,7 @@ from homeassistant.const import (
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
 )
-from homeassistant.core import HassJobType, callback
-from homeassistant.helpers.event import async_track_state_change_event
+from homeassistant.core import callback
 
 from .const import (
     CHAR_SECURITY_SYSTEM_ALARM_TYPE,
@@ -171,11 +170,9 @@ class TotalConnectSecuritySystem(HomeAccessory):
         super().run()
         if self.linked_tamper_sensor:
             self._subscriptions.append(
-                async_track_state_change_event(
-                    self.hass,
-                    [self.linked_tamper_sensor],
+                self.driver.state_dispatcher.async_track_entity(
+                    self.linked_tamper_sensor,
                     self._async_update_tamper_sensor_event,
-                    job_type=HassJobType.Callback,
                 )
             )
 
@@ -302,20 +299,16 @@ class TotalConnectContactSensor(HomeAccessory):
         super().run()
         if self.linked_low_battery_sensor:
             self._subscriptions.append(
-                async_track_state_change_event(
-                    self.hass,
-                    [self.linked_low_battery_sensor],
+                self.driver.state_dispatcher.async_track_entity(
+                    self.linked_low_battery_sensor,
                     self._async_update_low_battery_sensor_event,
-                    job_type=HassJobType.Callback,
                 )
             )
         if self.linked_tamper_sensor:
             self._subscriptions.append(
-                async_track_state_change_event(
-                    self.hass,
-                    [self.linked_tamper_sensor],
+                self.driver.state_dispatcher.async_track_entity(
+                    self.linked_tamper_sensor,
                     self._async_update_tamper_sensor_event,
-                    job_type=HassJobType.Callback,
                 )
             )
 
@@ -435,20 +428,16 @@ class TotalConnectSmokeSensor(HomeAccessory):
         super().run()
         if self.linked_low_battery_sensor:
             self._subscriptions.append(
-                async_track_state_change_event(
-                    self.hass,
-                    [self.linked_low_battery_sensor],
+                self.driver.state_dispatcher.async_track_entity(
+                    self.linked_low_battery_sensor,
                     self._async_update_low_battery_sensor_event,
-                    job_type=HassJobType.Callback,
                 )
             )
         if self.linked_tamper_sensor:
             self._subscriptions.append(
-                async_track_state_change_event(
-                    self.hass,
-                    [self.linked_tamper_sensor],
+                self.driver.state_dispatcher.async_track_entity(
+                    self.linked_tamper_sensor,
                     self._async_update_tamper_sensor_event,
-                    job_type=HassJobType.Callback,
                 )
             )
 
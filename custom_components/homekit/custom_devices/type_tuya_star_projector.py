@@ -38,8 +38,8 @@ from homeassistant.const import (
     SERVICE_TURN_ON,
     STATE_ON,
 )
-from homeassistant.core import CALLBACK_TYPE, HassJobType, State, callback
-from homeassistant.helpers.event import async_call_later, async_track_state_change_event
+from homeassistant.core import CALLBACK_TYPE, State, callback
+from homeassistant.helpers.event import async_call_later
 from homeassistant.util.color import color_temperature_to_hs
 
 from .const import (
@@ -186,21 +186,17 @@ class TuyaStarProjector(HomeAccessory):
         super().run()
         if self.linked_light_color:
             self._subscriptions.append(
-                async_track_state_change_event(
-                    self.hass,
-                    [self.linked_light_color],
+                self.driver.state_dispatcher.async_track_entity(
+                    self.linked_light_color,
                     self._async_update_color_event,
-                    job_type=HassJobType.Callback,
                 )
             )
 
         if self.linked_light_laser:
             self._subscriptions.append(
-                async_track_state_change_event(
-                    self.hass,
-                    [self.linked_light_laser],
+                self.driver.state_dispatcher.async_track_entity(
+                    self.linked_light_laser,
                     self._async_update_laser_event,
-                    job_type=HassJobType.Callback,
                 )
             )
 
@@ -9,6 +9,7 @@ from homeassistant.components.diagnostics import async_redact_data
 from homeassistant.core import HomeAssistant
 
 from .accessories import HomeAccessory, HomeBridge
+from .iidmanager import get_allocation_cache_info
 from .models import HomeKitConfigEntry
 
 TO_REDACT = {"access_token", "entity_picture"}
@@ -28,14 +29,25 @@ async def async_get_config_entry_diagnostics(
             "options": dict(entry.options),
         },
     }
+    data["persist"] = homekit.persist_scheduler.async_get_stats()
+    data["startup_timings"] = homekit.startup_timings
+    data["reload_stats"] = {
+        "reloads": homekit.reload_count,
+        "reloaded_entities": homekit.reloaded_entity_count,
+        "resets": homekit.reset_count,
+    }
     if homekit.iid_storage:
         data["iid_storage"] = homekit.iid_storage.allocations
+        data["iid_allocation_cache"] = get_allocation_cache_info()
     if not homekit.driver:  # not started yet or startup failed
         return data
     driver: AccessoryDriver = homekit.driver
     if driver.accessory:
         if isinstance(driver.accessory, HomeBridge):
             data["bridge"] = _get_bridge_diagnostics(hass, driver.accessory)
+            data["snapshot_stats"] = (
+                driver.accessory.snapshot_scheduler.async_get_stats()
+            )
         else:
             data["accessory"] = _get_accessory_diagnostics(hass, driver.accessory)
     data.update(driver.get_accessories())
@@ -74,6 +86,7 @@ def _get_accessory_diagnostics(
         "name": accessory.display_name,
         "entity_id": accessory.entity_id,
     }
+    data["stats"] = accessory.async_get_stats()
     if entity_state:
         data["entity_state"] = async_redact_data(entity_state, TO_REDACT)
     return data
@@ -9,11 +9,9 @@ from homeassistant.const import STATE_ON, STATE_UNAVAILABLE, STATE_UNKNOWN
 from homeassistant.core import (
     Event,
     EventStateChangedData,
-    HassJobType,
     State,
     callback as ha_callback,
 )
-from homeassistant.helpers.event import async_track_state_change_event
 
 from .accessories import HomeAccessory
 from .const import (
@@ -76,11 +74,9 @@ class HomeDoorbellAccessory(HomeAccessory):
         if self._char_doorbell_detected:
             assert self.linked_doorbell_sensor
             self._subscriptions.append(
-                async_track_state_change_event(
-                    self.hass,
+                self.driver.state_dispatcher.async_track_entity(
                     self.linked_doorbell_sensor,
                     self.async_update_doorbell_state_event,
-                    job_type=HassJobType.Callback,
                 )
             )
 
@@ -118,3 +114,9 @@ class HomeDoorbellAccessory(HomeAccessory):
                 self.linked_doorbell_sensor,
                 DOORBELL_SINGLE_PRESS,
             )
+            if old_state is not None:
+                self.async_doorbell_pressed()
+
+    @ha_callback
+    def async_doorbell_pressed(self) -> None:
+        """Handle a press of the linked doorbell after startup."""
@@ -6,7 +6,9 @@ be stable between reboots and upgrades.
 This module generates and stores them in a HA storage.
 """
 
-from typing import override
+from functools import lru_cache
+import sys
+from typing import Any, override
 from uuid import UUID
 
 from pyhap.util import uuid_to_hap_type
@@ -14,10 +16,10 @@ from pyhap.util import uuid_to_hap_type
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.storage import Store
 
+from .persist import HomePersistScheduler
 from .util import get_iid_storage_filename_for_entry_id
 
 IID_MANAGER_STORAGE_VERSION = 2
-IID_MANAGER_SAVE_DELAY = 2
 
 ALLOCATIONS_KEY = "allocations"
 
@@ -27,6 +29,43 @@ IID_MAX = 18446744073709551615
 
 ACCESSORY_INFORMATION_SERVICE = "3E"
 
+HAP_TYPE_CACHE_SIZE = 512
+ALLOCATION_KEY_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=HAP_TYPE_CACHE_SIZE)
+def _hap_type(uuid: UUID) -> str:
+    """Return the short HAP type of a service or characteristic UUID."""
+    return sys.intern(uuid_to_hap_type(uuid))
+
+
+@lru_cache(maxsize=ALLOCATION_KEY_CACHE_SIZE)
+def _allocation_key(
+    service_uuid: UUID,
+    service_unique_id: str | None,
+    char_uuid: UUID | None,
+    char_unique_id: str | None,
+) -> str:
+    """Return the allocation key of a service or characteristic.
+
+    Most unique ids are None, so the same few keys are built for every
+    accessory of a type and rebuilt on every accessory reload.
+    """
+    char_hap_type = _hap_type(char_uuid) if char_uuid else None
+    # Allocation key must be a string since we are saving it to JSON
+    return sys.intern(
+        f"{_hap_type(service_uuid)}_{service_unique_id or ''}_"
+        f"{char_hap_type or ''}_{char_unique_id or ''}"
+    )
+
+
+def get_allocation_cache_info() -> dict[str, dict[str, Any]]:
+    """Return the hit and miss counters of the allocation key caches."""
+    return {
+        "hap_type": _hap_type.cache_info()._asdict(),
+        "allocation_key": _allocation_key.cache_info()._asdict(),
+    }
+
 
 class IIDStorage(Store):
     """Storage class for IIDManager."""
@@ -67,11 +106,19 @@ class AccessoryIIDStorage:
     persist over reboots.
     """
 
-    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry_id: str,
+        persist_scheduler: HomePersistScheduler,
+    ) -> None:
         """Create a new iid store."""
         self.hass = hass
-        self.allocations: dict[str, dict[str, int]] = {}
-        self.allocated_iids: dict[str, list[int]] = {}
+        self._persist_scheduler = persist_scheduler
+        # Keyed by aid; the highest allocated iid is cached per aid since
+        # iids are allocated sequentially.
+        self.allocations: dict[int, dict[str, int]] = {}
+        self.max_iids: dict[int, int] = {}
         self.entry_id = entry_id
         self.store: IIDStorage | None = None
 
@@ -85,9 +132,15 @@ class AccessoryIIDStorage:
             return
 
         assert isinstance(raw_storage, dict)
-        self.allocations = raw_storage.get(ALLOCATIONS_KEY, {})
-        for aid_str, allocations in self.allocations.items():
-            self.allocated_iids[aid_str] = sorted(allocations.values())
+        for aid_str, allocations in raw_storage.get(ALLOCATIONS_KEY, {}).items():
+            aid = int(aid_str)
+            # The same keys repeat for every accessory of a type, so they
+            # are interned to share a single copy across accessories.
+            self.allocations[aid] = {
+                sys.intern(allocation_key): iid
+                for allocation_key, iid in allocations.items()
+            }
+            self.max_iids[aid] = max(allocations.values(), default=1)
 
     def get_or_allocate_iid(
         self,
@@ -98,27 +151,20 @@ class AccessoryIIDStorage:
         char_unique_id: str | None,
     ) -> int:
         """Generate a stable iid."""
-        service_hap_type: str = uuid_to_hap_type(service_uuid)
-        char_hap_type: str | None = uuid_to_hap_type(char_uuid) if char_uuid else None
-        # Allocation key must be a string since we are saving it to JSON
-        allocation_key = (
-            f"{service_hap_type}_{service_unique_id or ''}_"
-            f"{char_hap_type or ''}_{char_unique_id or ''}"
-        )
-        # AID must be a string since JSON keys cannot be int
-        aid_str = str(aid)
-        accessory_allocation = self.allocations.setdefault(aid_str, {})
-        accessory_allocated_iids = self.allocated_iids.setdefault(aid_str, [1])
-        if service_hap_type == ACCESSORY_INFORMATION_SERVICE and char_uuid is None:
+        accessory_allocation = self.allocations.setdefault(aid, {})
+        if (
+            char_uuid is None
+            and _hap_type(service_uuid) == ACCESSORY_INFORMATION_SERVICE
+        ):
             return 1
-        if allocation_key in accessory_allocation:
-            return accessory_allocation[allocation_key]
-        if accessory_allocated_iids:
-            allocated_iid = accessory_allocated_iids[-1] + 1
-        else:
-            allocated_iid = 2
+        allocation_key = _allocation_key(
+            service_uuid, service_unique_id, char_uuid, char_unique_id
+        )
+        if (iid := accessory_allocation.get(allocation_key)) is not None:
+            return iid
+        allocated_iid = self.max_iids.get(aid, 1) + 1
         accessory_allocation[allocation_key] = allocated_iid
-        accessory_allocated_iids.append(allocated_iid)
+        self.max_iids[aid] = allocated_iid
         self._async_schedule_save()
         return allocated_iid
 
@@ -126,7 +172,7 @@ class AccessoryIIDStorage:
     def _async_schedule_save(self) -> None:
         """Schedule saving the iid allocations."""
         assert self.store is not None
-        self.store.async_delay_save(self._data_to_save, IID_MANAGER_SAVE_DELAY)
+        self._persist_scheduler.async_schedule_store(self.store, self._data_to_save)
 
     async def async_save(self) -> None:
         """Save the iid allocations."""
@@ -136,4 +182,9 @@ class AccessoryIIDStorage:
     @callback
     def _data_to_save(self) -> dict[str, dict[str, dict[str, int]]]:
         """Return data of entity map to store in a file."""
-        return {ALLOCATIONS_KEY: self.allocations}
+        # AID must be a string since JSON keys cannot be int
+        return {
+            ALLOCATIONS_KEY: {
+                str(aid): allocations for aid, allocations in self.allocations.items()
+            }
+        }
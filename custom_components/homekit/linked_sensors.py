@@ -0,0 +1,88 @@
+"""Index the entities of each device for linking sensors to accessories.
+
+Every HomeKit instance links battery, motion, doorbell, humidity and
+similar sensors of the same device to an accessory. The index is shared
+by all instances, filled lazily per device and kept current from entity
+registry updates instead of scanning the registry on every start.
+"""
+
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+
+# Changes that can move an entity to another key or device, or in or out
+# of the entries of a device since disabled entities are left out
+_RELEVANT_CHANGES = {
+    "device_class",
+    "device_id",
+    "disabled_by",
+    "entity_id",
+    "original_device_class",
+}
+
+type LinkedSensorLookup = dict[tuple[str, str | None], str]
+
+
+class LinkedSensorIndex:
+    """Map device ids to their entities by domain and device class."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Create a new linked sensor index."""
+        self.hass = hass
+        self._entity_registry = er.async_get(hass)
+        self._devices: dict[str, LinkedSensorLookup] = {}
+        self._entity_devices: dict[str, str] = {}
+        self._unsub_registry_updated: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_setup(self) -> None:
+        """Listen for entity registry updates."""
+        self._unsub_registry_updated = self.hass.bus.async_listen(
+            er.EVENT_ENTITY_REGISTRY_UPDATED, self._async_entity_registry_updated
+        )
+
+    @callback
+    def async_shutdown(self, _event: Any = None) -> None:
+        """Stop listening for entity registry updates."""
+        if self._unsub_registry_updated is not None:
+            self._unsub_registry_updated()
+            self._unsub_registry_updated = None
+
+    @callback
+    def async_get(self, device_id: str) -> LinkedSensorLookup:
+        """Return the entities of a device by domain and device class."""
+        if (lookup := self._devices.get(device_id)) is not None:
+            return lookup
+        lookup = {}
+        entity_devices = self._entity_devices
+        for entry in self._entity_registry.entities.get_entries_for_device_id(
+            device_id
+        ):
+            lookup[
+                (entry.domain, entry.device_class or entry.original_device_class)
+            ] = entry.entity_id
+            entity_devices[entry.entity_id] = device_id
+        self._devices[device_id] = lookup
+        return lookup
+
+    @callback
+    def _async_entity_registry_updated(
+        self, event: Event[er.EventEntityRegistryUpdatedData]
+    ) -> None:
+        """Drop the devices affected by an entity registry update."""
+        data = event.data
+        if data["action"] == "update" and not _RELEVANT_CHANGES.intersection(
+            data["changes"]
+        ):
+            return
+        entity_id = data["entity_id"]
+        # The previous device is only known from the index since the
+        # registry entry already changed or is gone.
+        for previous_entity_id in (entity_id, data.get("old_entity_id")):
+            if previous_entity_id and (
+                device_id := self._entity_devices.pop(previous_entity_id, None)
+            ):
+                self._devices.pop(device_id, None)
+        if (entry := self._entity_registry.async_get(entity_id)) and entry.device_id:
+            self._devices.pop(entry.device_id, None)
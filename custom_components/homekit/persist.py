@@ -0,0 +1,159 @@
+"""Coalesce the writes of the HomeKit storage files of a config entry.
+
+The aid allocations, iid allocations and pyhap state all change together
+when accessories are added, reloaded or paired. Instead of each file
+scheduling its own write, they are marked dirty and written together in
+a single executor job, at most PERSIST_DELAY seconds after the first
+change. The data is serialized in the event loop, where it is modified,
+and only the serialized files are handed to the executor.
+"""
+
+import logging
+import os
+from collections.abc import Callable
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.json import prepare_save_json
+from homeassistant.helpers.storage import Store
+from homeassistant.util.file import write_utf8_file_atomic
+
+from .const import PERSIST_LOCK_DATA
+
+_LOGGER = logging.getLogger(__name__)
+
+PERSIST_DELAY = 1
+# Delay before retrying a failed write, to avoid a tight error loop
+PERSIST_RETRY_DELAY = 30
+
+# The path, file mode, serialized data and whether the file is private
+type FileWrite = tuple[str, str, str | bytes, bool]
+
+
+class HomePersistScheduler:
+    """Write behind the storage files of one HomeKit instance."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Create a new persist scheduler."""
+        self.hass = hass
+        self._dirty_stores: dict[str, tuple[Store, Callable[[], Any]]] = {}
+        self._dirty_state: tuple[Callable[[], str], str] | None = None
+        self._cancel_flush: CALLBACK_TYPE | None = None
+        self._shutdown = False
+        self.flush_count = 0
+        self.bytes_written = 0
+
+    @callback
+    def async_schedule_store(self, store: Store, data_func: Callable[[], Any]) -> None:
+        """Schedule writing the data of a store with the next flush.
+
+        The data is collected from data_func when flushing, so the latest
+        data is written.
+        """
+        self._dirty_stores[store.key] = (store, data_func)
+        self._async_schedule_flush()
+
+    @callback
+    def async_schedule_state(self, serialize: Callable[[], str], path: str) -> None:
+        """Schedule persisting the pyhap state with the next flush."""
+        self._dirty_state = (serialize, path)
+        self._async_schedule_flush()
+
+    @callback
+    def _async_schedule_flush(self, delay: float = PERSIST_DELAY) -> None:
+        """Schedule a flush unless one is pending.
+
+        Later changes do not postpone a pending flush, which bounds the
+        time a change stays unwritten.
+        """
+        if self._cancel_flush is None and not self._shutdown:
+            self._cancel_flush = async_call_later(
+                self.hass, delay, self._async_flush_later
+            )
+
+    async def async_shutdown(self) -> None:
+        """Write the pending changes and stop scheduling writes.
+
+        Nothing is written after the shutdown, so the files stay removed
+        when the config entry is removed.
+        """
+        self._shutdown = True
+        await self.async_flush()
+        # A failed write is not retried anymore
+        if self._cancel_flush is not None:
+            self._cancel_flush()
+            self._cancel_flush = None
+
+    async def _async_flush_later(self, _now: Any) -> None:
+        """Flush once the delay passed."""
+        self._cancel_flush = None
+        await self.async_flush()
+
+    async def async_flush(self) -> None:
+        """Write every dirty file now."""
+        if self._cancel_flush is not None:
+            self._cancel_flush()
+            self._cancel_flush = None
+        if not self._dirty_stores and self._dirty_state is None:
+            return
+        dirty_stores = self._dirty_stores
+        dirty_state = self._dirty_state
+        self._dirty_stores = {}
+        self._dirty_state = None
+        # Serialize in the event loop since the data is modified there
+        file_writes: list[FileWrite] = []
+        for store, data_func in dirty_stores.values():
+            mode, json_data = prepare_save_json(
+                {
+                    "version": store.version,
+                    "minor_version": store.minor_version,
+                    "key": store.key,
+                    "data": data_func(),
+                }
+            )
+            file_writes.append((store.path, mode, json_data, False))
+        if dirty_state is not None:
+            serialize, path = dirty_state
+            # The state holds the pairing keys
+            file_writes.append((path, "w", serialize(), True))
+        try:
+            async with self.hass.data[PERSIST_LOCK_DATA]:
+                written = await self.hass.async_add_executor_job(
+                    _write_files, file_writes
+                )
+        except Exception:
+            _LOGGER.exception(
+                "Failed to write the HomeKit storage, retrying in %ss",
+                PERSIST_RETRY_DELAY,
+            )
+            # Changes made since are newer than the failed ones
+            for key, dirty_store in dirty_stores.items():
+                self._dirty_stores.setdefault(key, dirty_store)
+            if self._dirty_state is None:
+                self._dirty_state = dirty_state
+            self._async_schedule_flush(PERSIST_RETRY_DELAY)
+            return
+        self.flush_count += 1
+        self.bytes_written += written
+
+    @callback
+    def async_get_stats(self) -> dict[str, Any]:
+        """Return the flush counters."""
+        return {
+            "flush_count": self.flush_count,
+            "bytes_written": self.bytes_written,
+            "pending": sorted(self._dirty_stores)
+            + (["state"] if self._dirty_state else []),
+        }
+
+
+def _write_files(file_writes: list[FileWrite]) -> int:
+    """Write the files and return the number of bytes written."""
+    written = 0
+    for path, mode, data, private in file_writes:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        _LOGGER.debug("Writing data to %s", path)
+        write_utf8_file_atomic(path, data, private, mode)
+        written += os.path.getsize(path)
+    return written
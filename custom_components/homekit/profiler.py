@@ -0,0 +1,74 @@
+"""Profile the HomeKit callbacks on demand.
+
+The profiler only runs inside the HomeKit state change callbacks, the
+characteristic setters called by controllers and the accessory reload
+paths, instead of profiling the whole Home Assistant process.
+"""
+
+import cProfile
+import logging
+from collections.abc import Generator
+from contextlib import contextmanager
+
+from homeassistant.core import callback
+from homeassistant.exceptions import HomeAssistantError
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class HomeKitProfiler:
+    """Collect a profile of the HomeKit callbacks while enabled."""
+
+    def __init__(self) -> None:
+        """Create a new profiler."""
+        self._profile: cProfile.Profile | None = None
+        self._depth = 0
+        self._failed = False
+
+    @property
+    def active(self) -> bool:
+        """Return True while a profile is collected."""
+        return self._profile is not None and not self._failed
+
+    @callback
+    def async_start(self) -> None:
+        """Start collecting a profile."""
+        if self._profile is not None:
+            raise HomeAssistantError("HomeKit is already being profiled")
+        self._profile = cProfile.Profile()
+        self._failed = False
+
+    @callback
+    def async_stop(self) -> cProfile.Profile:
+        """Stop collecting and return the profile."""
+        profile = self._profile
+        self._profile = None
+        if profile is None or self._failed:
+            raise HomeAssistantError(
+                "Profiling HomeKit failed since another profiler is active"
+            )
+        return profile
+
+    @contextmanager
+    def scope(self) -> Generator[None]:
+        """Profile the code run inside the context while active."""
+        if (profile := self._profile) is None or self._failed:
+            yield
+            return
+        # Scopes nest when a setter or reload triggers a state change
+        if self._depth == 0:
+            try:
+                profile.enable()
+            except ValueError:
+                # Only one profiler can run at a time
+                _LOGGER.error("Cannot profile HomeKit while another profiler runs")
+                self._failed = True
+                yield
+                return
+        self._depth += 1
+        try:
+            yield
+        finally:
+            self._depth -= 1
+            if self._depth == 0:
+                profile.disable()
@@ -0,0 +1,130 @@
+"""Cache the snapshots of a camera between HomeKit requests.
+
+Every controller requests the snapshots of every camera when the Home
+app opens. The cache answers repeated requests within the TTL, lets
+concurrent requests for a size share one fetch and downscales a cached
+larger snapshot instead of fetching a smaller one from the camera.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any
+
+from homeassistant.components import camera
+from homeassistant.components.camera.img_util import scale_jpeg_camera_image
+from homeassistant.core import HomeAssistant, callback
+
+from .stats import LatencyHistogram
+
+_LOGGER = logging.getLogger(__name__)
+
+type ImageSize = tuple[int, int]
+
+
+class CameraSnapshotCache:
+    """Cache the snapshots of a camera by requested size."""
+
+    def __init__(self, hass: HomeAssistant, entity_id: str, ttl: float) -> None:
+        """Create a new snapshot cache."""
+        self.hass = hass
+        self.entity_id = entity_id
+        self._ttl = ttl
+        self._images: dict[ImageSize, tuple[float, camera.Image]] = {}
+        self._pending: dict[ImageSize, asyncio.Task[bytes]] = {}
+        # Bumped by async_clear so fetches started before it are not cached
+        self._generation = 0
+        self.hits = 0
+        self.shared = 0
+        self.downscaled = 0
+        self.fetched = 0
+        self.fetch_latency = LatencyHistogram()
+
+    async def async_get(self, width: int, height: int) -> bytes:
+        """Return a jpeg of a snapshot of the requested size."""
+        size = (width, height)
+        if (cached := self._images.get(size)) and self._is_fresh(cached[0]):
+            self.hits += 1
+            return cached[1].content
+        if (task := self._pending.get(size)) is not None:
+            self.shared += 1
+        else:
+            # Not started eagerly so the task is pending before it can finish
+            task = self._pending[size] = self.hass.async_create_task(
+                self._async_fetch(size, self._generation),
+                f"homekit snapshot {self.entity_id}",
+                eager_start=False,
+            )
+        # A cancelled request must not cancel the fetch of the others
+        return await asyncio.shield(task)
+
+    @callback
+    def async_clear(self) -> None:
+        """Drop the cached snapshots, for example when motion is detected.
+
+        Requests after this do not join the fetches already running, and
+        those fetches are not cached.
+        """
+        self._generation += 1
+        self._images.clear()
+        self._pending.clear()
+
+    @callback
+    def async_get_stats(self) -> dict[str, Any]:
+        """Return the cache counters and the latency of the camera."""
+        return {
+            "hits": self.hits,
+            "shared": self.shared,
+            "downscaled": self.downscaled,
+            "fetched": self.fetched,
+            "fetch_latency": self.fetch_latency.as_dict(),
+        }
+
+    def _is_fresh(self, fetched_at: float) -> bool:
+        """Return True if a snapshot fetched at the time can be reused."""
+        return time.monotonic() - fetched_at < self._ttl
+
+    async def _async_fetch(self, size: ImageSize, generation: int) -> bytes:
+        """Fetch a snapshot of the size and cache it unless cleared since."""
+        try:
+            width, height = size
+            if larger := self._get_larger_image(size):
+                fetched_at, source = larger
+                content = await self.hass.async_add_executor_job(
+                    scale_jpeg_camera_image, source, width, height
+                )
+                image = camera.Image(source.content_type, content)
+                self.downscaled += 1
+            else:
+                fetched_at = time.monotonic()
+                start = time.perf_counter()
+                try:
+                    image = await camera.async_get_image(
+                        self.hass, self.entity_id, width=width, height=height
+                    )
+                finally:
+                    self.fetch_latency.add(time.perf_counter() - start)
+                self.fetched += 1
+            if self._ttl and generation == self._generation:
+                self._images[size] = (fetched_at, image)
+            return image.content
+        finally:
+            if generation == self._generation:
+                del self._pending[size]
+
+    def _get_larger_image(self, size: ImageSize) -> tuple[float, camera.Image] | None:
+        """Return the smallest fresh jpeg that is at least the size."""
+        width, height = size
+        best: tuple[float, camera.Image] | None = None
+        best_width = 0
+        for (cached_width, cached_height), cached in self._images.items():
+            if (
+                cached_width >= width
+                and cached_height >= height
+                and (best is None or cached_width < best_width)
+                and cached[1].content_type == "image/jpeg"
+                and self._is_fresh(cached[0])
+            ):
+                best = cached
+                best_width = cached_width
+        return best
@@ -0,0 +1,146 @@
+"""Schedule the snapshot requests of the cameras of a bridge.
+
+A controller opening a room requests the snapshot of each camera in
+turn over one connection, so the slowest cameras add up. Once a burst of
+requests reaches a second camera, the bridge prefetches the snapshots of
+the other recently viewed cameras concurrently, each at the size it was
+last requested at. The later requests of the burst then join those
+fetches in the camera snapshot caches instead of starting their own. A
+camera refreshed on its own never starts a prefetch, and cameras that
+do not cache their snapshots are never prefetched. A bounded number of
+prefetches run at once, most recently viewed camera first, while
+requests from controllers never wait for a slot.
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+
+_LOGGER = logging.getLogger(__name__)
+
+SNAPSHOT_CONCURRENCY = 4
+# A request after this many quiet seconds starts a new burst
+SNAPSHOT_BURST_GAP = 5
+# Only cameras viewed this recently are prefetched
+SNAPSHOT_RECENT_WINDOW = 600
+
+type SnapshotFetcher = Callable[[dict[str, Any]], Awaitable[bytes]]
+
+
+class _RecencyLimiter:
+    """Limit concurrent fetches, waking the most recently viewed first."""
+
+    def __init__(self, limit: int) -> None:
+        """Create a new limiter."""
+        self._available = limit
+        self._waiters: list[tuple[float, int, asyncio.Future[None]]] = []
+        self._counter = itertools.count()
+
+    async def acquire(self, viewed: float) -> None:
+        """Wait for a free slot."""
+        if self._available and not self._waiters:
+            self._available -= 1
+            return
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (-viewed, next(self._counter), future))
+        try:
+            await future
+        except asyncio.CancelledError:
+            # Pass on a slot handed over while being cancelled
+            if future.done() and not future.cancelled():
+                self.release()
+            raise
+
+    def release(self) -> None:
+        """Hand the slot to the next waiter or free it."""
+        while self._waiters:
+            future = heapq.heappop(self._waiters)[2]
+            if not future.done():
+                future.set_result(None)
+                return
+        self._available += 1
+
+
+class BridgeSnapshotScheduler:
+    """Run the snapshot fetches of the cameras of a bridge."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Create a new snapshot scheduler."""
+        self.hass = hass
+        self._limiter = _RecencyLimiter(SNAPSHOT_CONCURRENCY)
+        # The cameras that cache their snapshots, with their last request
+        self._fetchers: dict[int, SnapshotFetcher] = {}
+        self._last_info: dict[int, dict[str, Any]] = {}
+        self._last_viewed: dict[int, float] = {}
+        self._last_request = 0.0
+        self._burst_aids: set[int] = set()
+        self._burst_prefetched = False
+        self.prefetches = 0
+
+    async def async_get_snapshot(
+        self, fetcher: SnapshotFetcher, info: dict[str, Any], cached: bool
+    ) -> bytes:
+        """Return the snapshot requested by a controller.
+
+        cached tells if the camera keeps fetched snapshots, which is what
+        makes a prefetch useful.
+        """
+        aid: int = info["aid"]
+        now = time.monotonic()
+        if now - self._last_request >= SNAPSHOT_BURST_GAP:
+            self._burst_aids.clear()
+            self._burst_prefetched = False
+        self._last_request = now
+        self._burst_aids.add(aid)
+        if cached:
+            self._fetchers[aid] = fetcher
+            self._last_info[aid] = info
+            self._last_viewed[aid] = now
+        else:
+            self.async_remove_accessory(aid)
+        if not self._burst_prefetched and len(self._burst_aids) > 1:
+            self._burst_prefetched = True
+            self._async_prefetch(now)
+        return await fetcher(info)
+
+    @callback
+    def async_remove_accessory(self, aid: int) -> None:
+        """Forget an accessory removed from the bridge."""
+        self._fetchers.pop(aid, None)
+        self._last_info.pop(aid, None)
+        self._last_viewed.pop(aid, None)
+
+    @callback
+    def async_get_stats(self) -> dict[str, Any]:
+        """Return the prefetch counter."""
+        return {"prefetches": self.prefetches}
+
+    @callback
+    def _async_prefetch(self, now: float) -> None:
+        """Prefetch the recently viewed cameras not requested in the burst."""
+        for aid, viewed in self._last_viewed.items():
+            if aid in self._burst_aids or now - viewed > SNAPSHOT_RECENT_WINDOW:
+                continue
+            self.prefetches += 1
+            self.hass.async_create_background_task(
+                self._async_prefetch_one(self._fetchers[aid], self._last_info[aid]),
+                f"homekit snapshot prefetch {aid}",
+            )
+
+    async def _async_prefetch_one(
+        self, fetcher: SnapshotFetcher, info: dict[str, Any]
+    ) -> None:
+        """Prefetch a snapshot once a slot is free, ignoring failures."""
+        await self._limiter.acquire(self._last_viewed.get(info["aid"], 0.0))
+        try:
+            await fetcher(info)
+        except Exception as err:  # noqa: BLE001
+            _LOGGER.debug("Failed to prefetch snapshot of %s: %s", info["aid"], err)
+        finally:
+            self._limiter.release()
@@ -0,0 +1,93 @@
+"""Route state changed events to the accessories of a HomeKit instance.
+
+A bridge tracks its own entities plus every linked sensor, which adds up
+to hundreds of tracked entity ids on a large bridge. Instead of one
+tracker registration per accessory callback, each HomeKit instance
+registers every tracked entity id once with the keyed state change
+tracker of Home Assistant and routes its events through an index.
+"""
+
+import logging
+from collections.abc import Callable
+
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    callback,
+)
+from homeassistant.helpers.event import async_track_state_change_event
+
+from .const import PROFILER_DATA
+from .profiler import HomeKitProfiler
+
+_LOGGER = logging.getLogger(__name__)
+
+type StateChangeAction = Callable[[Event[EventStateChangedData]], None]
+
+
+class HomeStateDispatcher:
+    """Dispatch state changed events for one HomeKit instance."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Create a new state dispatcher."""
+        self.hass = hass
+        self._actions: dict[str, list[StateChangeAction]] = {}
+        self._unsubs: dict[str, CALLBACK_TYPE] = {}
+        self._profiler: HomeKitProfiler = hass.data[PROFILER_DATA]
+
+    @callback
+    def async_track_entity(
+        self, entity_id: str, action: StateChangeAction
+    ) -> CALLBACK_TYPE:
+        """Call action for every state change of entity_id.
+
+        The action must be a callback. Returns a function that removes it.
+        """
+        if (actions := self._actions.get(entity_id)) is None:
+            actions = self._actions[entity_id] = []
+            self._unsubs[entity_id] = async_track_state_change_event(
+                self.hass, entity_id, self._async_dispatch
+            )
+        actions.append(action)
+
+        @callback
+        def _async_remove() -> None:
+            self._async_remove_action(entity_id, action)
+
+        return _async_remove
+
+    @callback
+    def _async_remove_action(self, entity_id: str, action: StateChangeAction) -> None:
+        """Remove an action and stop tracking its entity once unused."""
+        if not (actions := self._actions.get(entity_id)):
+            return
+        actions.remove(action)
+        if not actions:
+            del self._actions[entity_id]
+            self._unsubs.pop(entity_id)()
+
+    @callback
+    def _async_dispatch(self, event: Event[EventStateChangedData]) -> None:
+        """Dispatch a state changed event to the tracking accessories."""
+        if self._profiler.active:
+            with self._profiler.scope():
+                self._async_run_actions(event)
+            return
+        self._async_run_actions(event)
+
+    @callback
+    def _async_run_actions(self, event: Event[EventStateChangedData]) -> None:
+        """Run the actions tracking the entity of an event."""
+        entity_id = event.data["entity_id"]
+        # Copy since an action can reload an accessory and change the index
+        for action in list(self._actions.get(entity_id, ())):
+            try:
+                action(event)
+            except Exception:
+                _LOGGER.exception(
+                    "Error while dispatching state change of %s to %s",
+                    entity_id,
+                    action,
+                )
@@ -0,0 +1,107 @@
+"""Lightweight timing statistics for HomeKit."""
+
+import resource
+import sys
+import time
+from bisect import bisect_left
+from typing import Any
+
+# Upper bounds of the histogram buckets in seconds
+LATENCY_BUCKETS = (
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    1.0,
+)
+
+
+class LatencyHistogram:
+    """Count durations in fixed buckets.
+
+    Recording a duration is a bisect and two additions, so it is cheap
+    enough to run for every service call.
+    """
+
+    __slots__ = ("buckets", "count", "max", "total")
+
+    def __init__(self) -> None:
+        """Create an empty histogram."""
+        # The last bucket holds everything above the largest bound
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, duration: float) -> None:
+        """Record a duration in seconds."""
+        self.buckets[bisect_left(LATENCY_BUCKETS, duration)] += 1
+        self.count += 1
+        self.total += duration
+        self.max = max(self.max, duration)
+
+    def percentile(self, fraction: float) -> float:
+        """Return the bucket bound at or below which fraction of durations are."""
+        if not self.count:
+            return 0.0
+        threshold = fraction * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.buckets):
+            seen += bucket_count
+            if seen >= threshold:
+                if index < len(LATENCY_BUCKETS):
+                    return min(LATENCY_BUCKETS[index], self.max)
+                break
+        return self.max
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics for diagnostics."""
+        return {
+            "count": self.count,
+            # Throughput while busy, not the rate events arrive at
+            "per_second": round(self.count / self.total) if self.total else None,
+            "mean_ms": round(self.total / self.count * 1000, 3) if self.count else 0,
+            "p50_ms": round(self.percentile(0.5) * 1000, 3),
+            "p99_ms": round(self.percentile(0.99) * 1000, 3),
+            "max_ms": round(self.max * 1000, 3),
+        }
+
+
+def _peak_rss_kib() -> int:
+    """Return the peak resident set size of the process in KiB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS reports bytes instead of KiB
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+class StageTimer:
+    """Record the duration and process peak RSS growth of consecutive stages.
+
+    The peak resident set size is process wide, so it only shows stages
+    that raised the peak of the whole process. It is a hint from live
+    startups; benchmarks/startup.py measures the memory of each stage.
+    """
+
+    def __init__(self) -> None:
+        """Start timing the first stage."""
+        self.stages: dict[str, dict[str, float]] = {}
+        self._start = time.monotonic()
+        self._peak_rss = _peak_rss_kib()
+
+    def mark(self, stage: str) -> None:
+        """End a stage and start timing the next one."""
+        now = time.monotonic()
+        peak_rss = _peak_rss_kib()
+        self.stages[stage] = {
+            "seconds": round(now - self._start, 3),
+            "process_peak_rss_growth_kib": peak_rss - self._peak_rss,
+        }
+        self._start = now
+        self._peak_rss = peak_rss
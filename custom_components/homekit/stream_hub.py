@@ -0,0 +1,195 @@
+"""Share one ffmpeg ingest between the stream sessions of a camera.
+
+Decoding and encoding the camera source is the expensive part of a
+stream. The sessions of a camera that negotiated the same encoder
+settings share one ingest process. Its tee muxer sends MPEG-TS to one
+loopback UDP port per session slot, so the stream never leaves the host
+and is only readable where a session is attached. Each session takes a
+free slot and only runs a cheap ffmpeg process that reads its port and
+copies the encoded streams into its own SRTP output, so the datagrams
+are fanned out by ffmpeg instead of the event loop.
+"""
+
+import asyncio
+import logging
+import socket
+from collections.abc import Awaitable, Callable
+from typing import ClassVar
+from uuid import UUID
+
+from haffmpeg.core import FFMPEG_STDERR, HAFFmpeg
+from homeassistant.core import callback
+from homeassistant.util.async_ import create_eager_task
+
+_LOGGER = logging.getLogger(__name__)
+
+MPEGTS_PACKET_SIZE = 1316
+LOOPBACK_HOST = "127.0.0.1"
+
+# A slot without a session is written to a closed port and dropped
+SLOT_OUTPUT = "[f=mpegts:onfail=ignore]udp://{host}:{port}?pkt_size={pkt_size}"
+INGEST_OUTPUT = "{encoder_args} -f tee {slots}"
+
+
+class CameraStreamHub:
+    """Run one ffmpeg ingest and share its output with the stream sessions."""
+
+    # Slot ports of the hubs of every camera, so no two hubs send to the same one
+    _ports_in_use: ClassVar[set[int]] = set()
+
+    def __init__(
+        self,
+        name: str,
+        ffmpeg_binary: str,
+        encoder_args: str,
+        max_sessions: int,
+        get_input_source: Callable[[], Awaitable[str | None]],
+        ingest_ended: Callable[["CameraStreamHub"], None],
+    ) -> None:
+        """Create a new stream hub with a slot for up to max_sessions.
+
+        The ffmpeg input is only looked up when the ingest starts, so
+        sessions joining a running hub do not wait for it. ingest_ended
+        is called as soon as the ingest exits without being stopped.
+        """
+        self.name = name
+        self.encoder_args = encoder_args
+        self._ffmpeg_binary = ffmpeg_binary
+        self._get_input_source = get_input_source
+        self._ingest_ended = ingest_ended
+        self.host = LOOPBACK_HOST
+        self._slot_ports = self._allocate_ports(max_sessions)
+        self._session_ports: dict[UUID, int] = {}
+        self._ingest: HAFFmpeg | None = None
+        self._start_task: asyncio.Task[bool] | None = None
+        self._monitor_task: asyncio.Task[None] | None = None
+
+    @property
+    def session_count(self) -> int:
+        """Return the number of sessions attached to the hub."""
+        return len(self._session_ports)
+
+    @property
+    def is_running(self) -> bool:
+        """Return True if the ingest process is running."""
+        return self._ingest is not None and self._ingest.is_running
+
+    @classmethod
+    def _allocate_ports(cls, count: int) -> list[int]:
+        """Pick free loopback ports that no other hub sends to.
+
+        The ports are free when picked, the session processes bind them
+        once they attach.
+        """
+        ports: list[int] = []
+        while len(ports) < count:
+            with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+                sock.bind((LOOPBACK_HOST, 0))
+                port: int = sock.getsockname()[1]
+            if port not in cls._ports_in_use:
+                cls._ports_in_use.add(port)
+                ports.append(port)
+        return ports
+
+    @callback
+    def async_add_session(self, session_id: UUID) -> int | None:
+        """Attach a session and return the port it reads from.
+
+        Returns None when every slot of the hub is taken.
+        """
+        taken = set(self._session_ports.values())
+        for port in self._slot_ports:
+            if port not in taken:
+                self._session_ports[session_id] = port
+                return port
+        return None
+
+    @callback
+    def async_remove_session(self, session_id: UUID) -> bool:
+        """Detach a session and return True if it was the last one."""
+        self._session_ports.pop(session_id, None)
+        return not self._session_ports
+
+    async def async_start(self) -> bool:
+        """Start the ingest unless it is already started.
+
+        Sessions starting at the same time wait for the same ingest. A
+        failed start is retried by the next session.
+        """
+        if self._start_task is None:
+            self._start_task = create_eager_task(self._async_start())
+        start_task = self._start_task
+        started = False
+        try:
+            started = await asyncio.shield(start_task)
+        finally:
+            if not started and start_task.done() and self._start_task is start_task:
+                self._start_task = None
+        return started
+
+    async def _async_start(self) -> bool:
+        """Start the ingest process."""
+        if not (input_source := await self._get_input_source()):
+            return False
+        slots = "|".join(
+            SLOT_OUTPUT.format(host=self.host, port=port, pkt_size=MPEGTS_PACKET_SIZE)
+            for port in self._slot_ports
+        )
+        output = INGEST_OUTPUT.format(encoder_args=self.encoder_args, slots=slots)
+        _LOGGER.debug("%s: FFmpeg ingest settings: %s", self.name, output)
+        ingest = HAFFmpeg(self._ffmpeg_binary)
+        opened = await ingest.open(
+            cmd=[],
+            input_source=input_source,
+            output=output,
+            extra_cmd="-hide_banner -nostats",
+            stderr_pipe=True,
+            stdout_pipe=False,
+        )
+        if not opened:
+            _LOGGER.error("Failed to open ffmpeg ingest")
+            return False
+        self._ingest = ingest
+        _LOGGER.debug(
+            "%s: Started ingest process - PID %d", self.name, ingest.process.pid
+        )
+        stderr_reader = await ingest.get_reader(source=FFMPEG_STDERR)
+        self._monitor_task = create_eager_task(
+            self._async_monitor_ingest(ingest.process, stderr_reader)
+        )
+        return True
+
+    async def _async_monitor_ingest(
+        self,
+        process: asyncio.subprocess.Process,
+        stderr_reader: asyncio.StreamReader,
+    ) -> None:
+        """Log output from the ingest and report when it exits."""
+        while line := await stderr_reader.readline():
+            _LOGGER.debug("%s: ffmpeg ingest: %s", self.name, line.rstrip())
+        await process.wait()
+        # async_stop cancels the monitor before stopping the ingest
+        self._monitor_task = None
+        _LOGGER.warning(
+            "%s: Ingest process ended unexpectedly - PID %d", self.name, process.pid
+        )
+        self._ingest_ended(self)
+
+    async def async_stop(self) -> None:
+        """Stop the ingest and release the slot ports."""
+        if self._start_task is not None and not self._start_task.done():
+            await asyncio.wait([self._start_task])
+        if self._monitor_task is not None:
+            self._monitor_task.cancel()
+            self._monitor_task = None
+        self._ports_in_use.difference_update(self._slot_ports)
+        if (ingest := self._ingest) is None:
+            return
+        self._ingest = None
+        if not ingest.is_running:
+            return
+        _LOGGER.debug("%s: Stopping ingest process", self.name)
+        try:
+            await ingest.close()
+        except Exception:
+            _LOGGER.exception("%s: Failed to stop ingest", self.name)
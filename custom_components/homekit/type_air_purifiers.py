@@ -18,11 +18,9 @@ from homeassistant.const import (
 from homeassistant.core import (
     Event,
     EventStateChangedData,
-    HassJobType,
     State,
     callback,
 )
-from homeassistant.helpers.event import async_track_state_change_event
 
 from .accessories import TYPES
 from .const import (
@@ -230,51 +228,41 @@ class AirPurifier(Fan):
         """
         if self.linked_humidity_sensor:
             self._subscriptions.append(
-                async_track_state_change_event(
-                    self.hass,
-                    [self.linked_humidity_sensor],
+                self.driver.state_dispatcher.async_track_entity(
+                    self.linked_humidity_sensor,
                     self._async_update_current_humidity_event,
-                    job_type=HassJobType.Callback,
                 )
             )
 
         if self.linked_pm25_sensor:
             self._subscriptions.append(
-                async_track_state_change_event(
-                    self.hass,
-                    [self.linked_pm25_sensor],
+                self.driver.state_dispatcher.async_track_entity(
+                    self.linked_pm25_sensor,
                     self._async_update_current_pm25_event,
-                    job_type=HassJobType.Callback,
                 )
             )
 
         if self.linked_temperature_sensor:
             self._subscriptions.append(
-                async_track_state_change_event(
-                    self.hass,
-                    [self.linked_temperature_sensor],
+                self.driver.state_dispatcher.async_track_entity(
+                    self.linked_temperature_sensor,
                     self._async_update_current_temperature_event,
-                    job_type=HassJobType.Callback,
                 )
             )
 
         if self.linked_filter_change_indicator_binary_sensor:
             self._subscriptions.append(
-                async_track_state_change_event(
-                    self.hass,
-                    [self.linked_filter_change_indicator_binary_sensor],
+                self.driver.state_dispatcher.async_track_entity(
+                    self.linked_filter_change_indicator_binary_sensor,
                     self._async_update_filter_change_indicator_event,
-                    job_type=HassJobType.Callback,
                 )
             )
 
         if self.linked_filter_life_level_sensor:
             self._subscriptions.append(
-                async_track_state_change_event(
-                    self.hass,
-                    [self.linked_filter_life_level_sensor],
+                self.driver.state_dispatcher.async_track_entity(
+                    self.linked_filter_life_level_sensor,
                     self._async_update_filter_life_level_event,
-                    job_type=HassJobType.Callback,
                 )
             )
 
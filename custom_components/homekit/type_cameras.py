@@ -19,21 +19,19 @@ from homeassistant.components import camera
 from homeassistant.components.ffmpeg import get_ffmpeg_manager
 from homeassistant.const import STATE_ON, STATE_UNAVAILABLE, STATE_UNKNOWN
 from homeassistant.core import (
+    CALLBACK_TYPE,
     Event,
     EventStateChangedData,
-    HassJobType,
     HomeAssistant,
     State,
     callback,
 )
-from homeassistant.helpers.event import (
-    async_track_state_change_event,
-    async_track_time_interval,
-)
+from homeassistant.helpers.event import async_call_later
 from homeassistant.util.async_ import create_eager_task
 
 from .accessories import TYPES, HomeDriver
 from .const import (
+    AUDIO_CODEC_COPY,
     CHAR_MOTION_DETECTED,
     CONF_AUDIO_CODEC,
     CONF_AUDIO_MAP,
@@ -42,8 +40,10 @@ from .const import (
     CONF_MAX_FPS,
     CONF_MAX_HEIGHT,
     CONF_MAX_WIDTH,
+    CONF_SNAPSHOT_TTL,
     CONF_STREAM_ADDRESS,
     CONF_STREAM_COUNT,
+    CONF_STREAM_PREWARM,
     CONF_STREAM_SOURCE,
     CONF_SUPPORT_AUDIO,
     CONF_VIDEO_CODEC,
@@ -56,6 +56,7 @@ from .const import (
     DEFAULT_MAX_FPS,
     DEFAULT_MAX_HEIGHT,
     DEFAULT_MAX_WIDTH,
+    DEFAULT_SNAPSHOT_TTL,
     DEFAULT_STREAM_COUNT,
     DEFAULT_SUPPORT_AUDIO,
     DEFAULT_VIDEO_CODEC,
@@ -65,18 +66,39 @@ from .const import (
     SERV_MOTION_SENSOR,
 )
 from .doorbell import HomeDoorbellAccessory
-from .util import pid_is_alive, state_changed_event_is_same_state
+from .snapshot_cache import CameraSnapshotCache
+from .stream_hub import CameraStreamHub
+from .util import state_changed_event_is_same_state
 
 _LOGGER = logging.getLogger(__name__)
 
 
-VIDEO_OUTPUT = (
-    "-map {v_map} -an "
+# The encoders run once per stream hub, the outputs once per session
+VIDEO_ENCODER = (
+    "-map {v_map} "
     "-c:v {v_codec} "
     "{v_profile}"
-    "-tune zerolatency -pix_fmt yuv420p "
+    "{v_gop}"
+    "-tune:v zerolatency -pix_fmt yuv420p "
     "-r {fps} "
-    "-b:v {v_max_bitrate}k -bufsize {v_bufsize}k -maxrate {v_max_bitrate}k "
+    "-b:v {v_max_bitrate}k -bufsize:v {v_bufsize}k -maxrate:v {v_max_bitrate}k"
+)
+
+AUDIO_ENCODER = (
+    "-map {a_map} "
+    "-c:a {a_encoder} "
+    "{a_application}"
+    "-ac 1 -ar {a_sample_rate}k "
+    "-b:a {a_max_bitrate}k -bufsize:a {a_bufsize}k "
+    "{a_frame_duration}"
+)
+
+HUB_INPUT = (
+    "-fflags nobuffer -analyzeduration 1000000 -f mpegts "
+    "-i udp://{hub_host}:{hub_port}?timeout={hub_timeout}&overrun_nonfatal=1"
+)
+
+VIDEO_RTP_OUTPUT = (
     "-payload_type 99 "
     "-ssrc {v_ssrc} -f rtp "
     "-srtp_out_suite AES_CM_128_HMAC_SHA1_80 -srtp_out_params {v_srtp_key} "
@@ -84,18 +106,20 @@ VIDEO_OUTPUT = (
     "localrtpport={v_port}&pkt_size={v_pkt_size}"
 )
 
-AUDIO_OUTPUT = (
-    "-map {a_map} -vn "
-    "-c:a {a_encoder} "
-    "{a_application}"
-    "-ac 1 -ar {a_sample_rate}k "
-    "-b:a {a_max_bitrate}k -bufsize {a_bufsize}k "
-    "{a_frame_duration}"
+AUDIO_RTP_OUTPUT = (
     "-payload_type 110 "
     "-ssrc {a_ssrc} -f rtp "
     "rtp://127.0.0.1:{a_proxy_port}?pkt_size={a_pkt_size}"
 )
 
+# Sessions of a stream hub copy the streams encoded by its ingest
+HUB_VIDEO_OUTPUT = "-map 0:v:0 -an -c:v copy " + VIDEO_RTP_OUTPUT
+HUB_AUDIO_OUTPUT = "-map 0:a:0 -vn -c:a copy " + AUDIO_RTP_OUTPUT
+
+# Sessions without a stream hub encode the camera source themselves
+VIDEO_OUTPUT = VIDEO_ENCODER + " -an " + VIDEO_RTP_OUTPUT
+AUDIO_OUTPUT = AUDIO_ENCODER + "-vn " + AUDIO_RTP_OUTPUT
+
 SLOW_RESOLUTIONS = [
     (320, 180, 15),
     (320, 240, 15),
@@ -116,11 +140,11 @@ RESOLUTIONS = [
     (1600, 1200),
 ]
 
-FFMPEG_WATCH_INTERVAL = timedelta(seconds=5)
-FFMPEG_LOGGER = "ffmpeg_logger"
-FFMPEG_WATCHER = "ffmpeg_watcher"
-FFMPEG_PID = "ffmpeg_pid"
+# A session process exits when its hub sends nothing for this long
+HUB_READ_TIMEOUT = timedelta(seconds=5)
+FFMPEG_MONITOR = "ffmpeg_monitor"
 AUDIO_PROXY = "audio_proxy"
+STREAM_HUB = "stream_hub"
 SESSION_ID = "session_id"
 
 CONFIG_DEFAULTS = {
@@ -136,6 +160,7 @@ CONFIG_DEFAULTS = {
     CONF_AUDIO_PACKET_SIZE: DEFAULT_AUDIO_PACKET_SIZE,
     CONF_VIDEO_PACKET_SIZE: DEFAULT_VIDEO_PACKET_SIZE,
     CONF_STREAM_COUNT: DEFAULT_STREAM_COUNT,
+    CONF_SNAPSHOT_TTL: DEFAULT_SNAPSHOT_TTL,
 }
 
 
@@ -156,6 +181,12 @@ class Camera(HomeDoorbellAccessory, PyhapCamera):  # type: ignore[misc]
     ) -> None:
         """Initialize a Camera accessory object."""
         self._ffmpeg = get_ffmpeg_manager(hass)
+        self._stream_hubs: dict[str, CameraStreamHub] = {}
+        self._prewarm_window: float = config.get(CONF_STREAM_PREWARM, 0)
+        self._prewarm_hub: CameraStreamHub | None = None
+        self._cancel_prewarm: CALLBACK_TYPE | None = None
+        # Pre-warming reuses the settings the controllers negotiated last
+        self._last_encoder_args: str | None = None
         for config_key, conf in CONFIG_DEFAULTS.items():
             if config_key not in config:
                 config[config_key] = conf
@@ -216,6 +247,9 @@ class Camera(HomeDoorbellAccessory, PyhapCamera):  # type: ignore[misc]
             options=options,
         )
 
+        self._snapshot_cache = CameraSnapshotCache(
+            hass, entity_id, config[CONF_SNAPSHOT_TTL]
+        )
         self._char_motion_detected = None
         self.linked_motion_sensor: str | None = self.config.get(
             CONF_LINKED_MOTION_SENSOR
@@ -241,11 +275,9 @@ class Camera(HomeDoorbellAccessory, PyhapCamera):  # type: ignore[misc]
         if self._char_motion_detected:
             assert self.linked_motion_sensor
             self._subscriptions.append(
-                async_track_state_change_event(
-                    self.hass,
+                self.driver.state_dispatcher.async_track_entity(
                     self.linked_motion_sensor,
                     self._async_update_motion_state_event,
-                    job_type=HassJobType.Callback,
                 )
             )
 
@@ -283,6 +315,7 @@ class Camera(HomeDoorbellAccessory, PyhapCamera):  # type: ignore[misc]
             )
             char.set_value(True)
             char.set_value(False)
+            self._async_activity_detected()
             return
 
         detected = state == STATE_ON
@@ -296,12 +329,81 @@ class Camera(HomeDoorbellAccessory, PyhapCamera):  # type: ignore[misc]
             self.linked_motion_sensor,
             detected,
         )
+        if detected and old_state is not None:
+            self._async_activity_detected()
 
     @callback
     @override
     def async_update_state(self, new_state: State | None) -> None:
         """Handle state change to update HomeKit value."""
 
+    @callback
+    @override
+    def async_doorbell_pressed(self) -> None:
+        """Handle a press of the linked doorbell."""
+        self._async_activity_detected()
+
+    @callback
+    def _async_activity_detected(self) -> None:
+        """Prepare for a controller viewing the camera after a notification."""
+        # The next snapshot must show what triggered the notification
+        self._snapshot_cache.async_clear()
+        self._async_prewarm_stream()
+
+    @callback
+    @override
+    def async_get_stats(self) -> dict[str, Any]:
+        """Return the counters of the accessory and its snapshot cache."""
+        stats = super().async_get_stats()
+        stats["snapshots"] = self._snapshot_cache.async_get_stats()
+        return stats
+
+    @callback
+    def _async_prewarm_stream(self) -> None:
+        """Start the ingest before a controller asks for a stream.
+
+        The ingest runs with the settings of the last stream and is kept
+        for the pre-warm window, so a stream opened from the doorbell or
+        motion notification attaches to it instead of starting ffmpeg.
+        """
+        if not self._prewarm_window or self._last_encoder_args is None:
+            return
+        hub = self._async_get_stream_hub(self._last_encoder_args)
+        if self._prewarm_hub is not hub:
+            self._async_end_prewarm()
+            self._prewarm_hub = hub
+            _LOGGER.debug("%s: Pre-warming the stream", self.entity_id)
+        elif self._cancel_prewarm is not None:
+            self._cancel_prewarm()
+        self._cancel_prewarm = async_call_later(
+            self.hass, self._prewarm_window, self._async_prewarm_expired
+        )
+        self.hass.async_create_background_task(
+            hub.async_start(), "homekit.camera-prewarm-stream"
+        )
+
+    @callback
+    def _async_prewarm_expired(self, _now: Any) -> None:
+        """End the pre-warm window."""
+        self._cancel_prewarm = None
+        self._async_end_prewarm()
+
+    @callback
+    def _async_end_prewarm(self) -> None:
+        """Stop holding the pre-warmed hub, stopping it if it is unused."""
+        if self._cancel_prewarm is not None:
+            self._cancel_prewarm()
+            self._cancel_prewarm = None
+        if (hub := self._prewarm_hub) is None:
+            return
+        self._prewarm_hub = None
+        if hub.session_count:
+            return
+        self._async_remove_stream_hub(hub)
+        self.hass.async_create_background_task(
+            hub.async_stop(), "homekit.camera-stop-stream-hub"
+        )
+
     async def _async_get_stream_source(self) -> str | None:
         """Find the camera stream source url."""
         stream_source: str | None = self.config.get(CONF_STREAM_SOURCE)
@@ -318,21 +420,50 @@ class Camera(HomeDoorbellAccessory, PyhapCamera):  # type: ignore[misc]
             )
         return stream_source
 
+    @callback
+    def _async_get_stream_hub(self, encoder_args: str) -> CameraStreamHub:
+        """Return the stream hub running the encoder, creating it if needed."""
+        if (hub := self._stream_hubs.get(encoder_args)) is None:
+            hub = self._stream_hubs[encoder_args] = CameraStreamHub(
+                self.display_name,
+                self._ffmpeg.binary,
+                encoder_args,
+                self.config[CONF_STREAM_COUNT],
+                self._async_get_input_source,
+                self._async_stream_hub_ended,
+            )
+        return hub
+
+    @callback
+    def _async_remove_stream_hub(self, hub: CameraStreamHub) -> None:
+        """Stop handing out a stream hub to new sessions."""
+        if self._stream_hubs.get(hub.encoder_args) is hub:
+            del self._stream_hubs[hub.encoder_args]
+
+    async def _async_release_stream_hub(self, session_info: dict[str, Any]) -> None:
+        """Detach a session from its stream hub and stop the unused hub."""
+        if not (hub := session_info.pop(STREAM_HUB, None)):
+            return
+        if not hub.async_remove_session(session_info["id"]):
+            return
+        if hub is self._prewarm_hub:
+            # Kept running until the pre-warm window ends
+            return
+        self._async_remove_stream_hub(hub)
+        await hub.async_stop()
+
     async def start_stream(
         self, session_info: dict[str, Any], stream_config: dict[str, Any]
     ) -> bool:
         """Start a new stream with the given configuration."""
+        session_id = session_info["id"]
         _LOGGER.debug(
             "[%s] Starting stream with the following parameters: %s",
-            session_info["id"],
+            session_id,
             stream_config,
         )
-        if not (input_source := await self._async_get_stream_source()):
-            _LOGGER.error("Camera has no stream source")
-            return False
-        if "-i " not in input_source:
-            input_source = "-i " + input_source
         video_profile = ""
+        video_gop = ""
         if self.config[CONF_VIDEO_CODEC] != "copy":
             video_profile = (
                 "-profile:v "
@@ -341,6 +472,8 @@ class Camera(HomeDoorbellAccessory, PyhapCamera):  # type: ignore[misc]
                 ]
                 + " "
             )
+            # Sessions joining a running ingest start at the next keyframe
+            video_gop = f"-g {stream_config['fps']} "
         audio_application = ""
         audio_frame_duration = ""
         if self.config[CONF_AUDIO_CODEC] == "libopus":
@@ -348,6 +481,32 @@ class Camera(HomeDoorbellAccessory, PyhapCamera):  # type: ignore[misc]
             audio_frame_duration = (
                 f"-frame_duration {stream_config.get('a_packet_time', 20)} "
             )
+        output_vars = stream_config.copy()
+        output_vars.update(
+            {
+                "v_profile": video_profile,
+                "v_gop": video_gop,
+                "v_bufsize": stream_config["v_max_bitrate"] * 4,
+                "v_map": self.config[CONF_VIDEO_MAP],
+                "v_pkt_size": self.config[CONF_VIDEO_PACKET_SIZE],
+                "v_codec": self.config[CONF_VIDEO_CODEC],
+                "a_bufsize": stream_config["a_max_bitrate"] * 4,
+                "a_map": self.config[CONF_AUDIO_MAP],
+                "a_pkt_size": self.config[CONF_AUDIO_PACKET_SIZE],
+                "a_encoder": self.config[CONF_AUDIO_CODEC],
+                "a_application": audio_application,
+                "a_frame_duration": audio_frame_duration,
+            }
+        )
+        if self._async_can_use_stream_hub():
+            input_source = await self._async_attach_stream_hub(
+                session_info, output_vars
+            )
+        else:
+            input_source = await self._async_get_input_source()
+        if input_source is None:
+            return False
+
         # Start audio proxy to convert Opus RTP timestamps from 48kHz
         # (FFmpeg's hardcoded Opus RTP clock rate per RFC 7587) to the
         # sample rate negotiated by HomeKit (typically 16kHz).
@@ -369,26 +528,14 @@ class Camera(HomeDoorbellAccessory, PyhapCamera):  # type: ignore[misc]
                 await audio_proxy.async_stop()
                 audio_proxy = None
 
-        output_vars = stream_config.copy()
-        output_vars.update(
-            {
-                "v_profile": video_profile,
-                "v_bufsize": stream_config["v_max_bitrate"] * 4,
-                "v_map": self.config[CONF_VIDEO_MAP],
-                "v_pkt_size": self.config[CONF_VIDEO_PACKET_SIZE],
-                "v_codec": self.config[CONF_VIDEO_CODEC],
-                "a_bufsize": stream_config["a_max_bitrate"] * 4,
-                "a_map": self.config[CONF_AUDIO_MAP],
-                "a_pkt_size": self.config[CONF_AUDIO_PACKET_SIZE],
-                "a_encoder": self.config[CONF_AUDIO_CODEC],
-                "a_application": audio_application,
-                "a_frame_duration": audio_frame_duration,
-                "a_proxy_port": audio_proxy.local_port if audio_proxy else 0,
-            }
-        )
-        output = VIDEO_OUTPUT.format(**output_vars)
+        output_vars["a_proxy_port"] = audio_proxy.local_port if audio_proxy else 0
+        if STREAM_HUB in session_info:
+            video_output, audio_output = HUB_VIDEO_OUTPUT, HUB_AUDIO_OUTPUT
+        else:
+            video_output, audio_output = VIDEO_OUTPUT, AUDIO_OUTPUT
+        output = video_output.format(**output_vars)
         if self.config[CONF_SUPPORT_AUDIO]:
-            output = output + " " + AUDIO_OUTPUT.format(**output_vars)
+            output = output + " " + audio_output.format(**output_vars)
         _LOGGER.debug("FFmpeg output settings: %s", output)
         stream = HAFFmpeg(self._ffmpeg.binary)
         opened = await stream.open(
@@ -403,69 +550,129 @@ class Camera(HomeDoorbellAccessory, PyhapCamera):  # type: ignore[misc]
             _LOGGER.error("Failed to open ffmpeg stream")
             if audio_proxy:
                 await audio_proxy.async_stop()
+            await self._async_release_stream_hub(session_info)
             return False
 
         _LOGGER.debug(
             "[%s] Started stream process - PID %d",
-            session_info["id"],
+            session_id,
             stream.process.pid,
         )
 
         session_info["stream"] = stream
-        session_info[FFMPEG_PID] = stream.process.pid
         session_info[AUDIO_PROXY] = audio_proxy
 
         stderr_reader = await stream.get_reader(source=FFMPEG_STDERR)
+        # The monitor reports an exit as it happens, so an exit right after
+        # starting is reported the same way as a later one.
+        session_info[FFMPEG_MONITOR] = create_eager_task(
+            self._async_monitor_stream(session_info, stream.process, stderr_reader)
+        )
+        return True
 
-        async def watch_session(_: Any) -> None:
-            await self._async_ffmpeg_watch(session_info["id"])
+    @callback
+    def _async_can_use_stream_hub(self) -> bool:
+        """Return True if the ingest output can carry the streams.
 
-        session_info[FFMPEG_LOGGER] = create_eager_task(
-            self._async_log_stderr_stream(stderr_reader)
+        Copied audio can be PCM or G.711 from the camera, which MPEG-TS
+        cannot carry, so those sessions encode the source themselves.
+        """
+        return not (
+            self.config[CONF_SUPPORT_AUDIO]
+            and self.config[CONF_AUDIO_CODEC] == AUDIO_CODEC_COPY
         )
-        session_info[FFMPEG_WATCHER] = async_track_time_interval(
-            self.hass,
-            watch_session,
-            FFMPEG_WATCH_INTERVAL,
+
+    async def _async_attach_stream_hub(
+        self, session_info: dict[str, Any], output_vars: dict[str, Any]
+    ) -> str | None:
+        """Attach a session to the stream hub of its settings and start it.
+
+        Returns the input of the session process, which is the camera
+        source when every slot of the hub is taken, or None if the ingest
+        failed to start.
+        """
+        encoder_args = VIDEO_ENCODER.format(**output_vars)
+        if self.config[CONF_SUPPORT_AUDIO]:
+            encoder_args = encoder_args + " " + AUDIO_ENCODER.format(**output_vars)
+        # Sessions that negotiated the same encoder settings share an ingest
+        self._last_encoder_args = encoder_args
+        hub = self._async_get_stream_hub(encoder_args)
+        if (port := hub.async_add_session(session_info["id"])) is None:
+            _LOGGER.debug(
+                "%s: Every slot of the stream hub is taken, encoding the source",
+                self.entity_id,
+            )
+            return await self._async_get_input_source()
+        session_info[STREAM_HUB] = hub
+        started = False
+        try:
+            started = await hub.async_start()
+        finally:
+            if not started:
+                await self._async_release_stream_hub(session_info)
+        if not started:
+            return None
+        return HUB_INPUT.format(
+            hub_host=hub.host,
+            hub_port=port,
+            hub_timeout=int(HUB_READ_TIMEOUT.total_seconds() * 1000000),
         )
 
-        return await self._async_ffmpeg_watch(session_info["id"])
+    async def _async_get_input_source(self) -> str | None:
+        """Return the camera source as the input of a session process."""
+        if not (input_source := await self._async_get_stream_source()):
+            _LOGGER.error("Camera has no stream source")
+            return None
+        if "-i " not in input_source:
+            input_source = "-i " + input_source
+        return input_source
 
-    async def _async_log_stderr_stream(
-        self, stderr_reader: asyncio.StreamReader
+    async def _async_monitor_stream(
+        self,
+        session_info: dict[str, Any],
+        process: asyncio.subprocess.Process,
+        stderr_reader: asyncio.StreamReader,
     ) -> None:
-        """Log output from ffmpeg."""
+        """Log output from ffmpeg and release the stream when it exits."""
         _LOGGER.debug("%s: ffmpeg: started", self.display_name)
-        while True:
-            line = await stderr_reader.readline()
-            if line == b"":
-                return
-
+        while line := await stderr_reader.readline():
             _LOGGER.debug("%s: ffmpeg: %s", self.display_name, line.rstrip())
+        await process.wait()
+        # stop_stream cancels the monitor before stopping the process
+        session_info.pop(FFMPEG_MONITOR, None)
+        _LOGGER.warning("Streaming process ended unexpectedly - PID %d", process.pid)
+        self.set_streaming_available(session_info["stream_idx"])
+        await self._async_release_stream_hub(session_info)
 
-    async def _async_ffmpeg_watch(self, session_id: str) -> bool:
-        """Check to make sure ffmpeg is still running and cleanup if not."""
-        ffmpeg_pid = self.sessions[session_id][FFMPEG_PID]
-        if pid_is_alive(ffmpeg_pid):
-            return True
-
-        _LOGGER.warning("Streaming process ended unexpectedly - PID %d", ffmpeg_pid)
-        self._async_stop_ffmpeg_watch(session_id)
-        self.set_streaming_available(self.sessions[session_id]["stream_idx"])
-        return False
+    @callback
+    def _async_stop_ffmpeg_monitor(self, session_info: dict[str, Any]) -> None:
+        """Stop monitoring the ffmpeg process of a session."""
+        if monitor := session_info.pop(FFMPEG_MONITOR, None):
+            monitor.cancel()
 
     @callback
-    def _async_stop_ffmpeg_watch(self, session_id: str) -> None:
-        """Cleanup a streaming session after stopping."""
-        if FFMPEG_WATCHER not in self.sessions[session_id]:
-            return
-        self.sessions[session_id].pop(FFMPEG_WATCHER)()
-        self.sessions[session_id].pop(FFMPEG_LOGGER).cancel()
+    def _async_stream_hub_ended(self, hub: CameraStreamHub) -> None:
+        """Release the sessions of a stream hub whose ingest exited.
+
+        The session processes would only exit once their input times
+        out, so they are stopped right away.
+        """
+        self._async_remove_stream_hub(hub)
+        if hub is self._prewarm_hub:
+            self._async_end_prewarm()
+        for session_info in self.sessions.values():
+            if session_info.get(STREAM_HUB) is not hub:
+                continue
+            self.set_streaming_available(session_info["stream_idx"])
+            self.hass.async_create_background_task(
+                self.stop_stream(session_info), "homekit.camera-stop-stream"
+            )
 
     @callback
     @override
     def async_stop(self) -> None:
         """Stop any streams when the accessory is stopped."""
+        self._async_end_prewarm()
         for session_info in self.sessions.values():
             self.hass.async_create_background_task(
                 self.stop_stream(session_info), "homekit.camera-stop-stream"
@@ -474,17 +681,23 @@ class Camera(HomeDoorbellAccessory, PyhapCamera):  # type: ignore[misc]
 
     async def stop_stream(self, session_info: dict[str, Any]) -> None:
         """Stop the stream for the given ``session_id``."""
-        session_id = session_info["id"]
         if proxy := session_info.pop(AUDIO_PROXY, None):
             await proxy.async_stop()
+        try:
+            await self._async_stop_stream_process(session_info)
+        finally:
+            await self._async_release_stream_hub(session_info)
 
+    async def _async_stop_stream_process(self, session_info: dict[str, Any]) -> None:
+        """Stop the ffmpeg process of a session."""
+        session_id = session_info["id"]
         if not (stream := session_info.get("stream")):
             _LOGGER.debug("No stream for session ID %s", session_id)
             return
 
-        self._async_stop_ffmpeg_watch(session_id)
+        self._async_stop_ffmpeg_monitor(session_info)
 
-        if not pid_is_alive(stream.process.pid):
+        if not stream.is_running:
             _LOGGER.warning("[%s] Stream already stopped", session_id)
             return
 
@@ -505,12 +718,13 @@ class Camera(HomeDoorbellAccessory, PyhapCamera):  # type: ignore[misc]
         """Reconfigure the stream so that it uses the given ``stream_config``."""
         return True
 
+    @property
+    def snapshots_cached(self) -> bool:
+        """Return True if fetched snapshots are reused by later requests."""
+        return bool(self.config[CONF_SNAPSHOT_TTL])
+
     async def async_get_snapshot(self, image_size: dict[str, int]) -> bytes:
         """Return a jpeg of a snapshot from the camera."""
-        image = await camera.async_get_image(
-            self.hass,
-            self.entity_id,
-            width=image_size["image-width"],
-            height=image_size["image-height"],
+        return await self._snapshot_cache.async_get(
+            image_size["image-width"], image_size["image-height"]
         )
-        return image.content
@@ -34,11 +34,9 @@ from homeassistant.const import (
 from homeassistant.core import (
     Event,
     EventStateChangedData,
-    HassJobType,
     State,
     callback,
 )
-from homeassistant.helpers.event import async_track_state_change_event
 
 from .accessories import TYPES, HomeAccessory
 from .const import (
@@ -136,11 +134,9 @@ class GarageDoorOpener(HomeAccessory):
         """
         if self.linked_obstruction_sensor:
             self._subscriptions.append(
-                async_track_state_change_event(
-                    self.hass,
-                    [self.linked_obstruction_sensor],
+                self.driver.state_dispatcher.async_track_entity(
+                    self.linked_obstruction_sensor,
                     self._async_update_obstruction_event,
-                    job_type=HassJobType.Callback,
                 )
             )
 
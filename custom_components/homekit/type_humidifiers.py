@@ -28,11 +28,9 @@ from homeassistant.const import (
 from homeassistant.core import (
     Event,
     EventStateChangedData,
-    HassJobType,
     State,
     callback,
 )
-from homeassistant.helpers.event import async_track_state_change_event
 
 from .accessories import TYPES, HomeAccessory
 from .const import (
@@ -187,11 +185,9 @@ class HumidifierDehumidifier(HomeAccessory):
         """
         if self.linked_humidity_sensor:
             self._subscriptions.append(
-                async_track_state_change_event(
-                    self.hass,
-                    [self.linked_humidity_sensor],
+                self.driver.state_dispatcher.async_track_entity(
+                    self.linked_humidity_sensor,
                     self.async_update_current_humidity_event,
-                    job_type=HassJobType.Callback,
                 )
             )
 
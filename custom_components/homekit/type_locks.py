@@ -60,6 +60,8 @@ class Lock(HomeDoorbellAccessory):
     The lock entity must support: unlock and lock.
     """
 
+    relevant_attributes: frozenset[str] = frozenset()
+
     def __init__(self, *args: Any) -> None:
         """Initialize a Lock accessory object."""
         super().__init__(*args, category=CATEGORY_DOOR_LOCK)
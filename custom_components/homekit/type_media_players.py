@@ -85,6 +85,8 @@ MEDIA_PLAYER_OFF_STATES = (
 class MediaPlayer(HomeAccessory):
     """Generate a Media Player accessory."""
 
+    relevant_attributes = frozenset({ATTR_MEDIA_VOLUME_MUTED})
+
     def __init__(self, *args: Any) -> None:
         """Initialize a Switch accessory object."""
         super().__init__(*args, category=CATEGORY_SWITCH)
@@ -255,6 +257,10 @@ class MediaPlayer(HomeAccessory):
 class TelevisionMediaPlayer(RemoteInputSelectAccessory):
     """Generate a Television Media Player accessory."""
 
+    relevant_attributes = frozenset(
+        {ATTR_INPUT_SOURCE, ATTR_INPUT_SOURCE_LIST, ATTR_MEDIA_VOLUME_MUTED}
+    )
+
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         """Initialize a Television Media Player accessory object."""
         super().__init__(
@@ -3,8 +3,10 @@
 
 from collections.abc import Callable
 import logging
+import time
 from typing import Any, NamedTuple, override
 
+from pyhap.characteristic import Characteristic
 from pyhap.const import CATEGORY_SENSOR
 from pyhap.service import Service
 
@@ -16,7 +18,8 @@ from homeassistant.const import (
     STATE_ON,
     UnitOfTemperature,
 )
-from homeassistant.core import State, callback
+from homeassistant.core import CALLBACK_TYPE, State, callback
+from homeassistant.helpers.event import async_call_later
 
 from .accessories import TYPES, HomeAccessory
 from .const import (
@@ -41,6 +44,8 @@ from .const import (
     CHAR_SMOKE_DETECTED,
     CHAR_STATUS_LOW_BATTERY,
     CHAR_VOC_DENSITY,
+    CONF_DEADBAND,
+    CONF_MIN_INTERVAL,
     CONF_THRESHOLD_CO,
     CONF_THRESHOLD_CO2,
     PROP_CELSIUS,
@@ -116,13 +121,128 @@ BINARY_SENSOR_SERVICE_MAP: dict[str, SI] = {
 }
 
 
+class SensorUpdateThrottle:
+    """Limit the updates of a numeric sensor characteristic.
+
+    A value within the deadband of the current value is skipped. A value
+    arriving sooner than min_interval after the last update is held, and
+    the latest held value is sent once the interval passed.
+    """
+
+    def __init__(
+        self, accessory: HomeAccessory, char: Characteristic, name: str
+    ) -> None:
+        """Initialize a SensorUpdateThrottle object."""
+        self._accessory = accessory
+        self._char = char
+        self.name = name
+        self._deadband: float = accessory.config.get(CONF_DEADBAND, 0)
+        self._min_interval: float = accessory.config.get(CONF_MIN_INTERVAL, 0)
+        self._last_update = 0.0
+        self._initialized = False
+        self._pending: float | None = None
+        self._cancel_pending: CALLBACK_TYPE | None = None
+        self.sent = 0
+        self.suppressed = 0
+
+    @callback
+    def async_set_value(self, value: float) -> None:
+        """Set the value unless it is throttled."""
+        if not self._initialized:
+            # The first value syncs the characteristic and is always set
+            self._initialized = True
+            self._async_send(value)
+            return
+        current = self._char.value
+        if value == current or abs(value - current) < self._deadband:
+            if value != current:
+                self.suppressed += 1
+            # A held value is outdated once the sensor is back in range
+            self.async_cancel()
+            return
+        if (remaining := self._last_update + self._min_interval - time.monotonic()) > 0:
+            if self._cancel_pending is None:
+                self._cancel_pending = async_call_later(
+                    self._accessory.hass, remaining, self._async_send_pending
+                )
+            else:
+                self.suppressed += 1
+            self._pending = value
+            return
+        self._async_send(value)
+
+    @callback
+    def _async_send_pending(self, _now: Any) -> None:
+        """Send the latest held value."""
+        self._cancel_pending = None
+        if (value := self._pending) is not None:
+            self._pending = None
+            self._async_send(value)
+
+    @callback
+    def _async_send(self, value: float) -> None:
+        """Set the characteristic value."""
+        self._last_update = time.monotonic()
+        previous = self._char.value
+        self._char.set_value(value)
+        # pyhap rounds to minStep and only notifies when the value changed
+        if self._char.value != previous:
+            self.sent += 1
+        _LOGGER.debug("%s: Set %s to %s", self._accessory.entity_id, self.name, value)
+
+    @callback
+    def async_cancel(self) -> None:
+        """Drop the held value."""
+        self._pending = None
+        if self._cancel_pending is not None:
+            self._cancel_pending()
+            self._cancel_pending = None
+
+
+class NumericSensor(HomeAccessory):
+    """Base class for sensors that report a numeric value.
+
+    The value characteristics are throttled by the deadband and
+    min_interval options of the entity config.
+    """
+
+    relevant_attributes: frozenset[str] = frozenset()
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize a NumericSensor accessory object."""
+        super().__init__(*args, **kwargs)
+        self.update_throttles: list[SensorUpdateThrottle] = []
+
+    @callback
+    @override
+    def async_get_stats(self) -> dict[str, Any]:
+        """Return the counters of the accessory and its throttles."""
+        stats = super().async_get_stats()
+        stats["update_throttles"] = {
+            throttle.name: {"sent": throttle.sent, "suppressed": throttle.suppressed}
+            for throttle in self.update_throttles
+        }
+        return stats
+
+    def add_update_throttle(
+        self, char: Characteristic, name: str
+    ) -> SensorUpdateThrottle:
+        """Throttle the updates of a characteristic."""
+        throttle = SensorUpdateThrottle(self, char, name)
+        self.update_throttles.append(throttle)
+        self._subscriptions.append(throttle.async_cancel)
+        return throttle
+
+
 @TYPES.register("TemperatureSensor")
-class TemperatureSensor(HomeAccessory):
+class TemperatureSensor(NumericSensor):
     """Generate a TemperatureSensor accessory for a temperature sensor.
 
     Sensor entity must return temperature in °C, °F.
     """
 
+    relevant_attributes = frozenset({ATTR_UNIT_OF_MEASUREMENT})
+
     def __init__(self, *args: Any) -> None:
         """Initialize a TemperatureSensor accessory object."""
         super().__init__(*args, category=CATEGORY_SENSOR)
@@ -132,6 +252,7 @@ class TemperatureSensor(HomeAccessory):
         self.char_temp = serv_temp.configure_char(
             CHAR_CURRENT_TEMPERATURE, value=0, properties=PROP_CELSIUS
         )
+        self.throttle_temp = self.add_update_throttle(self.char_temp, "temperature")
         # Set the state so it is in sync on initial
         # GET to avoid an event storm after homekit startup
         self.async_update_state(state)
@@ -145,14 +266,11 @@ class TemperatureSensor(HomeAccessory):
         )
         if (temperature := convert_to_float(new_state.state)) is not None:
             temperature = temperature_to_homekit(temperature, unit)
-            self.char_temp.set_value(temperature)
-            _LOGGER.debug(
-                "%s: Current temperature set to %.1f°C", self.entity_id, temperature
-            )
+            self.throttle_temp.async_set_value(temperature)
 
 
 @TYPES.register("HumiditySensor")
-class HumiditySensor(HomeAccessory):
+class HumiditySensor(NumericSensor):
     """Generate a HumiditySensor accessory as humidity sensor."""
 
     def __init__(self, *args: Any) -> None:
@@ -164,6 +282,9 @@ class HumiditySensor(HomeAccessory):
         self.char_humidity = serv_humidity.configure_char(
             CHAR_CURRENT_HUMIDITY, value=0
         )
+        self.throttle_humidity = self.add_update_throttle(
+            self.char_humidity, "humidity"
+        )
         # Set the state so it is in sync on initial
         # GET to avoid an event storm after homekit startup
         self.async_update_state(state)
@@ -173,12 +294,11 @@ class HumiditySensor(HomeAccessory):
     def async_update_state(self, new_state: State) -> None:
         """Update accessory after state change."""
         if (humidity := convert_to_float(new_state.state)) is not None:
-            self.char_humidity.set_value(humidity)
-            _LOGGER.debug("%s: Percent set to %d%%", self.entity_id, humidity)
+            self.throttle_humidity.async_set_value(humidity)
 
 
 @TYPES.register("AirQualitySensor")
-class AirQualitySensor(HomeAccessory):
+class AirQualitySensor(NumericSensor):
     """Generate a AirQualitySensor accessory as air quality sensor."""
 
     def __init__(self, *args: Any) -> None:
@@ -187,6 +307,7 @@ class AirQualitySensor(HomeAccessory):
         state = self.hass.states.get(self.entity_id)
         assert state
         self.create_services()
+        self.throttle_density = self.add_update_throttle(self.char_density, "density")
 
         # Set the state so it is in sync on initial
         # GET to avoid an event storm after homekit startup
@@ -207,9 +328,7 @@ class AirQualitySensor(HomeAccessory):
     def async_update_state(self, new_state: State) -> None:
         """Update accessory after state change."""
         if (density := convert_to_float(new_state.state)) is not None:
-            if self.char_density.value != density:
-                self.char_density.set_value(density)
-                _LOGGER.debug("%s: Set density to %d", self.entity_id, density)
+            self.throttle_density.async_set_value(density)
             air_quality = density_to_air_quality(density)
             self.char_quality.set_value(air_quality)
             _LOGGER.debug("%s: Set air_quality to %d", self.entity_id, air_quality)
@@ -235,9 +354,7 @@ class PM10Sensor(AirQualitySensor):
         density = convert_to_float(new_state.state)
         if density is None:
             return
-        if self.char_density.value != density:
-            self.char_density.set_value(density)
-            _LOGGER.debug("%s: Set density to %d", self.entity_id, density)
+        self.throttle_density.async_set_value(density)
         air_quality = density_to_air_quality_pm10(density)
         if self.char_quality.value != air_quality:
             self.char_quality.set_value(air_quality)
@@ -264,9 +381,7 @@ class PM25Sensor(AirQualitySensor):
         density = convert_to_float(new_state.state)
         if density is None:
             return
-        if self.char_density.value != density:
-            self.char_density.set_value(density)
-            _LOGGER.debug("%s: Set density to %d", self.entity_id, density)
+        self.throttle_density.async_set_value(density)
         air_quality = density_to_air_quality(density)
         if self.char_quality.value != air_quality:
             self.char_quality.set_value(air_quality)
@@ -295,9 +410,7 @@ class NitrogenDioxideSensor(AirQualitySensor):
         density = convert_to_float(new_state.state)
         if density is None:
             return
-        if self.char_density.value != density:
-            self.char_density.set_value(density)
-            _LOGGER.debug("%s: Set density to %d", self.entity_id, density)
+        self.throttle_density.async_set_value(density)
         air_quality = density_to_air_quality_nitrogen_dioxide(density)
         if self.char_quality.value != air_quality:
             self.char_quality.set_value(air_quality)
@@ -334,9 +447,7 @@ class VolatileOrganicCompoundsSensor(AirQualitySensor):
         density = convert_to_float(new_state.state)
         if density is None:
             return
-        if self.char_density.value != density:
-            self.char_density.set_value(density)
-            _LOGGER.debug("%s: Set density to %d", self.entity_id, density)
+        self.throttle_density.async_set_value(density)
         air_quality = density_to_air_quality_voc(density)
         if self.char_quality.value != air_quality:
             self.char_quality.set_value(air_quality)
@@ -344,7 +455,7 @@ class VolatileOrganicCompoundsSensor(AirQualitySensor):
 
 
 @TYPES.register("CarbonMonoxideSensor")
-class CarbonMonoxideSensor(HomeAccessory):
+class CarbonMonoxideSensor(NumericSensor):
     """Generate a CarbonMonoxidSensor accessory as CO sensor."""
 
     def __init__(self, *args: Any) -> None:
@@ -361,6 +472,7 @@ class CarbonMonoxideSensor(HomeAccessory):
         _LOGGER.debug("%s: Set CO threshold to %d", self.entity_id, self.threshold_co)
 
         self.char_level = serv_co.configure_char(CHAR_CARBON_MONOXIDE_LEVEL, value=0)
+        self.throttle_level = self.add_update_throttle(self.char_level, "level")
         self.char_peak = serv_co.configure_char(
             CHAR_CARBON_MONOXIDE_PEAK_LEVEL, value=0
         )
@@ -376,7 +488,7 @@ class CarbonMonoxideSensor(HomeAccessory):
     def async_update_state(self, new_state: State) -> None:
         """Update accessory after state change."""
         if (value := convert_to_float(new_state.state)) is not None:
-            self.char_level.set_value(value)
+            self.throttle_level.async_set_value(value)
             if value > self.char_peak.value:
                 self.char_peak.set_value(value)
             co_detected = value > self.threshold_co
@@ -385,7 +497,7 @@ class CarbonMonoxideSensor(HomeAccessory):
 
 
 @TYPES.register("CarbonDioxideSensor")
-class CarbonDioxideSensor(HomeAccessory):
+class CarbonDioxideSensor(NumericSensor):
     """Generate a CarbonDioxideSensor accessory as CO2 sensor."""
 
     def __init__(self, *args: Any) -> None:
@@ -402,6 +514,7 @@ class CarbonDioxideSensor(HomeAccessory):
         _LOGGER.debug("%s: Set CO2 threshold to %d", self.entity_id, self.threshold_co2)
 
         self.char_level = serv_co2.configure_char(CHAR_CARBON_DIOXIDE_LEVEL, value=0)
+        self.throttle_level = self.add_update_throttle(self.char_level, "level")
         self.char_peak = serv_co2.configure_char(
             CHAR_CARBON_DIOXIDE_PEAK_LEVEL, value=0
         )
@@ -417,7 +530,7 @@ class CarbonDioxideSensor(HomeAccessory):
     def async_update_state(self, new_state: State) -> None:
         """Update accessory after state change."""
         if (value := convert_to_float(new_state.state)) is not None:
-            self.char_level.set_value(value)
+            self.throttle_level.async_set_value(value)
             if value > self.char_peak.value:
                 self.char_peak.set_value(value)
             co2_detected = value > self.threshold_co2
@@ -426,7 +539,7 @@ class CarbonDioxideSensor(HomeAccessory):
 
 
 @TYPES.register("LightSensor")
-class LightSensor(HomeAccessory):
+class LightSensor(NumericSensor):
     """Generate a LightSensor accessory as light sensor."""
 
     def __init__(self, *args: Any) -> None:
@@ -438,6 +551,7 @@ class LightSensor(HomeAccessory):
         self.char_light = serv_light.configure_char(
             CHAR_CURRENT_AMBIENT_LIGHT_LEVEL, value=0
         )
+        self.throttle_light = self.add_update_throttle(self.char_light, "luminance")
         # Set the state so it is in sync on initial
         # GET to avoid an event storm after homekit startup
         self.async_update_state(state)
@@ -447,14 +561,17 @@ class LightSensor(HomeAccessory):
     def async_update_state(self, new_state: State) -> None:
         """Update accessory after state change."""
         if (luminance := convert_to_float(new_state.state)) is not None:
-            self.char_light.set_value(luminance)
-            _LOGGER.debug("%s: Set to %d", self.entity_id, luminance)
+            self.throttle_light.async_set_value(luminance)
 
 
 @TYPES.register("BinarySensor")
 class BinarySensor(HomeAccessory):
     """Generate a BinarySensor accessory as binary sensor."""
 
+    relevant_attributes = frozenset(
+        {ATTR_AVAILABLE, ATTR_LOW_BATTERY, ATTR_TAMPER_DETECTED, ATTR_TAMPERED}
+    )
+
     def __init__(self, *args: Any) -> None:
         """Initialize a BinarySensor accessory object."""
         super().__init__(*args, category=CATEGORY_SENSOR)
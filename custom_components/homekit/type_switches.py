@@ -119,6 +119,8 @@ ACTIVATE_ONLY_RESET_SECONDS = 10
 class Outlet(HomeAccessory):
     """Generate an Outlet accessory."""
 
+    relevant_attributes: frozenset[str] = frozenset()
+
     def __init__(self, *args: Any) -> None:
         """Initialize an Outlet accessory object."""
         super().__init__(*args, category=CATEGORY_OUTLET)
@@ -59,6 +59,8 @@ from .const import (
     CONF_AUDIO_CODEC,
     CONF_AUDIO_MAP,
     CONF_AUDIO_PACKET_SIZE,
+    CONF_COALESCE_WINDOW,
+    CONF_DEADBAND,
     CONF_FEATURE,
     CONF_FEATURE_LIST,
     CONF_LINKED_BATTERY_CHARGING_SENSOR,
@@ -77,8 +79,11 @@ from .const import (
     CONF_MAX_FPS,
     CONF_MAX_HEIGHT,
     CONF_MAX_WIDTH,
+    CONF_MIN_INTERVAL,
+    CONF_SNAPSHOT_TTL,
     CONF_STREAM_ADDRESS,
     CONF_STREAM_COUNT,
+    CONF_STREAM_PREWARM,
     CONF_STREAM_SOURCE,
     CONF_SUPPORT_AUDIO,
     CONF_THRESHOLD_CO,
@@ -94,6 +99,7 @@ from .const import (
     DEFAULT_MAX_FPS,
     DEFAULT_MAX_HEIGHT,
     DEFAULT_MAX_WIDTH,
+    DEFAULT_SNAPSHOT_TTL,
     DEFAULT_STREAM_COUNT,
     DEFAULT_SUPPORT_AUDIO,
     DEFAULT_VIDEO_CODEC,
@@ -105,7 +111,10 @@ from .const import (
     FEATURE_PLAY_PAUSE,
     FEATURE_PLAY_STOP,
     FEATURE_TOGGLE_MUTE,
+    MAX_COALESCE_WINDOW,
     MAX_NAME_LENGTH,
+    MAX_SNAPSHOT_TTL,
+    MAX_STREAM_PREWARM,
     TYPE_AIR_PURIFIER,
     TYPE_FAN,
     TYPE_FAUCET,
@@ -206,6 +215,9 @@ BASIC_INFO_SCHEMA = vol.Schema(
         vol.Optional(
             CONF_LOW_BATTERY_THRESHOLD, default=DEFAULT_LOW_BATTERY_THRESHOLD
         ): cv.positive_int,
+        vol.Optional(CONF_COALESCE_WINDOW): vol.All(
+            vol.Coerce(float), vol.Range(min=0, max=MAX_COALESCE_WINDOW)
+        ),
     }
 )
 
@@ -223,6 +235,12 @@ CAMERA_SCHEMA = BASIC_INFO_SCHEMA.extend(
     {
         vol.Optional(CONF_STREAM_ADDRESS): vol.All(ipaddress.ip_address, cv.string),
         vol.Optional(CONF_STREAM_SOURCE): cv.string,
+        vol.Optional(CONF_STREAM_PREWARM): vol.All(
+            vol.Coerce(float), vol.Range(min=0, max=MAX_STREAM_PREWARM)
+        ),
+        vol.Optional(CONF_SNAPSHOT_TTL, default=DEFAULT_SNAPSHOT_TTL): vol.All(
+            vol.Coerce(float), vol.Range(min=0, max=MAX_SNAPSHOT_TTL)
+        ),
         vol.Optional(CONF_AUDIO_CODEC, default=DEFAULT_AUDIO_CODEC): vol.In(
             VALID_AUDIO_CODECS
         ),
@@ -356,6 +374,8 @@ SENSOR_SCHEMA = BASIC_INFO_SCHEMA.extend(
     {
         vol.Optional(CONF_THRESHOLD_CO): vol.Any(None, cv.positive_int),
         vol.Optional(CONF_THRESHOLD_CO2): vol.Any(None, cv.positive_int),
+        vol.Optional(CONF_DEADBAND): cv.positive_float,
+        vol.Optional(CONF_MIN_INTERVAL): cv.positive_float,
     }
 )
 
@@ -852,15 +872,6 @@ def _async_find_next_available_port(start_port: int, exclude_ports: set) -> int:
     raise RuntimeError("unreachable")
 
 
-def pid_is_alive(pid: int) -> bool:
-    """Check to see if a process is alive."""
-    try:
-        os.kill(pid, 0)
-    except OSError:
-        return False
-    return True
-
-
 def accessory_friendly_name(hass_name: str, accessory: Accessory) -> str:
     """Return the combined name for the accessory.
 